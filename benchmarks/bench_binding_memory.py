@@ -0,0 +1,72 @@
+"""
+Memory footprint of binding objects.
+
+Reports the number of bytes retained per binding (and per `AnnotationHint`) when many of them
+are alive at once, along with the cost of hashing a contextual binding, which happens on every
+singleton lookup.
+
+    python benchmarks/bench_binding_memory.py
+"""
+import gc
+import inspect
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from touchstone.bindings import (
+    SINGLETON,
+    AnnotationHint,
+    AutoBinding,
+    ContextualBinding,
+    SimpleBinding,
+)
+
+N = 20000
+
+
+class Abstract:
+    pass
+
+
+class Concrete(Abstract):
+    pass
+
+
+def bytes_per_object(factory: Callable[[int], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs: List[Any] = [factory(i) for i in range(N)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding the objects.
+    list_size = objs.__sizeof__()
+    return (after - before - list_size) / N
+
+
+def main() -> None:
+    parents = [type(f"Parent{i}", (), {}) for i in range(N)]
+    classes = [type(f"Auto{i}", (), {}) for i in range(N)]
+
+    results = {
+        "SimpleBinding": bytes_per_object(lambda i: SimpleBinding(classes[i], Concrete, SINGLETON)),
+        "AutoBinding": bytes_per_object(lambda i: AutoBinding(classes[i])),
+        "ContextualBinding": bytes_per_object(
+            lambda i: ContextualBinding(Abstract, Concrete, SINGLETON, parents[i], "name")
+        ),
+        "AnnotationHint": bytes_per_object(
+            lambda i: AnnotationHint(classes[i], inspect.Parameter.empty)
+        ),
+    }
+    for name, size in results.items():
+        print(f"{name:<20} {size:8.1f} bytes/object")
+
+    binding = ContextualBinding(Abstract, Concrete, SINGLETON, parents[0], "name")
+    instances = {binding: object()}
+    n = 1000000
+    elapsed = timeit.timeit(lambda: binding in instances, number=n)
+    print(f"{'lookup':<20} {elapsed / n * 1e9:8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
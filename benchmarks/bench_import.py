@@ -0,0 +1,56 @@
+"""
+Cold-start cost of importing touchstone.
+
+Runs a fresh interpreter per sample with `-X importtime` and reports the median and fastest
+cumulative import time of the `touchstone` package (including the stdlib modules it pulls in),
+and of touchstone's own modules alone.
+
+    python benchmarks/bench_import.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+from typing import Tuple
+
+SAMPLES = 50
+CODE = "import touchstone; touchstone.Container"
+
+
+def sample() -> Tuple[int, int]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODE],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    cumulative = 0
+    own = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.partition(":")[2].split("|")
+        if name.strip().split(".")[0] != "touchstone":
+            continue
+        own += int(self_us)
+        # Nested imports are indented; only top-level entries count towards the total.
+        if not name.startswith("  "):
+            cumulative += int(cumulative_us)
+    return cumulative, own
+
+
+def main() -> None:
+    results = [sample() for _ in range(SAMPLES)]
+    for label, values in (
+        ("cumulative", [r[0] for r in results]),
+        ("own", [r[1] for r in results]),
+    ):
+        median = statistics.median(values) / 1000
+        fastest = min(values) / 1000
+        print(f"{label:<12} median {median:8.2f} ms   min {fastest:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Per-call overhead of `@container.inject` on a service-layer function with two injected
+dependencies (one singleton, one auto-wired) and one explicit argument, compared to:
+
+    * direct: calling the function with every argument already built.
+    * inject, all arguments passed: the cost of the wrapper itself.
+    * make: `container.make(func, {"order_id": ...})`, which builds an auto-binding for the
+      function and resolves its parameters on every call.
+
+    python benchmarks/bench_inject.py
+"""
+import timeit
+
+from touchstone import SINGLETON, Container
+
+NUMBER = 100_000
+
+
+class Repository:
+    pass
+
+
+class Mailer:
+    pass
+
+
+def handle(order_id: int, repository: Repository, mailer: Mailer) -> int:
+    return order_id
+
+
+def main() -> None:
+    container = Container()
+    container.bind(Repository, Repository, SINGLETON)
+    injected = container.inject(handle)
+    repository, mailer = Repository(), Mailer()
+
+    for label, fn in (
+        ("direct", lambda: handle(1, repository, mailer)),
+        ("inject", lambda: injected(1)),
+        ("inject, all arguments passed", lambda: injected(1, repository, mailer)),
+        ("make", lambda: container.make(handle, {"order_id": 1})),
+    ):
+        elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=5))
+        print(f"{label:<30} {elapsed / NUMBER * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Memory footprint and access time of injected magic properties, for a class with a `__dict__`
+(`MagicProperty`), a class with an annotated slot and a slotted class caching in a weak side
+table (`SlottedMagicProperty`).
+
+Reports the bytes retained per instance once its property has been resolved, the cost of the
+first access (resolving a singleton), and the cost of later, cached, accesses.
+
+    python benchmarks/bench_magic_properties.py
+"""
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from django.conf import settings
+from touchstone import SINGLETON, Container
+
+settings.configure(TOUCHSTONE_CONTAINER_GETTER="__main__.get_container")
+
+from touchstone.django import inject_magic_properties  # noqa: E402  Needs settings
+
+N = 20000
+NUMBER = 200_000
+
+container = Container()
+
+
+def get_container() -> Container:
+    return container
+
+
+class Clock:
+    pass
+
+
+@inject_magic_properties
+class Plain:
+    clock: Clock
+
+
+@inject_magic_properties
+class WithSlot:
+    __slots__ = ("clock",)
+    clock: Clock
+
+
+@inject_magic_properties
+class WithSideTable:
+    __slots__ = ("__weakref__",)
+    clock: Clock
+
+
+def bytes_per_object(factory: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs: List[Any] = [factory() for _ in range(N)]
+    for obj in objs:
+        obj.clock
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding the objects.
+    list_size = objs.__sizeof__()
+    return (after - before - list_size) / N
+
+
+def main() -> None:
+    container.bind(Clock, Clock, SINGLETON)
+    for cls in (Plain, WithSlot, WithSideTable):
+        size = bytes_per_object(cls)
+        first = min(timeit.repeat(lambda: cls().clock, number=NUMBER // 10, repeat=5))
+        obj = cls()
+        obj.clock
+        cached = min(timeit.repeat(lambda: obj.clock, number=NUMBER, repeat=5))
+        print(
+            f"{cls.__name__:<15} {size:8.1f} bytes/instance"
+            f" {first / (NUMBER // 10) * 1e6:8.2f} us first access"
+            f" {cached / NUMBER * 1e9:8.1f} ns cached access"
+        )
+
+
+if __name__ == "__main__":
+    main()
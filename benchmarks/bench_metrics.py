@@ -0,0 +1,94 @@
+"""
+Throughput cost of `Container.enable_metrics()`: `make()` calls per second of a small graph (a
+singleton, two auto-wired services and a contextual binding) with and without the metrics
+collector, single-threaded and from several threads. Metrics are enabled and disabled on the same
+container, measurements are interleaved and the best of many runs is kept, as the difference is
+within the noise of a single run.
+
+    python benchmarks/bench_metrics.py
+"""
+import threading
+import time
+from typing import Tuple, cast
+
+from touchstone import SINGLETON, Container
+from touchstone.metrics import ResolutionMetrics
+
+NUMBER = 2_000
+THREADS = 4
+
+
+class Settings:
+    pass
+
+
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Mailer:
+    def __init__(self, settings: Settings, sender: str) -> None:
+        self.sender = sender
+
+
+class Handler:
+    def __init__(self, repository: Repository, mailer: Mailer) -> None:
+        self.repository = repository
+        self.mailer = mailer
+
+
+def build_container() -> Container:
+    container = Container()
+    container.bind(Settings, Settings, SINGLETON)
+    container.bind_contextual(
+        when=Mailer, wants=str, wants_name="sender", give=lambda: "noreply@example.com"
+    )
+    return container
+
+
+def throughput(container: Container, threads: int) -> float:
+    def work() -> None:
+        for _ in range(NUMBER):
+            container.make(Handler)
+
+    if threads == 1:
+        start = time.perf_counter()
+        work()
+        return NUMBER / (time.perf_counter() - start)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * NUMBER / (time.perf_counter() - start)
+
+
+def best_of(container: Container, threads: int, repeat: int = 30) -> Tuple[float, float]:
+    # Interleaved, so that both measurements see the same noise.
+    without = with_metrics = 0.0
+    for _ in range(repeat):
+        container.disable_metrics()
+        without = max(without, throughput(container, threads))
+        container.enable_metrics()
+        with_metrics = max(with_metrics, throughput(container, threads))
+    return without, with_metrics
+
+
+def main() -> None:
+    container = build_container()
+    for threads in (1, THREADS):
+        without, with_metrics = best_of(container, threads)
+        overhead = (1 / with_metrics - 1 / without) * 1e9
+        print(
+            f"{threads} thread(s): {without:10.0f} makes/s without metrics,"
+            f" {with_metrics:10.0f} with ({(1 - with_metrics / without) * 100:5.1f}% slower,"
+            f" {overhead:.0f} ns per make)"
+        )
+    print(cast(ResolutionMetrics, container.metrics).to_prometheus())
+
+
+if __name__ == "__main__":
+    main()
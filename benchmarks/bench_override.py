@@ -0,0 +1,77 @@
+"""
+Cost of swapping a binding for a fake, per test, in a container of layered singletons.
+
+    * rebuild: configuring a fresh container and building the whole graph again.
+    * override: `with container.override(...)` around resolving the top layer, which only
+      rebuilds the singletons depending on the overridden abstract.
+
+Each singleton takes a little work to build, like a client parsing its configuration.
+
+    python benchmarks/bench_override.py
+"""
+import timeit
+from typing import Dict, List
+
+from touchstone import SINGLETON, Container
+
+LAYERS = 6
+WIDTH = 50
+NUMBER = 20
+
+
+def build(self: object) -> None:
+    self.config = {str(i): i for i in range(200)}  # type: ignore
+
+
+def make_layers() -> List[List[type]]:
+    layers: List[List[type]] = []
+    for depth in range(LAYERS):
+        layer = []
+        for i in range(WIDTH):
+            annotations: Dict[str, type] = {}
+            if layers:
+                # Each depends on two classes of the layer below.
+                annotations = {"a": layers[-1][i], "b": layers[-1][(i + 1) % WIDTH]}
+            namespace = {"__annotations__": annotations, "__init__": build}
+            layer.append(type(f"Service{depth}_{i}", (), namespace))
+        layers.append(layer)
+    return layers
+
+
+class Fake:
+    pass
+
+
+def main() -> None:
+    layers = make_layers()
+
+    def configure() -> Container:
+        container = Container()
+        for layer in layers:
+            for cls in layer:
+                container.bind(cls, cls, SINGLETON)
+        return container
+
+    def make_top(container: Container) -> None:
+        for cls in layers[-1]:
+            container.make(cls)
+
+    def rebuild() -> None:
+        container = configure()
+        container.bind(layers[0][0], Fake)
+        make_top(container)
+
+    container = configure()
+    make_top(container)
+
+    def override() -> None:
+        with container.override(layers[0][0], Fake):
+            make_top(container)
+
+    for label, fn in (("rebuild", rebuild), ("override", override)):
+        elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=5))
+        print(f"{label:<10} {elapsed / NUMBER * 1e3:8.2f} ms/test")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Container boot time: running configuration code vs. restoring a snapshot.
+
+Generates a module with N interfaces, each with an implementation depending on the previous
+interface, then compares:
+
+    * configure: `Container()`, one `bind` and one `bind_contextual` per interface, and a first
+      resolution of every interface (which introspects every signature).
+    * snapshot: `load_snapshot()` and the same first resolutions.
+    * spec: `ContainerSpec.build()`, as in a worker process, and the same first resolutions.
+
+    python benchmarks/bench_snapshot.py
+"""
+import importlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Callable, List
+
+from touchstone import SINGLETON, Container
+from touchstone.snapshot import load_snapshot, save_snapshot
+from touchstone.spec import ContainerSpec
+
+N = 500
+REPEAT = 20
+
+
+def generate_module(directory: str) -> ModuleType:
+    lines = ["def make_name() -> str:", "    return 'name'", ""]
+    for i in range(N):
+        dep = f"dep: I{i - 1}, " if i else ""
+        lines += [
+            f"class I{i}:",
+            "    pass",
+            f"class C{i}(I{i}):",
+            f"    def __init__(self, {dep}name: str, flag: bool = False) -> None:",
+            "        pass",
+            "",
+        ]
+    with open(os.path.join(directory, "bench_snapshot_services.py"), "w") as fp:
+        fp.write("\n".join(lines))
+    sys.path.insert(0, directory)
+    return importlib.import_module("bench_snapshot_services")
+
+
+def configure(module: ModuleType) -> Container:
+    container = Container()
+    for i in range(N):
+        concrete = getattr(module, f"C{i}")
+        container.bind(getattr(module, f"I{i}"), concrete, SINGLETON)
+        container.bind_contextual(
+            when=concrete, wants=str, wants_name="name", give=module.make_name
+        )
+    return container
+
+
+def resolve_all(container: Container, module: ModuleType) -> None:
+    for i in range(N):
+        container.make(getattr(module, f"I{i}"))
+
+
+def timed(fn: Callable[[], None]) -> List[float]:
+    samples = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        module = generate_module(directory)
+        fp = io.BytesIO()
+        save_snapshot(configure(module), fp)
+        data = fp.getvalue()
+        spec = ContainerSpec.from_container(configure(module))
+
+        def from_code() -> None:
+            resolve_all(configure(module), module)
+
+        def from_snapshot() -> None:
+            resolve_all(load_snapshot(io.BytesIO(data)), module)
+
+        def from_spec() -> None:
+            resolve_all(spec.build(), module)
+
+        def load_only() -> None:
+            load_snapshot(io.BytesIO(data))
+
+        print(f"{N} bindings, snapshot size {len(data) / 1024:.1f} KiB")
+        for label, fn in (
+            ("configure + resolve", from_code),
+            ("snapshot + resolve", from_snapshot),
+            ("spec + resolve", from_spec),
+            ("snapshot load only", load_only),
+        ):
+            print(f"{label:<20} {statistics.median(timed(fn)) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Resolving an expensive, non thread-safe dependency from several threads.
+
+`Tokenizer` compiles its patterns and builds a vocabulary table in `__init__`, and keeps a
+mutable buffer, so it can't be shared between threads. Each worker thread resolves `Handler`
+(which depends on it) in a loop, with `Tokenizer` bound as:
+
+    * singleton: one instance shared by every thread (fast, but unsafe).
+    * new_every_time: a new instance per resolution (safe, but slow).
+    * thread_local: one instance per thread.
+
+    python benchmarks/bench_thread_local.py
+"""
+import re
+import statistics
+import threading
+import time
+from typing import List
+
+from touchstone import NEW_EVERY_TIME, SINGLETON, THREAD_LOCAL, Container
+
+THREADS = 8
+RESOLUTIONS = 2000
+REPEAT = 5
+
+
+class Tokenizer:
+    def __init__(self) -> None:
+        self.patterns = [re.compile(rf"[a-z]{{{i}}}\d+", re.IGNORECASE) for i in range(1, 9)]
+        self.vocabulary = {f"token{i}": i for i in range(1000)}
+        self.buffer: List[str] = []
+
+
+class Handler:
+    def __init__(self, tokenizer: Tokenizer) -> None:
+        self.tokenizer = tokenizer
+
+
+def run(lifetime_strategy: str) -> float:
+    container = Container()
+    container.bind(Tokenizer, Tokenizer, lifetime_strategy)
+    start_barrier = threading.Barrier(THREADS + 1)
+
+    def worker() -> None:
+        start_barrier.wait()
+        for _ in range(RESOLUTIONS):
+            container.make(Handler)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{THREADS} threads x {RESOLUTIONS} resolutions")
+    for lifetime_strategy in (SINGLETON, NEW_EVERY_TIME, THREAD_LOCAL):
+        elapsed = statistics.median(run(lifetime_strategy) for _ in range(REPEAT))
+        rate = THREADS * RESOLUTIONS / elapsed
+        print(f"{lifetime_strategy:<16} {elapsed * 1000:8.1f} ms {rate:12,.0f} resolutions/s")
+
+
+if __name__ == "__main__":
+    main()
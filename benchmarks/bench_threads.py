@@ -0,0 +1,94 @@
+"""
+Throughput of `Container.make` from 1 to N threads sharing one container, once its singletons are
+built and its plans compiled: each thread resolves a graph of new-every-time services depending on
+singletons, in a loop.
+
+The speedup is relative to one thread. On builds with a GIL it stays around 1: the threads take
+turns. On free-threaded builds (python3.13t and later) resolving takes no lock and writes no shared
+state once warmed up, so it should grow with the number of cores.
+
+    python benchmarks/bench_threads.py [max threads, default: CPU count]
+"""
+import os
+import sys
+import threading
+import time
+from typing import List
+
+from touchstone import SINGLETON, Container
+
+DURATION = 1.0
+
+
+class Settings:
+    pass
+
+
+class Database:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Cache:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Repository:
+    def __init__(self, database: Database, cache: Cache) -> None:
+        self.database = database
+        self.cache = cache
+
+
+class Service:
+    def __init__(self, repository: Repository, settings: Settings) -> None:
+        self.repository = repository
+        self.settings = settings
+
+
+def measure(container: Container, threads: int) -> float:
+    # Returns resolutions per second, summed over the threads.
+    barrier = threading.Barrier(threads + 1)
+    counts: List[int] = []
+
+    def work() -> None:
+        make = container.make
+        count = 0
+        barrier.wait()
+        deadline = time.perf_counter() + DURATION
+        while time.perf_counter() < deadline:
+            for _ in range(100):
+                make(Service)
+            count += 100
+        counts.append(count)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / DURATION
+
+
+def main() -> None:
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}")
+
+    container = Container()
+    for cls in (Settings, Database, Cache):
+        container.bind(cls, cls, SINGLETON)
+    container.make(Service)
+
+    # 1, 2, 4... up to max_threads
+    counts = sorted({*(2**i for i in range(max_threads.bit_length())), max_threads})
+    baseline = 0.0
+    for threads in counts:
+        throughput = measure(container, threads)
+        baseline = baseline or throughput
+        print(f"{threads:>3} threads {throughput:12,.0f} makes/s  x{throughput / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ with open(path.join(ROOTDIR, 'README.rst'), encoding='utf-8') as fp:
 
 basic_install_requires = [
     'dataclasses',
+    'contextvars; python_version < "3.7"',
 ]
 
 tests_requires = [
@@ -57,6 +58,9 @@ drf_requires = [
 celery_requires = [
     'celery == 4.*',
 ]
+celery_batches_requires = [
+    'celery-batches',
+]
 
 setup(
     name='touchstone',
@@ -78,6 +82,7 @@ setup(
         'django': django_requires,
         'djangorestframework': django_requires + drf_requires,
         'django_celery': django_requires + celery_requires,
+        'django_celery_batches': django_requires + celery_requires + celery_batches_requires,
     },
     package_data={
         'touchstone': ['py.typed'],
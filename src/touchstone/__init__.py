@@ -1,5 +1,37 @@
-from touchstone.container import NEW_EVERY_TIME, SINGLETON, Container
+import sys
+from typing import TYPE_CHECKING, Any
 
 from .version import __version__
 
-__all__ = ["__version__", "Container", "SINGLETON", "NEW_EVERY_TIME"]
+__all__ = [
+    "__version__",
+    "Container",
+    "SINGLETON",
+    "NEW_EVERY_TIME",
+    "POOLED",
+    "SCOPED",
+    "THREAD_LOCAL",
+    "SHARE",
+    "REBUILD_IN_CHILD",
+]
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    from touchstone.container import (
+        NEW_EVERY_TIME,
+        POOLED,
+        REBUILD_IN_CHILD,
+        SCOPED,
+        SHARE,
+        SINGLETON,
+        THREAD_LOCAL,
+        Container,
+    )
+else:
+
+    def __getattr__(name: str) -> Any:
+        # The container is only imported once it is actually used, to keep `import touchstone` cheap.
+        if name in __all__:
+            from touchstone import container
+
+            return getattr(container, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,22 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from touchstone import check
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m touchstone")
+    commands = parser.add_subparsers(dest="command")
+    check.add_arguments(
+        commands.add_parser("check", help="statically validate a container's dependency graph")
+    )
+    args = parser.parse_args(argv)
+    if args.command == "check":
+        return check.run(args, sys.stdout)
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
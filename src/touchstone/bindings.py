@@ -1,30 +1,99 @@
 import abc
 import builtins
+import contextlib
+import functools
 import inspect
+import sys
 import typing
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from touchstone.exceptions import BindingError, ResolutionError
 
 SINGLETON = "singleton"
 NEW_EVERY_TIME = "new_every_time"
+# Checked out of a bounded pool and returned when the scope closes, see `touchstone.pools`.
+POOLED = "pooled"
+# One instance per `Container.scope()`, e.g. per web request.
+SCOPED = "scoped"
+# One instance per thread, released when the thread dies.
+THREAD_LOCAL = "thread_local"
+
+# Fork policies: what happens to a binding's instances in a child process after `os.fork()`.
+SHARE = "share"
+REBUILD_IN_CHILD = "rebuild_in_child"
+
+# Factory kinds: how the container turns what a concrete returns into the injected value.
+PLAIN = "plain"
+COROUTINE = "coroutine"  # Awaited, see `Container.amake`.
+CONTEXT_MANAGER = "context_manager"  # Entered, and exited when its owning scope closes.
 
 TAbstract = Hashable
 TConcrete = Callable
 
-BUILTIN_TYPES = {
-    getattr(builtins, t) for t in dir(builtins) if isinstance(getattr(builtins, t), type)
-}
-TYPING_TYPES = {getattr(typing, t) for t in dir(typing) if isinstance(getattr(typing, t), type)}
+
+@functools.lru_cache(maxsize=None)
+def get_builtin_types() -> FrozenSet[type]:
+    """
+    Returns every type exposed by the `builtins` module. Built on first use rather than at import.
+    """
+    return frozenset(
+        getattr(builtins, t) for t in dir(builtins) if isinstance(getattr(builtins, t), type)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_typing_types() -> FrozenSet[type]:
+    """
+    Returns every type exposed by the `typing` module. Built on first use rather than at import.
+    """
+    types = frozenset(
+        getattr(typing, t) for t in dir(typing) if isinstance(getattr(typing, t), type)
+    )
+    # Some versions of `typing` re-export `abc.ABCMeta`, the type of every `abc.ABC` subclass.
+    return types - {abc.ABCMeta}
+
+
+if sys.version_info < (3, 7):
+    # Without module `__getattr__` (PEP 562), they are built at import time, as they used to be.
+    BUILTIN_TYPES = set(get_builtin_types())
+    TYPING_TYPES = set(get_typing_types())
+else:
+
+    def __getattr__(name: str) -> Any:
+        # `BUILTIN_TYPES` and `TYPING_TYPES` used to be sets built at import time. They are built
+        # on first access, then found in the module like any other global.
+        if name == "BUILTIN_TYPES":
+            types = get_builtin_types()
+        elif name == "TYPING_TYPES":
+            types = get_typing_types()
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = globals()[name] = set(types)
+        return value
 
 
 def is_builtin(abstract: TAbstract) -> bool:
-    return abstract in BUILTIN_TYPES
+    return abstract in get_builtin_types()
 
 
 def is_typing(abstract: TAbstract) -> bool:
-    return type(abstract) in TYPING_TYPES or abstract in TYPING_TYPES  # Needed for py37 typing.IO
+    typing_types = get_typing_types()
+    return type(abstract) in typing_types or abstract in typing_types  # Needed for py37 typing.IO
 
 
 def is_typing_classvar(obj: Any) -> bool:
@@ -34,21 +103,193 @@ def is_typing_classvar(obj: Any) -> bool:
     )
 
 
-@dataclass
+def get_annotations(concrete: Any) -> Dict[str, Any]:
+    """
+    Returns the annotations of `concrete`. For classes, these are merged along the MRO: annotations
+    of base classes and mixins are included, and a subclass re-annotating a name overrides them.
+    """
+    if not isinstance(concrete, type):
+        return dict(getattr(concrete, "__annotations__", {}))
+    annotations: Dict[str, Any] = {}
+    for cls in reversed(concrete.__mro__):
+        # Only the annotations of `cls` itself: `cls.__annotations__` may be inherited (py<3.10).
+        annotations.update(vars(cls).get("__annotations__", {}))
+    return annotations
+
+
 class AnnotationHint:
+    """
+    An annotation together with its default value (or `NO_DEFAULT_VALUE`). Immutable.
+    """
+
+    __slots__ = ("annotation", "default_value")
+
+    NO_DEFAULT_VALUE = inspect.Parameter.empty
+
     annotation: TAbstract
     default_value: Any
 
-    NO_DEFAULT_VALUE = inspect.Parameter.empty
+    def __init__(self, annotation: TAbstract, default_value: Any) -> None:
+        object.__setattr__(self, "annotation", annotation)
+        object.__setattr__(self, "default_value", default_value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("AnnotationHint is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("AnnotationHint is immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.annotation, self.default_value) == (other.annotation, other.default_value)
+
+    def __hash__(self) -> int:
+        return hash((self.annotation, self.default_value))
+
+    def __repr__(self) -> str:
+        return (
+            f"AnnotationHint(annotation={self.annotation!r}, default_value={self.default_value!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (AnnotationHint, (self.annotation, self.default_value))
 
     def has_default_value(self) -> bool:
         return self.default_value is not self.NO_DEFAULT_VALUE
 
 
+TParams = Tuple[Tuple[str, AnnotationHint], ...]
+# (name, annotation) of each attribute injected into instances of a concrete.
+TAttrs = Tuple[Tuple[str, TAbstract], ...]
+
+
+class InstanceFactory:
+    """
+    A concrete which always returns the same `instance`. Used by `Container.bind_instance` and to
+    supply default values.
+    """
+
+    __slots__ = ("instance",)
+
+    def __init__(self, instance: Any) -> None:
+        self.instance = instance
+
+    def __call__(self) -> Any:
+        return self.instance
+
+
+class Managed:
+    """
+    Marks a concrete returning a context manager (sync or async): the container injects what it
+    enters into, and exits it when the owning scope closes. Generator functions, async generator
+    functions and functions decorated with `contextlib.(async)contextmanager` don't need it.
+
+        >>> container.bind(Connection, Managed(engine.connect))
+    """
+
+    __slots__ = ("factory", "__wrapped__", "__weakref__")
+
+    def __init__(self, factory: Callable) -> None:
+        self.factory = factory
+        # Lets `inspect.signature` see the parameters of `factory`.
+        self.__wrapped__ = factory
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.factory(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"Managed({self.factory!r})"
+
+
+class _AsyncGeneratorContextManager:
+    """
+    Back-port of what `contextlib.asynccontextmanager` (Python 3.7+) returns, for Python 3.6.
+    """
+
+    def __init__(self, generator: Any) -> None:
+        self.generator = generator
+
+    async def __aenter__(self) -> Any:
+        try:
+            return await self.generator.__anext__()
+        except StopAsyncIteration:
+            raise RuntimeError("generator didn't yield") from None
+
+    async def __aexit__(self, exc_type: Any, exc: Any, traceback: Any) -> bool:
+        if exc_type is None:
+            try:
+                await self.generator.__anext__()
+            except StopAsyncIteration:
+                return False
+            raise RuntimeError("generator didn't stop")
+        if exc is None:
+            exc = exc_type()
+        try:
+            await self.generator.athrow(exc_type, exc, traceback)
+        except StopAsyncIteration as e:
+            return e is not exc
+        except BaseException as e:
+            if e is exc:
+                return False
+            raise
+        raise RuntimeError("generator didn't stop after athrow()")
+
+
+def _backport_asynccontextmanager(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def helper(*args: Any, **kwargs: Any) -> _AsyncGeneratorContextManager:
+        return _AsyncGeneratorContextManager(func(*args, **kwargs))
+
+    return helper
+
+
+if sys.version_info >= (3, 7):
+    _asynccontextmanager = contextlib.asynccontextmanager
+else:
+    _asynccontextmanager = _backport_asynccontextmanager
+
+
+def get_factory(concrete: TConcrete) -> Tuple[str, Callable]:
+    """
+    Returns the factory kind of `concrete` and the callable the container calls to build it: the
+    concrete itself, or a context manager factory wrapping a generator function.
+    """
+    kind, wrap = get_factory_plan(concrete)
+    return kind, concrete if wrap is None else wrap(concrete)
+
+
+def get_factory_plan(concrete: TConcrete) -> Tuple[str, Optional[Callable]]:
+    """
+    Returns the factory kind of `concrete` and the function wrapping it into its factory, or None
+    if it is its own factory. Unlike the factory, the plan doesn't refer to `concrete`.
+    """
+    if type(concrete) is InstanceFactory:
+        return PLAIN, None
+    if type(concrete) is Managed:
+        return CONTEXT_MANAGER, None
+    if inspect.isgeneratorfunction(concrete):
+        return CONTEXT_MANAGER, contextlib.contextmanager
+    if inspect.isasyncgenfunction(concrete):
+        return CONTEXT_MANAGER, _asynccontextmanager
+    if inspect.iscoroutinefunction(concrete):
+        return COROUTINE, None
+    wrapped = getattr(concrete, "__wrapped__", None)
+    if inspect.isgeneratorfunction(wrapped) or inspect.isasyncgenfunction(wrapped):
+        # Decorated with `contextlib.contextmanager` or `contextlib.asynccontextmanager`.
+        return CONTEXT_MANAGER, None
+    return PLAIN, None
+
+
 class AbstractBinding(abc.ABC):
+    __slots__ = ()
+
     abstract: Optional[TAbstract]
     concrete: TConcrete
     lifetime_strategy: str
+    fork_policy: str = SHARE
+    # Describes how the binding came about, for diagnostics: "simple", "auto", "contextual" or "default".
+    kind: str = "custom"
 
     @abc.abstractmethod
     def is_contextual(self) -> bool:
@@ -74,23 +315,26 @@ class AbstractBinding(abc.ABC):
 
     def get_concrete_attrs(self, instance: Any) -> Dict[str, AnnotationHint]:
         """
-        Returns a dict for the concrete's attribute annotations, that is `self.concrete.__annotations__`.
+        Returns a dict for the concrete's attribute annotations, including those of its base classes.
         Excludes ClassVar typehints and excludes annotations that exist as attributes on the concrete class itself.
         """
-        try:
-            needed_attrs = {
-                param: annotation
-                for param, annotation in self.concrete.__annotations__.items()
-                if self._is_needed_attr(param, annotation)
-            }
-            return {
-                param: AnnotationHint(
-                    annotation, getattr(instance, param, AnnotationHint.NO_DEFAULT_VALUE)
-                )
-                for param, annotation in needed_attrs.items()
-            }
-        except AttributeError:
-            return {}
+        return {
+            param: AnnotationHint(
+                annotation, getattr(instance, param, AnnotationHint.NO_DEFAULT_VALUE)
+            )
+            for param, annotation in self.get_needed_attrs()
+        }
+
+    def get_needed_attrs(self) -> TAttrs:
+        """
+        Returns the `(name, annotation)` pairs of the attributes to inject into instances of the
+        concrete, see `get_concrete_attrs`.
+        """
+        return tuple(
+            (param, annotation)
+            for param, annotation in get_annotations(self.concrete).items()
+            if self._is_needed_attr(param, annotation)
+        )
 
     def _is_needed_attr(self, param: str, annotation: TAbstract) -> bool:
         if param == "return":
@@ -102,23 +346,62 @@ class AbstractBinding(abc.ABC):
         return True
 
 
-class SimpleBinding(AbstractBinding):
-    def __init__(self, abstract: TAbstract, concrete: TConcrete, lifetime_strategy: str) -> None:
+class _FrozenBinding(AbstractBinding):
+    """
+    Base for the bindings created by `BindingResolver`. Bindings are looked up in hashed
+    containers on every resolution, so they are immutable, carry no `__dict__`, and compute
+    their hash once at construction time.
+    """
+
+    __slots__ = ("abstract", "concrete", "lifetime_strategy", "fork_policy", "_hash")
+
+    _hash: int
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _set(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class SimpleBinding(_FrozenBinding):
+    __slots__ = ()
+
+    kind = "simple"
+
+    def __init__(
+        self,
+        abstract: TAbstract,
+        concrete: TConcrete,
+        lifetime_strategy: str,
+        fork_policy: str = SHARE,
+    ) -> None:
         if is_builtin(abstract):
             raise BindingError(f"Cannot bind builtin type {abstract}")
-        self.abstract = abstract
-        self.concrete: TConcrete = concrete
-        self.lifetime_strategy = lifetime_strategy
+        self._set("abstract", abstract)
+        self._set("concrete", concrete)
+        self._set("lifetime_strategy", lifetime_strategy)
+        self._set("fork_policy", fork_policy)
+        self._set("_hash", hash((abstract, concrete, lifetime_strategy, fork_policy)))
 
     def is_contextual(self) -> bool:
         return False
 
-    def __hash__(self) -> int:
-        return hash((self.abstract, self.concrete, self.lifetime_strategy))
+    def __reduce__(self) -> Tuple[Any, ...]:
+        args = (self.abstract, self.concrete, self.lifetime_strategy, self.fork_policy)
+        return (type(self), args)
 
 
-class AutoBinding(AbstractBinding):
-    lifetime_strategy = NEW_EVERY_TIME
+class AutoBinding(_FrozenBinding):
+    __slots__ = ()
+
+    kind = "auto"
 
     def __init__(self, abstract: TAbstract) -> None:
         if (
@@ -129,17 +412,27 @@ class AutoBinding(AbstractBinding):
             or is_typing(abstract)
         ):
             raise BindingError(f"Cannot create auto-binding for type {abstract}")
-        self.abstract = abstract
-        self.concrete: TConcrete = abstract
+        self._set("abstract", abstract)
+        self._set("concrete", abstract)
+        self._set("lifetime_strategy", NEW_EVERY_TIME)
+        self._set("fork_policy", SHARE)
+        self._set("_hash", hash((abstract, abstract)))
 
     def is_contextual(self) -> bool:
         return False
 
-    def __hash__(self) -> int:
-        return hash((self.abstract, self.concrete))
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.abstract,))
 
 
-class ContextualBinding(AbstractBinding):
+class ContextualBinding(_FrozenBinding):
+    __slots__ = ("parent", "parent_name")
+
+    kind = "contextual"
+
+    parent: TConcrete
+    parent_name: Optional[str]
+
     def __init__(
         self,
         abstract: Optional[TAbstract],
@@ -147,47 +440,214 @@ class ContextualBinding(AbstractBinding):
         lifetime_strategy: str,
         parent: TConcrete,
         parent_name: Optional[str],
+        fork_policy: str = SHARE,
     ) -> None:
         if abstract is None and parent_name is None:
             raise BindingError(f"Cannot create contextual binding with no context for {parent}")
-        self.abstract = abstract
-        self.concrete: TConcrete = concrete
-        self.lifetime_strategy = lifetime_strategy
-        self.parent = parent
-        self.parent_name = parent_name
+        self._set("abstract", abstract)
+        self._set("concrete", concrete)
+        self._set("lifetime_strategy", lifetime_strategy)
+        self._set("parent", parent)
+        self._set("parent_name", parent_name)
+        self._set("fork_policy", fork_policy)
+        hash_data = (abstract, concrete, lifetime_strategy, parent, parent_name, fork_policy)
+        self._set("_hash", hash(hash_data))
 
     def is_contextual(self) -> bool:
         return True
 
-    def __hash__(self) -> int:
-        hash_data = (
+    def __reduce__(self) -> Tuple[Any, ...]:
+        args = (
             self.abstract,
             self.concrete,
             self.lifetime_strategy,
             self.parent,
             self.parent_name,
+            self.fork_policy,
         )
-        return hash(hash_data)
+        return (type(self), args)
+
+
+class DefaultValueBinding(ContextualBinding):
+    """
+    The binding used when a parameter falls back to its default value.
+    """
+
+    __slots__ = ()
+
+    kind = "default"
 
 
 TBinding = typing.Union[AutoBinding, SimpleBinding, ContextualBinding]
 
 
+class ImplementationIndex:
+    """
+    Finds the concrete (non-abstract) subclasses of classes, walking `__subclasses__()` once per
+    class. The index is worked out again when modules are imported, so classes they define are found,
+    and when it is cleared (see `BindingResolver.refresh`), e.g. after defining classes at runtime.
+    """
+
+    def __init__(self) -> None:
+        # class -> its implementations, valid while `len(sys.modules) == _modules_count`
+        self._implementations: Dict[type, Tuple[type, ...]] = {}
+        self._modules_count = len(sys.modules)
+
+    def get_implementations(self, cls: type) -> Tuple[type, ...]:
+        if len(sys.modules) != self._modules_count:
+            self.clear()
+        try:
+            return self._implementations[cls]
+        except KeyError:
+            return self._index(cls)
+
+    def clear(self) -> None:
+        self._implementations = {}
+        self._modules_count = len(sys.modules)
+
+    def _index(self, cls: type) -> Tuple[type, ...]:
+        try:
+            return self._implementations[cls]
+        except KeyError:
+            pass
+        found: List[type] = [] if inspect.isabstract(cls) else [cls]
+        subclasses: List[type] = cls.__subclasses__()
+        for subclass in subclasses:
+            for implementation in self._index(subclass):
+                if implementation not in found:  # Diamond inheritance
+                    found.append(implementation)
+        implementations = self._implementations[cls] = tuple(found)
+        return implementations
+
+
+TPlan = TypeVar("TPlan")
+_weak_ref = weakref.ref
+
+
+class ConcreteCache(Dict[Any, TPlan]):
+    """
+    What `BindingResolver` works out about each concrete, keyed by a weak reference to the
+    concrete, so that resolving per-call concretes (local classes, lambdas, `functools.partial`s...)
+    doesn't keep them alive: entries are dropped once their concrete is garbage collected. Plans
+    mustn't refer to their concrete. Concretes which don't support weak references are held
+    strongly, at most `MAX_STRONG` of them.
+
+    Hot paths look plans up with `cache[weakref.ref(concrete)]`, which raises `TypeError` for
+    concretes without weak references, before falling back to `lookup`.
+    """
+
+    MAX_STRONG = 1024
+
+    __slots__ = ("_strong", "_reapers", "_on_collect", "__weakref__")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._strong: Dict[TConcrete, TPlan] = {}
+        # Keys are the callback-less weak references Python shares between all the
+        # `weakref.ref(concrete)` calls, so lookups don't allocate one. Entries are dropped by the
+        # callback of another reference to their concrete, kept here.
+        self._reapers: Dict["weakref.ref[Any]", "weakref.ref[Any]"] = {}
+        cache_ref = weakref.ref(self)
+
+        def on_collect(key: "weakref.ref[Any]", reaper: "weakref.ref[Any]") -> None:
+            cache = cache_ref()
+            if cache is not None:
+                cache.pop(key, None)
+                cache._reapers.pop(key, None)
+
+        self._on_collect = on_collect
+
+    def lookup(self, concrete: TConcrete) -> TPlan:
+        """
+        Returns the plan of `concrete`, or raises `KeyError`.
+        """
+        try:
+            key = weakref.ref(concrete)
+        except TypeError:
+            return self._strong[concrete]
+        return self[key]
+
+    def publish(self, concrete: TConcrete, plan: TPlan) -> TPlan:
+        """
+        Stores `plan` unless another thread stored one first, and returns the one stored.
+        """
+        try:
+            key = weakref.ref(concrete)
+        except TypeError:
+            if len(self._strong) >= self.MAX_STRONG:
+                self._strong.clear()
+            return self._strong.setdefault(concrete, plan)
+        plan = self.setdefault(key, plan)
+        if key not in self._reapers:
+            reaper = weakref.ref(concrete, functools.partial(self._on_collect, key))
+            self._reapers.setdefault(key, reaper)
+        return plan
+
+    def discard(self, concrete: TConcrete) -> None:
+        try:
+            key = weakref.ref(concrete)
+        except TypeError:
+            self._strong.pop(concrete, None)
+        else:
+            self.pop(key, None)
+            self._reapers.pop(key, None)
+
+    def clear(self) -> None:
+        super().clear()
+        self._strong.clear()
+        self._reapers.clear()
+
+    def plans(self) -> Dict[TConcrete, TPlan]:
+        """
+        Returns the plans of the live concretes.
+        """
+        plans = {key(): plan for key, plan in self.copy().items()}
+        plans.pop(None, None)
+        plans.update(self._strong)
+        return plans
+
+
 class BindingResolver:
     def __init__(self) -> None:
         self._bindings: Dict[TAbstract, TBinding] = {}
         self._contextual_bindings: Dict[
             Tuple[Optional[TAbstract], TAbstract, Optional[str]], ContextualBinding
         ] = {}
+        # What is worked out about each concrete: its signature, the kind of its factory (see
+        # `get_factory_plan`) and the attributes to inject into its instances.
+        self._signatures: ConcreteCache[TParams] = ConcreteCache()
+        self._factories: ConcreteCache[Tuple[str, Optional[Callable]]] = ConcreteCache()
+        self._attrs: ConcreteCache[TAttrs] = ConcreteCache()
+        # Kind ("signature", "attrs", "inject", ...) -> how many plans were worked out.
+        self.compilations: Dict[str, int] = {}
+        # When set, unbound abstract classes resolve to their sole implementation.
+        self.implementations: Optional[ImplementationIndex] = None
+        # Incremented whenever a binding is added or replaced, so that bindings resolved ahead of
+        # time (e.g. by `MagicProperty`) can tell when they are stale.
+        self.version = 0
+        # binding -> the abstracts it transitively depends on, and the reverse index, valid for
+        # `_index_version`. See `get_dependents`.
+        self._dependencies: Dict[TBinding, FrozenSet[TAbstract]] = {}
+        self._dependents: Dict[TAbstract, Set[TBinding]] = {}
+        self._index_version = 0
 
     def bind(
-        self, abstract: TAbstract, concrete: TConcrete, lifetime_strategy: str = NEW_EVERY_TIME
+        self,
+        abstract: TAbstract,
+        concrete: TConcrete,
+        lifetime_strategy: str = NEW_EVERY_TIME,
+        fork_policy: str = SHARE,
     ) -> None:
         """
         Bind an `abstract` (an annotation) to a `concrete` (something which returns objects fulfilling that annotation).
         If `lifetime_strategy` is set to `SINGLETON` then only one instance of the concrete implementation will be used.
         """
-        self._bindings[abstract] = SimpleBinding(abstract, concrete, lifetime_strategy)
+        self._bindings[abstract] = SimpleBinding(abstract, concrete, lifetime_strategy, fork_policy)
+        # A class being bound may have been modified (or defined) since it was last resolved.
+        self._attrs.discard(concrete)
+        if self.implementations is not None:
+            self.implementations.clear()
+        self.version += 1
 
     def bind_contextual(
         self,
@@ -197,6 +657,7 @@ class BindingResolver:
         wants_name: Optional[str] = None,
         give: TConcrete,
         lifetime_strategy: str = NEW_EVERY_TIME,
+        fork_policy: str = SHARE,
     ) -> None:
         """
         Used to create a *contextual* binding. This is used when you want to customize a specific class either by the
@@ -212,7 +673,40 @@ class BindingResolver:
             lifetime_strategy=lifetime_strategy,
             parent=parent,
             parent_name=parent_name,
+            fork_policy=fork_policy,
         )
+        self.version += 1
+
+    @contextlib.contextmanager
+    def override(
+        self,
+        abstract: TAbstract,
+        concrete: TConcrete,
+        lifetime_strategy: str = NEW_EVERY_TIME,
+        fork_policy: str = SHARE,
+    ) -> Iterator[TBinding]:
+        """
+        Binds `abstract` to `concrete` until the `with` block exits, then restores its previous
+        binding, if any. Yields the overriding binding. See `Container.override`.
+        """
+        previous = self._bindings.get(abstract)
+        version = self.version
+        index = (self._dependencies, self._dependents)
+        index_valid = self._index_version == version
+        self.bind(abstract, concrete, lifetime_strategy, fork_policy)
+        try:
+            yield self._bindings[abstract]
+        finally:
+            unchanged = self.version == version + 1
+            if previous is None:
+                self._bindings.pop(abstract, None)
+            else:
+                self._bindings[abstract] = previous
+            self.version += 1
+            if index_valid and unchanged:
+                # The bindings are back to what the index was built from.
+                self._dependencies, self._dependents = index
+                self._index_version = self.version
 
     def resolve_binding(
         self,
@@ -235,9 +729,205 @@ class BindingResolver:
 
         return self.make_auto_binding(abstract, name, parent)
 
+    def get_params(self, binding: TBinding) -> TParams:
+        """
+        Returns the `(name, hint)` pairs of the parameters of `binding.concrete`. The signature of
+        each concrete is only introspected once.
+        """
+        concrete = binding.concrete
+        if type(concrete) is InstanceFactory:
+            return ()
+        try:
+            return self._signatures[_weak_ref(concrete)]
+        except (KeyError, TypeError):
+            try:
+                return self._signatures.lookup(concrete)
+            except KeyError:
+                pass
+        params = tuple(binding.get_concrete_params().items())
+        self.count_compilation("signature")
+        # Plans are immutable and published once: threads compiling the same concrete at the
+        # same time all use the first one published.
+        return self._signatures.publish(concrete, params)
+
+    def get_attrs(self, binding: TBinding) -> TAttrs:
+        """
+        Returns the `(name, annotation)` pairs of the attributes to inject into instances of
+        `binding.concrete`, see `AbstractBinding.get_concrete_attrs`. They are worked out once per
+        concrete: call `refresh` after modifying a class at runtime.
+        """
+        concrete = binding.concrete
+        if type(concrete) is InstanceFactory:
+            return ()
+        try:
+            return self._attrs[_weak_ref(concrete)]
+        except (KeyError, TypeError):
+            try:
+                return self._attrs.lookup(concrete)
+            except KeyError:
+                pass
+        attrs = binding.get_needed_attrs()
+        self.count_compilation("attrs")
+        return self._attrs.publish(concrete, attrs)
+
+    def refresh(self, concrete: Optional[TConcrete] = None) -> None:
+        """
+        Forgets the signature, attributes and factory worked out for `concrete` (by default, for
+        every concrete), and the implementations of abstract classes, so that they're worked out
+        again on next use. Needed after modifying or defining a class at runtime, e.g. adding or
+        removing annotations or class attributes.
+        """
+        if self.implementations is not None:
+            self.implementations.clear()
+        if concrete is None:
+            self._signatures.clear()
+            self._attrs.clear()
+            self._factories.clear()
+        else:
+            self._signatures.discard(concrete)
+            self._attrs.discard(concrete)
+            self._factories.discard(concrete)
+        self.version += 1
+
+    def get_dependencies(self, binding: TBinding) -> FrozenSet[TAbstract]:
+        """
+        Returns the abstracts which resolving `binding` looks up in the binding table, directly or
+        through its dependencies, worked out statically from the parameters and attributes of the
+        concretes. Abstracts resolved by a contextual binding or a default value aren't included.
+        The result is cached until the bindings change.
+        """
+        if self._index_version != self.version:
+            self._dependencies = {}
+            self._dependents = {}
+            self._index_version = self.version
+        try:
+            return self._dependencies[binding]
+        except KeyError:
+            pass
+        # A placeholder, so that dependency cycles terminate.
+        self._dependencies[binding] = frozenset()
+        try:
+            hints = [
+                (name, hint.annotation, hint.default_value)
+                for name, hint in self.get_params(binding)
+            ]
+            for name, annotation in self.get_attrs(binding):
+                hints.append((name, annotation, AnnotationHint.NO_DEFAULT_VALUE))
+        except (TypeError, ValueError):  # No signature available
+            hints = []
+        dependencies: Set[TAbstract] = set()
+        for name, abstract, default_value in hints:
+            try:
+                child = self.resolve_binding(abstract, binding.concrete, name, default_value)
+            except ResolutionError:
+                dependencies.add(abstract)
+                continue
+            if not isinstance(child, ContextualBinding):
+                dependencies.add(abstract)
+            dependencies.update(self.get_dependencies(child))
+        result = self._dependencies[binding] = frozenset(dependencies)
+        for abstract in result:
+            self._dependents.setdefault(abstract, set()).add(binding)
+        return result
+
+    def get_dependents(self, abstract: TAbstract, bindings: Iterable[TBinding]) -> Set[TBinding]:
+        """
+        Returns those of `bindings` which transitively depend on `abstract`, see
+        `get_dependencies`. The bindings are indexed on first use, and the index is reused until
+        the bindings change.
+        """
+        candidates = set(bindings)
+        for binding in candidates:
+            self.get_dependencies(binding)
+        return self._dependents.get(abstract, set()) & candidates
+
+    def count_compilation(self, kind: str) -> None:
+        """
+        Records that a plan of `kind` was worked out, for `touchstone.metrics`.
+        """
+        self.compilations[kind] = self.compilations.get(kind, 0) + 1
+
+    def get_factory(self, binding: TBinding) -> Tuple[str, Callable]:
+        """
+        Returns the factory kind of `binding.concrete` and the callable to build it with, see
+        `get_factory`. Each concrete is only inspected once.
+        """
+        concrete = binding.concrete
+        if type(concrete) is InstanceFactory:
+            # Not cached: default values get a new one on every resolution.
+            return PLAIN, concrete
+        try:
+            kind, wrap = self._factories[_weak_ref(concrete)]
+        except (KeyError, TypeError):
+            try:
+                kind, wrap = self._factories.lookup(concrete)
+            except KeyError:
+                kind, wrap = self._factories.publish(concrete, get_factory_plan(concrete))
+        return kind, concrete if wrap is None else wrap(concrete)
+
+    def get_bindings(self) -> List[TBinding]:
+        """
+        Returns every registered binding, contextual or not.
+        """
+        return [*self._bindings.values(), *self._contextual_bindings.values()]
+
+    def compile(self, roots: Iterable[TAbstract] = ()) -> None:
+        """
+        Introspects, ahead of time, the signature of every bound concrete, of each abstract in
+        `roots`, and of everything they transitively depend on.
+        """
+        stack = self.get_bindings()
+        for root in roots:
+            stack.append(self.resolve_binding(root))
+        seen = set()
+        while stack:
+            binding = stack.pop()
+            if binding.concrete in seen:
+                continue
+            seen.add(binding.concrete)
+            try:
+                params = self.get_params(binding)
+            except (TypeError, ValueError):  # No signature available
+                continue
+            for name, hint in params:
+                try:
+                    stack.append(
+                        self.resolve_binding(
+                            hint.annotation, binding.concrete, name, hint.default_value
+                        )
+                    )
+                except ResolutionError:
+                    continue
+
+    def dump_state(self) -> Dict[str, Any]:
+        """
+        Returns the binding tables and cached signatures. See `touchstone.snapshot`.
+        """
+        return {
+            "bindings": dict(self._bindings),
+            "contextual_bindings": dict(self._contextual_bindings),
+            "signatures": self._signatures.plans(),
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """
+        Adds the binding tables and cached signatures of a `dump_state()` to this resolver.
+        """
+        self._bindings.update(state["bindings"])
+        self._contextual_bindings.update(state["contextual_bindings"])
+        for concrete, params in state["signatures"].items():
+            self._signatures.publish(concrete, params)
+        self.version += 1
+
     def make_auto_binding(
         self, abstract: TAbstract, name: Optional[str], parent: Optional[TConcrete] = None
     ) -> TBinding:
+        if (
+            self.implementations is not None
+            and isinstance(abstract, type)
+            and inspect.isabstract(abstract)
+        ):
+            return self._make_implementation_binding(abstract, name, parent)
         try:
             return AutoBinding(abstract)
         except BindingError as e:
@@ -248,15 +938,35 @@ class BindingResolver:
                     f"Can't resolve {name}: {abstract}, which is required by {parent}"
                 ) from e
 
+    def _make_implementation_binding(
+        self, abstract: type, name: Optional[str], parent: Optional[TConcrete]
+    ) -> TBinding:
+        implementations = cast(ImplementationIndex, self.implementations).get_implementations(
+            abstract
+        )
+        if len(implementations) == 1:
+            # Bound implementations keep their lifetime and factory.
+            return self.resolve_binding(implementations[0])
+        required_by = "" if parent is None else f", which is required by {parent}"
+        if not implementations:
+            raise ResolutionError(
+                f"Can't resolve {name}: {abstract}{required_by}. It is abstract and has no "
+                f"concrete subclass"
+            )
+        raise ResolutionError(
+            f"Can't resolve {name}: {abstract}{required_by}. It has several concrete subclasses "
+            f"({', '.join(cls.__qualname__ for cls in implementations)}): bind one of them"
+        )
+
     def _resolve_default_value_binding(
         self, abstract: TAbstract, parent: TConcrete, name: Optional[str], default_value: Any
     ) -> Optional[TBinding]:
         if default_value is AnnotationHint.NO_DEFAULT_VALUE:
             return None
 
-        return ContextualBinding(
+        return DefaultValueBinding(
             abstract=abstract,
-            concrete=lambda: default_value,
+            concrete=InstanceFactory(default_value),
             lifetime_strategy=NEW_EVERY_TIME,
             parent=parent,
             parent_name=name,
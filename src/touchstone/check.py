@@ -0,0 +1,172 @@
+"""
+Offline validation of a container's dependency graph, without instantiating anything.
+
+    $ python -m touchstone check myapp.container.get_container --root myapp.views.App
+
+The container getter is given in the same dotted-path form as Django's `TOUCHSTONE_CONTAINER_GETTER`.
+Every binding, the `when` class of every contextual binding and every `--root` is resolved
+statically, and the following are reported:
+
+    * errors: parameters and attributes which can't be resolved, and dependency cycles.
+    * warnings: lifetime mismatches, where a singleton holds on to something shorter lived, or a
+      singleton shared across forks holds on to one rebuilt in each child process.
+    * the resolution cost of each root: how many objects one `make` builds, and how deep it goes.
+
+The exit status is 1 if there are errors (or warnings, with `--strict`) and 0 otherwise.
+"""
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, TextIO
+
+from touchstone.bindings import (
+    NEW_EVERY_TIME,
+    POOLED,
+    REBUILD_IN_CHILD,
+    SCOPED,
+    SHARE,
+    SINGLETON,
+    THREAD_LOCAL,
+    AutoBinding,
+    ContextualBinding,
+    TAbstract,
+)
+from touchstone.container import Container
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.graph import DependencyGraph, GraphEdge, GraphWalker
+from touchstone.utils import import_string
+
+# Lifetimes which a singleton shouldn't capture: it would keep the first instance forever.
+SHORT_LIVED_LIFETIMES = {NEW_EVERY_TIME, POOLED, SCOPED, THREAD_LOCAL}
+
+
+@dataclass
+class RootCost:
+    root: str
+    nodes: int
+    builds: int
+    depth: int
+
+
+@dataclass
+class CheckReport:
+    bindings: int = 0
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    roots: List[RootCost] = field(default_factory=list)
+    duration: float = 0.0
+
+    def write(self, out: TextIO) -> None:
+        for error in self.errors:
+            out.write(f"ERROR {error}\n")
+        for warning in self.warnings:
+            out.write(f"WARNING {warning}\n")
+        for cost in self.roots:
+            out.write(
+                f"ROOT {cost.root}: builds {cost.builds} objects from {cost.nodes} bindings,"
+                f" depth {cost.depth}\n"
+            )
+        out.write(
+            f"Checked {self.bindings} bindings and {len(self.roots)} roots in"
+            f" {self.duration:.3f}s: {len(self.errors)} errors, {len(self.warnings)} warnings\n"
+        )
+
+
+def check_container(container: Container, roots: Sequence[TAbstract] = ()) -> CheckReport:
+    """
+    Statically resolves every binding of `container`, the `when` class of its contextual bindings
+    and `roots`, and reports problems. See the module documentation.
+    """
+    start = time.perf_counter()
+    report = CheckReport()
+    walker = GraphWalker(container)
+
+    bindings = container.bindings.get_bindings()
+    report.bindings = len(bindings)
+    for binding in bindings:
+        walker.visit(binding)
+        if isinstance(binding, ContextualBinding):
+            try:
+                walker.visit(AutoBinding(binding.parent))
+            except BindingError:
+                report.errors.append(f"contextual binding target {binding.parent} can't be built")
+
+    root_nodes = []
+    for root in roots:
+        try:
+            root_nodes.append(walker.visit(container.bindings.resolve_binding(root)))
+        except ResolutionError as e:
+            report.errors.append(f"unresolvable root: {e}")
+
+    graph = walker.graph
+    report.errors.extend(graph_errors(graph))
+    for edge in graph.edges:
+        if not edge.cycle:
+            mismatch = _lifetime_mismatch(graph, edge)
+            if mismatch:
+                report.warnings.append(f"lifetime mismatch: {mismatch}")
+
+    for node in root_nodes:
+        builds = graph.estimate_builds(node.id)
+        report.roots.append(
+            RootCost(
+                root=node.label,
+                nodes=len(builds),
+                builds=sum(builds.values()),
+                depth=len(graph.critical_path(node.id)),
+            )
+        )
+
+    report.duration = time.perf_counter() - start
+    return report
+
+
+def graph_errors(graph: DependencyGraph) -> List[str]:
+    """
+    Returns the unresolvable dependencies and the dependency cycles of `graph`.
+    """
+    errors = [f"unresolvable: {error}" for error in graph.errors]
+    errors.extend(f"cycle: {_describe_edge(graph, edge)}" for edge in graph.edges if edge.cycle)
+    return errors
+
+
+def _lifetime_mismatch(graph: DependencyGraph, edge: GraphEdge) -> Optional[str]:
+    parent = graph.nodes[edge.parent]
+    child = graph.nodes[edge.child]
+    if parent.lifetime != SINGLETON:
+        return None
+    if child.lifetime in SHORT_LIVED_LIFETIMES and child.kind not in ("auto", "default"):
+        return f"{_describe_edge(graph, edge)}: a {SINGLETON} depends on a {child.lifetime}"
+    if parent.fork_policy == SHARE and child.fork_policy == REBUILD_IN_CHILD:
+        return (
+            f"{_describe_edge(graph, edge)}: a singleton shared across forks depends on one"
+            f" rebuilt in each child"
+        )
+    return None
+
+
+def _describe_edge(graph: DependencyGraph, edge: GraphEdge) -> str:
+    return f"{graph.nodes[edge.parent].label} -> {graph.nodes[edge.child].label} ({edge.name})"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "container_getter",
+        help="dotted path to a callable returning the container, e.g. myapp.container.get_container",
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        dest="roots",
+        help="dotted path to an abstract to resolve and report the cost of; can be repeated",
+    )
+    parser.add_argument("--strict", action="store_true", help="exit with 1 on warnings too")
+
+
+def run(args: argparse.Namespace, out: TextIO) -> int:
+    container = import_string(args.container_getter)()
+    roots = [import_string(root) for root in args.roots]
+    report = check_container(container, roots)
+    report.write(out)
+    return 1 if report.errors or (args.strict and report.warnings) else 0
@@ -1,23 +1,74 @@
 import abc
-from typing import Any, Dict, Optional, Type
+import contextlib
+import functools
+import gc
+import inspect
+import os
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Tuple, Type, cast
 
-from touchstone.bindings import (
+from touchstone.bindings import (  # noqa: F401  Re-exports SCOPED and THREAD_LOCAL
+    COROUTINE,
     NEW_EVERY_TIME,
+    PLAIN,
+    POOLED,
+    REBUILD_IN_CHILD,
+    SCOPED,
+    SHARE,
     SINGLETON,
+    THREAD_LOCAL,
     AnnotationHint,
     BindingResolver,
+    ImplementationIndex,
+    InstanceFactory,
     TAbstract,
     TBinding,
     TConcrete,
 )
-from touchstone.exceptions import ResolutionError
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.injection import InjectionPlan
+from touchstone.lifetimes import (
+    MISSING,
+    LifetimeStrategy,
+    PooledLifetime,
+    SingletonLifetime,
+    get_lifetime_strategy_factory,
+)
+from touchstone.pools import InstancePool
+from touchstone.scopes import Scope, get_current_scope
+
+if TYPE_CHECKING:  # pragma: no cover
+    from touchstone.metrics import ResolutionMetrics
 
 KwargsDict = Dict[str, Any]
 
 
+class ResolutionObserver:
+    """
+    Receives a callback around every binding a `Container` resolves, including singleton cache hits and
+    the resolution of nested dependencies. See `Container.add_observer`. Override the methods you need.
+    """
+
+    def resolution_started(self, binding: TBinding, cache_hit: bool) -> None:
+        pass
+
+    def resolution_finished(self, binding: TBinding, instance: Any) -> None:
+        pass
+
+    def resolution_failed(self, binding: TBinding, error: BaseException) -> None:
+        pass
+
+
 class AbstractContainer(abc.ABC):
     @abc.abstractmethod
-    def bind(self, abstract: TAbstract, concrete: TConcrete, lifetime_strategy: str) -> None:
+    def bind(
+        self,
+        abstract: TAbstract,
+        concrete: TConcrete,
+        lifetime_strategy: str,
+        fork_policy: str = SHARE,
+    ) -> None:
         pass
 
     @abc.abstractmethod
@@ -33,6 +84,7 @@ class AbstractContainer(abc.ABC):
         wants_name: Optional[str] = None,
         give: TConcrete,
         lifetime_strategy: str = NEW_EVERY_TIME,
+        fork_policy: str = SHARE,
     ) -> None:
         pass
 
@@ -58,21 +110,80 @@ class Container(AbstractContainer):
         * Any class
         * A lambda or function which acts as a factory function
         * A classmethod acting as a factory function
+        * A generator function, or a context manager factory, managing the lifetime of a resource: the yielded
+          value is injected, and the rest runs when the owning scope or the container closes. See `scope`.
+        * A coroutine function or an async generator function, resolved with `amake`
+
+    With `resolve_implementations=True`, an abstract class which isn't bound resolves to its concrete subclass,
+    provided it has exactly one. Subclasses are indexed once, and again when modules are imported or on `refresh`,
+    see `ImplementationIndex`.
     """
 
-    def __init__(self, biding_resolver_cls: Type[BindingResolver] = BindingResolver) -> None:
-        self._instances: Dict[TBinding, Any] = {}
+    def __init__(
+        self,
+        biding_resolver_cls: Type[BindingResolver] = BindingResolver,
+        resolve_implementations: bool = False,
+    ) -> None:
+        # Lifetime strategy name -> this container's instance of the strategy. See `get_lifetime`.
+        self._lifetimes: Dict[str, LifetimeStrategy] = {}
+        self._observers: Tuple[ResolutionObserver, ...] = ()
+        self.metrics: "Optional[ResolutionMetrics]" = None
+        self._root_scope = Scope(self)
+        self.get_lifetime(NEW_EVERY_TIME)
         self.bindings = biding_resolver_cls()
+        if resolve_implementations:
+            self.bindings.implementations = ImplementationIndex()
         self.bind_instance(Container, self)
+        _containers.add(self)
 
     def bind(
-        self, abstract: TAbstract, concrete: TConcrete, lifetime_strategy: str = NEW_EVERY_TIME
+        self,
+        abstract: TAbstract,
+        concrete: TConcrete,
+        lifetime_strategy: str = NEW_EVERY_TIME,
+        fork_policy: str = SHARE,
+        pool: Optional[InstancePool] = None,
     ) -> None:
         """
         Bind an `abstract` (an annotation) to a `concrete` (something which returns objects fulfilling that annotation).
         If `lifetime_strategy` is set to `SINGLETON` then only one instance of the concrete implementation will be used.
+
+        If `lifetime_strategy` is set to `SCOPED`, one instance is shared within each `scope()`, e.g. a web request.
+        If it is set to `THREAD_LOCAL`, each thread gets its own instance, released when the thread
+        dies. If it is set to `POOLED`, instances are checked out of `pool` (by default an `InstancePool()`) on
+        resolution and returned to it when the surrounding scope closes. See `touchstone.pools`.
+
+        `fork_policy` controls what a child process does with the singleton after `os.fork()`: with `SHARE` the
+        child keeps using the instance built by the parent, with `REBUILD_IN_CHILD` the child builds its own. Use
+        `REBUILD_IN_CHILD` for anything holding sockets, file descriptors, locks or threads (DB pools, clients...).
+        """
+        lifetime = self.get_lifetime(lifetime_strategy)
+        if pool is not None and not isinstance(lifetime, PooledLifetime):
+            raise BindingError(f"A pool was given for {abstract}, which isn't {POOLED}")
+        self.bindings.bind(abstract, concrete, lifetime_strategy, fork_policy)
+        if pool is not None:
+            cast(PooledLifetime, lifetime).pools[self.bindings.resolve_binding(abstract)] = pool
+
+    def get_pool(self, abstract: TAbstract) -> InstancePool:
+        """
+        Returns the pool of the `POOLED` binding of `abstract`, e.g. to look at its `stats()`.
+        """
+        binding = self.bindings.resolve_binding(abstract)
+        lifetime = self.get_lifetime(binding.lifetime_strategy)
+        if not isinstance(lifetime, PooledLifetime):
+            raise ResolutionError(f"{abstract} isn't {POOLED}")
+        return lifetime.get_pool(binding)
+
+    def get_lifetime(self, lifetime_strategy: str) -> LifetimeStrategy:
+        """
+        Returns this container's instance of the strategy named `lifetime_strategy`, creating it on first use.
+        Raises `BindingError` for unknown names. See `touchstone.lifetimes`.
         """
-        self.bindings.bind(abstract, concrete, lifetime_strategy)
+        try:
+            return self._lifetimes[lifetime_strategy]
+        except KeyError:
+            factory = get_lifetime_strategy_factory(lifetime_strategy)
+            return self._lifetimes.setdefault(lifetime_strategy, factory(self))
 
     def bind_instance(self, abstract: TAbstract, instance: Any) -> None:
         """
@@ -81,7 +192,8 @@ class Container(AbstractContainer):
         If you have a method that returns a valid instance of the object, then use `bind` with
         `lifetime_strategy=SINGLETON` instead.
         """
-        self.bindings.bind(abstract, lambda: instance, SINGLETON)
+        self.get_lifetime(SINGLETON)
+        self.bindings.bind(abstract, InstanceFactory(instance), SINGLETON)
 
     def bind_contextual(
         self,
@@ -91,19 +203,150 @@ class Container(AbstractContainer):
         wants_name: Optional[str] = None,
         give: TConcrete,
         lifetime_strategy: str = NEW_EVERY_TIME,
+        fork_policy: str = SHARE,
     ) -> None:
         """
         Used to create a *contextual* binding. This is used when you want to customize a specific class either by the
         `abstract` (annotation) it needs, or by the name of an `__init__` kwarg.
         """
+        self.get_lifetime(lifetime_strategy)
         self.bindings.bind_contextual(
             when=when,
             wants=wants,
             wants_name=wants_name,
             give=give,
             lifetime_strategy=lifetime_strategy,
+            fork_policy=fork_policy,
         )
 
+    @contextlib.contextmanager
+    def override(
+        self, abstract: TAbstract, concrete: TConcrete, lifetime_strategy: str = NEW_EVERY_TIME
+    ) -> Iterator[None]:
+        """
+        Binds `abstract` to `concrete` for the duration of the `with` block, e.g. to swap in a fake in a test
+        without rebuilding the container:
+
+            >>> with container.override(Mailer, FakeMailer):
+            >>>     container.make(SignupService).signup("jane@example.com")
+
+        The cached singletons which depend on `abstract`, directly or not, are evicted so that they are rebuilt
+        with the override, and restored on exit along with the previous binding. Other singletons are kept. They
+        are found with `BindingResolver.get_dependents`, from an index reused across overrides. Not thread-safe.
+        """
+        self.get_lifetime(lifetime_strategy)
+        singletons = cast(SingletonLifetime, self.get_lifetime(SINGLETON)).instances
+        candidates = [b for b in self.bindings.get_bindings() if b.lifetime_strategy == SINGLETON]
+        candidates.extend(singletons)
+        dependents = self.bindings.get_dependents(abstract, candidates)
+        evicted = {
+            binding: singletons.pop(binding) for binding in dependents if binding in singletons
+        }
+        with self.bindings.override(abstract, concrete, lifetime_strategy) as binding:
+            try:
+                yield
+            finally:
+                for built in (binding, *dependents):
+                    singletons.pop(built, None)
+                singletons.update(evicted)
+
+    def prepare_for_fork(self, freeze_gc: bool = True) -> None:
+        """
+        Builds every `SINGLETON` binding with the `SHARE` fork policy, so that processes forked afterwards
+        (e.g. gunicorn workers with `--preload`) inherit them copy-on-write instead of each building their own.
+
+        If `freeze_gc` is set, `gc.freeze()` is called afterwards (Python 3.7+) so that garbage collections in the
+        children don't write to, and thereby copy, the shared objects' memory pages.
+
+        Singletons with the `REBUILD_IN_CHILD` fork policy are discarded in child processes, see `after_fork_in_child`.
+        Note that a shared singleton which depends on one of them keeps the parent's instance.
+        """
+        for binding in self.bindings.get_bindings():
+            if binding.lifetime_strategy == SINGLETON and binding.fork_policy == SHARE:
+                self._make_binding(binding, {})
+        if freeze_gc and hasattr(gc, "freeze"):
+            gc.freeze()
+
+    def after_fork_in_child(self) -> None:
+        """
+        Discards the instances of bindings with the `REBUILD_IN_CHILD` fork policy, so they are built again on next
+        use. Called automatically in child processes after `os.fork()` on Python 3.7+.
+        """
+        for lifetime in self._lifetimes.values():
+            lifetime.after_fork_in_child()
+        # Their resources belong to the parent process, which tears them down.
+        self._root_scope.forget(lambda binding: binding.fork_policy == REBUILD_IN_CHILD)
+
+    def scope(self) -> Scope:
+        """
+        Returns a new scope, to use as a context manager (`with` or `async with`). Resources built while it is open
+        are torn down when it closes, in reverse order of construction, except for those of `SINGLETON` bindings
+        which belong to the container. Scopes follow threads and asyncio tasks, and can be nested.
+        """
+        return Scope(self)
+
+    def close(self) -> None:
+        """
+        Tears down the resources owned by the container, those of `SINGLETON` (and other scope-outliving)
+        bindings, in reverse order of construction. Singletons are forgotten, so the container can still be used.
+        Raises `ResolutionError` without tearing anything down if some resources are asynchronous: use `aclose`.
+        """
+        scope = self._root_scope
+        try:
+            scope.close()
+        finally:
+            if scope.closed:
+                self._root_scope = Scope(self)
+                for lifetime in self._lifetimes.values():
+                    lifetime.clear()
+
+    async def aclose(self) -> None:
+        """
+        Like `close`, but also tears down asynchronous resources.
+        """
+        scope, self._root_scope = self._root_scope, Scope(self)
+        for lifetime in self._lifetimes.values():
+            lifetime.clear()
+        await scope.aclose()
+
+    def add_observer(self, observer: ResolutionObserver) -> None:
+        """
+        Starts notifying `observer` of every resolution. Resolution only pays for observers while some are added.
+        """
+        self._observers = (*self._observers, observer)
+
+    def remove_observer(self, observer: ResolutionObserver) -> None:
+        self._observers = tuple(o for o in self._observers if o is not observer)
+
+    def refresh(self, concrete: Optional[TConcrete] = None) -> None:
+        """
+        Forgets what was worked out about `concrete` (by default, every concrete): call it after
+        modifying or defining a class at runtime. See `BindingResolver.refresh`.
+        """
+        self.bindings.refresh(concrete)
+
+    def enable_metrics(self) -> "ResolutionMetrics":
+        """
+        Starts collecting aggregate resolution metrics, see `touchstone.metrics`. Returns the collector,
+        also available as `metrics`. Calling it again returns the same collector.
+        """
+        if self.metrics is None:
+            from touchstone.metrics import CountingSingletonLifetime, ResolutionMetrics
+
+            self.metrics = ResolutionMetrics(self)
+            self._swap_singleton_lifetime(CountingSingletonLifetime(self, self.metrics))
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        if self.metrics is not None:
+            self.metrics = None
+            self._swap_singleton_lifetime(SingletonLifetime(self))
+
+    def _swap_singleton_lifetime(self, lifetime: SingletonLifetime) -> None:
+        # Only while metrics are enabled do singleton lookups pay for counting.
+        lifetime.instances = cast(SingletonLifetime, self.get_lifetime(SINGLETON)).instances
+        self._lifetimes[SINGLETON] = lifetime
+
     def make(self, abstract: TAbstract, init_kwargs: Optional[KwargsDict] = None) -> Any:
         """
         Make an instance of `abstract` and return it, obeying registered binding rules.
@@ -117,7 +360,72 @@ class Container(AbstractContainer):
         """
         if init_kwargs is None:
             init_kwargs = {}
-        return self._make(abstract, init_kwargs, None, None, AnnotationHint.NO_DEFAULT_VALUE)
+        if self.metrics is None:
+            return self._make(abstract, init_kwargs, None, None, AnnotationHint.NO_DEFAULT_VALUE)
+        start = time.perf_counter()
+        try:
+            return self._make(abstract, init_kwargs, None, None, AnnotationHint.NO_DEFAULT_VALUE)
+        finally:
+            self.metrics.record_make(abstract, time.perf_counter() - start)
+
+    async def amake(self, abstract: TAbstract, init_kwargs: Optional[KwargsDict] = None) -> Any:
+        """
+        Like `make`, but also resolves asynchronous concretes: coroutine functions are awaited, async generator
+        functions and async context managers are entered. Synchronous concretes are built as usual.
+        """
+        if init_kwargs is None:
+            init_kwargs = {}
+        if self.metrics is None:
+            return await self._amake(
+                abstract, init_kwargs, None, None, AnnotationHint.NO_DEFAULT_VALUE
+            )
+        start = time.perf_counter()
+        try:
+            return await self._amake(
+                abstract, init_kwargs, None, None, AnnotationHint.NO_DEFAULT_VALUE
+            )
+        finally:
+            self.metrics.record_make(abstract, time.perf_counter() - start)
+
+    def make_binding(self, binding: TBinding) -> Any:
+        """
+        Make an instance of a binding resolved ahead of time with `bindings.resolve_binding`,
+        obeying its lifetime. Callers resolving the same abstract over and over, e.g.
+        `touchstone.django.MagicProperty`, resolve its binding once and call this instead of `make`.
+        """
+        return self._make_binding(binding, {})
+
+    def inject(self, func: Callable) -> Callable:
+        """
+        Decorates `func` so that its annotated parameters are resolved by the container when the caller doesn't
+        pass them. Explicit positional and keyword arguments are passed through. The signature is only analysed
+        once, see `InjectionPlan`. Coroutine functions are resolved with `amake`.
+
+            >>> @container.inject
+            >>> def import_orders(path: str, repository: OrderRepository) -> None:
+            >>>     ...
+            >>> import_orders("orders.csv")
+
+        Contextual bindings apply, with `when=func`.
+        """
+        plan = InjectionPlan(func)
+        self.bindings.count_compilation("inject")
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                await plan.afill(self, len(args), kwargs)
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            plan.fill(self, len(args), kwargs)
+            return func(*args, **kwargs)
+
+        return wrapper
 
     def _make(
         self,
@@ -138,15 +446,95 @@ class Container(AbstractContainer):
         else:
             binding = self.bindings.resolve_binding(abstract, parent, parent_name, default_value)
 
-        if not init_kwargs and binding in self._instances:
-            return self._instances[binding]
+        return self._make_binding(binding, init_kwargs)
+
+    def _make_binding(self, binding: TBinding, init_kwargs: KwargsDict) -> Any:
+        if self._observers:
+            return self._make_observed_binding(binding, init_kwargs)
+        return self._build(binding, init_kwargs)
+
+    def _make_observed_binding(self, binding: TBinding, init_kwargs: KwargsDict) -> Any:
+        observers = self._observers
+        cache_hit = not init_kwargs and self._get_binding_lifetime(binding).contains(binding)
+        for observer in observers:
+            observer.resolution_started(binding, cache_hit)
+        try:
+            instance = self._build(binding, init_kwargs)
+        except BaseException as e:
+            for observer in observers:
+                observer.resolution_failed(binding, e)
+            raise
+        for observer in observers:
+            observer.resolution_finished(binding, instance)
+        return instance
+
+    def _build(self, binding: TBinding, init_kwargs: KwargsDict) -> Any:
+        if init_kwargs:
+            return self._construct(binding, init_kwargs)
+
+        lifetime = self._get_binding_lifetime(binding)
+        instance = lifetime.lookup(binding)
+        if instance is MISSING:
+            try:
+                instance = self._construct(binding, init_kwargs)
+            except BaseException:
+                lifetime.abandon(binding)
+                raise
+            lifetime.store(binding, instance)
+        return instance
 
+    def _get_binding_lifetime(self, binding: TBinding) -> LifetimeStrategy:
+        try:
+            return self._lifetimes[binding.lifetime_strategy]
+        except KeyError:
+            # Bindings loaded from a snapshot didn't go through `bind`.
+            return self.get_lifetime(binding.lifetime_strategy)
+
+    def _construct(self, binding: TBinding, init_kwargs: KwargsDict) -> Any:
         # Build instance
         resolved_params = self._resolve_params(binding, init_kwargs)
-        instance = binding.make(resolved_params)
+        kind, factory = self.bindings.get_factory(binding)
+        if kind == PLAIN:
+            instance = binding.make(resolved_params)
+        else:
+            instance = self._enter(binding, kind, factory, resolved_params)
 
         # Configure instance
         resolved_attrs = self._resolve_attrs(instance, binding, init_kwargs, resolved_params)
+        return self._configure(binding, instance, init_kwargs, resolved_params, resolved_attrs)
+
+    def _enter(
+        self, binding: TBinding, kind: str, factory: TConcrete, resolved_params: KwargsDict
+    ) -> Any:
+        if kind != COROUTINE:
+            scope = self._owning_scope(binding)
+            context_manager = factory(**resolved_params)
+            if hasattr(context_manager, "__enter__"):
+                instance = context_manager.__enter__()
+                scope.push(binding, context_manager, is_async=False)
+                return instance
+        raise ResolutionError(f"{binding.concrete} is asynchronous, resolve it with amake()")
+
+    def _owning_scope(self, binding: TBinding) -> Scope:
+        if self._get_binding_lifetime(binding).outlives_scope:
+            return self._root_scope
+        scope = get_current_scope(self)
+        if scope is None:
+            # The container would have to hold on to each one until it closes.
+            raise ResolutionError(
+                f"{binding.concrete} is a {binding.lifetime_strategy} resource: resolve it inside a"
+                f" container scope, or bind it as a {SINGLETON}"
+            )
+        return scope
+
+    def _configure(
+        self,
+        binding: TBinding,
+        instance: Any,
+        init_kwargs: KwargsDict,
+        resolved_params: KwargsDict,
+        resolved_attrs: KwargsDict,
+    ) -> Any:
         for k, v in resolved_attrs.items():
             setattr(instance, k, v)
 
@@ -155,15 +543,11 @@ class Container(AbstractContainer):
         if unused_init_kwargs:
             raise ResolutionError(f"Unused explicit init_kwargs: {unused_init_kwargs}")
 
-        if not init_kwargs and binding.lifetime_strategy == SINGLETON:
-            self._instances[binding] = instance
-
         return instance
 
     def _resolve_params(self, binding: TBinding, init_kwargs: KwargsDict) -> KwargsDict:
-        needed_params = binding.get_concrete_params()
         resolved_params = {}
-        for name, hint in needed_params.items():
+        for name, hint in self.bindings.get_params(binding):
             if name in init_kwargs:
                 resolved_params[name] = init_kwargs[name]
             else:
@@ -179,19 +563,133 @@ class Container(AbstractContainer):
     def _resolve_attrs(
         self, instance: Any, binding: TBinding, init_kwargs: KwargsDict, resolved_params: KwargsDict
     ) -> KwargsDict:
-        needed_attrs = binding.get_concrete_attrs(instance)
         resolved_attrs = {}
-        for name, hint in needed_attrs.items():
+        for name, annotation in self.bindings.get_attrs(binding):
             if name in resolved_params:
                 continue
             if name in init_kwargs:
                 resolved_attrs[name] = init_kwargs[name]
             else:
                 resolved_attrs[name] = self._make(
-                    hint.annotation,
+                    annotation,
                     {},
                     parent=binding.concrete,
                     parent_name=name,
-                    default_value=hint.default_value,
+                    default_value=getattr(instance, name, AnnotationHint.NO_DEFAULT_VALUE),
                 )
         return resolved_attrs
+
+    async def _amake(
+        self,
+        abstract: TAbstract,
+        init_kwargs: KwargsDict,
+        parent: Optional[TConcrete],
+        parent_name: Optional[str],
+        default_value: Any,
+    ) -> Any:
+        if init_kwargs == {} and abstract is None:
+            return None
+
+        if init_kwargs:
+            binding = self.bindings.make_auto_binding(
+                abstract, parent_name or str(abstract), parent
+            )
+        else:
+            binding = self.bindings.resolve_binding(abstract, parent, parent_name, default_value)
+
+        observers = self._observers
+        if not observers:
+            return await self._abuild(binding, init_kwargs)
+
+        cache_hit = not init_kwargs and self._get_binding_lifetime(binding).contains(binding)
+        for observer in observers:
+            observer.resolution_started(binding, cache_hit)
+        try:
+            instance = await self._abuild(binding, init_kwargs)
+        except BaseException as e:
+            for observer in observers:
+                observer.resolution_failed(binding, e)
+            raise
+        for observer in observers:
+            observer.resolution_finished(binding, instance)
+        return instance
+
+    async def _abuild(self, binding: TBinding, init_kwargs: KwargsDict) -> Any:
+        if init_kwargs:
+            return await self._aconstruct(binding, init_kwargs)
+
+        lifetime = self._get_binding_lifetime(binding)
+        instance = await lifetime.alookup(binding)
+        if instance is MISSING:
+            try:
+                instance = await self._aconstruct(binding, init_kwargs)
+            except BaseException:
+                lifetime.abandon(binding)
+                raise
+            lifetime.store(binding, instance)
+        return instance
+
+    async def _aconstruct(self, binding: TBinding, init_kwargs: KwargsDict) -> Any:
+        resolved_params = {}
+        for name, hint in self.bindings.get_params(binding):
+            if name in init_kwargs:
+                resolved_params[name] = init_kwargs[name]
+            else:
+                resolved_params[name] = await self._amake(
+                    hint.annotation, {}, binding.concrete, name, hint.default_value
+                )
+
+        kind, factory = self.bindings.get_factory(binding)
+        if kind == PLAIN:
+            instance = binding.make(resolved_params)
+        elif kind == COROUTINE:
+            instance = await binding.make(resolved_params)
+        else:
+            instance = await self._aenter(binding, factory, resolved_params)
+
+        resolved_attrs = {}
+        for name, annotation in self.bindings.get_attrs(binding):
+            if name in resolved_params:
+                continue
+            if name in init_kwargs:
+                resolved_attrs[name] = init_kwargs[name]
+            else:
+                default_value = getattr(instance, name, AnnotationHint.NO_DEFAULT_VALUE)
+                resolved_attrs[name] = await self._amake(
+                    annotation, {}, binding.concrete, name, default_value
+                )
+        return self._configure(binding, instance, init_kwargs, resolved_params, resolved_attrs)
+
+    async def _aenter(
+        self, binding: TBinding, factory: TConcrete, resolved_params: KwargsDict
+    ) -> Any:
+        scope = self._owning_scope(binding)
+        context_manager = factory(**resolved_params)
+        if hasattr(context_manager, "__aenter__"):
+            instance = await context_manager.__aenter__()
+            scope.push(binding, context_manager, is_async=True)
+        else:
+            instance = context_manager.__enter__()
+            scope.push(binding, context_manager, is_async=False)
+        return instance
+
+
+_containers: "weakref.WeakSet[Container]" = weakref.WeakSet()
+
+
+def refresh_containers(concrete: TConcrete) -> None:
+    """
+    Calls `refresh(concrete)` on every live container, e.g. after adding attributes to a class
+    they may have resolved already.
+    """
+    for container in list(_containers):
+        container.refresh(concrete)
+
+
+def _after_fork_in_child() -> None:
+    for container in list(_containers):
+        container.after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,4 +1,27 @@
-from .middleware import InjectViewsMiddleware
-from .properties import get_container, inject_magic_properties
+import django
 
-__all__ = ["InjectViewsMiddleware", "inject_magic_properties", "get_container"]
+from .middleware import InjectViewsMiddleware, RequestScopeMiddleware
+from .properties import (
+    MagicProperty,
+    SlottedMagicProperty,
+    get_container,
+    inject_magic_properties,
+)
+from .tracing import ResolutionTraceMiddleware, resolution_traces_view
+from .views import inject_view
+
+__all__ = [
+    "InjectViewsMiddleware",
+    "RequestScopeMiddleware",
+    "ResolutionTraceMiddleware",
+    "resolution_traces_view",
+    "MagicProperty",
+    "SlottedMagicProperty",
+    "inject_magic_properties",
+    "inject_view",
+    "get_container",
+]
+
+if django.VERSION < (3, 2):
+    # Later versions pick `apps.TouchstoneConfig` up by themselves, and deprecate this.
+    default_app_config = "touchstone.django.apps.TouchstoneConfig"
@@ -0,0 +1,144 @@
+"""
+Validates and compiles, at startup, everything the container will inject into views, tasks and
+classes with magic properties, so that misconfigurations fail the deploy instead of the first
+request, and the first request costs the same as the next ones. Add `"touchstone.django"` to
+`INSTALLED_APPS` to enable it.
+
+The URLconf can't be imported while apps are loading (the admin's URLs need its autodiscovery,
+for one), so the container is warmed up by a system check, which `runserver`, `migrate` and
+`check` run once every app is ready, or else on the first request.
+"""
+from typing import Any, Callable, Iterable, Iterator, List, Set, Tuple
+
+from django.apps import AppConfig
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import request_started
+from django.urls import URLPattern, URLResolver, get_resolver
+from touchstone.bindings import TAbstract, TBinding, TConcrete
+from touchstone.check import graph_errors
+from touchstone.container import Container
+from touchstone.django.middleware import inject_view_class
+from touchstone.django.properties import (
+    MagicProperty,
+    get_container,
+    get_injected_classes,
+    get_injection_plans,
+)
+from touchstone.django.views import get_view_plan
+from touchstone.exceptions import ResolutionError
+from touchstone.graph import GraphNode, GraphWalker, node_key
+from touchstone.injection import InjectionPlan
+
+# Resolves an abstract as the named dependency of a concrete, with a default value.
+TVisit = Callable[[TAbstract, TConcrete, str, Any], None]
+
+WARM_UP_UID = "touchstone.django.warm_up"
+
+# Whether the container was warmed up by `check_dependencies`.
+_warmed_up = False
+
+
+class TouchstoneConfig(AppConfig):  # type: ignore
+    name = "touchstone.django"
+    label = "touchstone"
+    verbose_name = "Touchstone"
+
+    def ready(self) -> None:
+        checks.register(check_dependencies, checks.Tags.urls)
+        request_started.connect(_warm_up_on_first_request, dispatch_uid=WARM_UP_UID)
+
+
+def check_dependencies(app_configs: Any = None, **kwargs: Any) -> List[checks.CheckMessage]:
+    """
+    The system check warming up the container of `TOUCHSTONE_CONTAINER_GETTER`, see `warm_up`.
+    Each dependency which can't be resolved is reported as an error.
+    """
+    global _warmed_up
+    try:
+        container = get_container()
+    except ImproperlyConfigured as e:
+        return [checks.Error(str(e), id="touchstone.E001")]
+    errors = warm_up(container)
+    _warmed_up = True
+    return [
+        checks.Error(f"Touchstone can't resolve a dependency: {error}", id="touchstone.E002")
+        for error in errors
+    ]
+
+
+def _warm_up_on_first_request(**kwargs: Any) -> None:
+    # Servers don't run the system checks. Errors are left to the requests which need them.
+    request_started.disconnect(dispatch_uid=WARM_UP_UID)
+    if not _warmed_up:
+        check_dependencies()
+
+
+def warm_up(container: Container, urlconf: Any = None) -> List[str]:
+    """
+    Walks the URLconf (the `ROOT_URLCONF` by default), injects the magic properties of class-based
+    views, works out the injection plans of function-based views, then resolves the bindings of
+    every injected view, class (see `inject_magic_properties`) and registered injection plan (see
+    `register_injection_plan`), and everything they depend on, without instantiating anything.
+    Signatures, attributes and factories are compiled along the way.
+
+    Returns the problems found, in the format of `python -m touchstone check`.
+    """
+    walker = _CompilingWalker(container)
+    errors: List[str] = []
+
+    def visit(abstract: TAbstract, parent: TConcrete, name: str, default_value: Any) -> None:
+        try:
+            binding = container.bindings.resolve_binding(abstract, parent, name, default_value)
+        except ResolutionError as e:
+            errors.append(f"unresolvable: {e}")
+            return
+        walker.visit(binding)
+
+    for callback, url_kwargs in _iter_views(get_resolver(urlconf).url_patterns):
+        if inject_view_class(callback):
+            continue
+        plan = get_view_plan(callback)
+        if plan is not None:
+            _visit_plan(plan, 1, url_kwargs, visit)
+
+    for cls in get_injected_classes():
+        for name, prop in list(vars(cls).items()):
+            if isinstance(prop, MagicProperty):
+                try:
+                    prop.compile(container)
+                except ResolutionError as e:
+                    errors.append(f"unresolvable: {e}")
+                    continue
+                visit(prop.abstract, cls, name, prop.default_value)
+
+    for plan, args_count in get_injection_plans():
+        _visit_plan(plan, args_count, set(), visit)
+
+    return errors + graph_errors(walker.graph)
+
+
+def _visit_plan(plan: InjectionPlan, args_count: int, provided: Set[str], visit: TVisit) -> None:
+    for name, position, hint in plan.injected:
+        if position >= args_count and name not in provided:
+            visit(hint.annotation, plan.func, name, hint.default_value)
+
+
+def _iter_views(
+    patterns: Iterable[Any], url_kwargs: Tuple[str, ...] = ()
+) -> Iterator[Tuple[Any, Set[str]]]:
+    # Yields each view with the names of the keyword arguments its URL passes it.
+    for pattern in patterns:
+        names = (*url_kwargs, *pattern.pattern.regex.groupindex)
+        if isinstance(pattern, URLResolver):
+            names = (*names, *pattern.default_kwargs)
+            yield from _iter_views(pattern.url_patterns, names)
+        elif isinstance(pattern, URLPattern):
+            yield pattern.callback, {*names, *pattern.default_args}
+
+
+class _CompilingWalker(GraphWalker):
+    def visit(self, binding: TBinding) -> GraphNode:
+        if node_key(binding) not in self.nodes_by_key:
+            self.resolver.get_factory(binding)
+        return super().visit(binding)
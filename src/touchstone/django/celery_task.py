@@ -1,8 +1,11 @@
-from typing import Any, Type
+from typing import Any, Callable, List, Optional, Type
 
 import celery
 from celery import Celery
+from touchstone.bindings import TAbstract
 from touchstone.django import get_container, inject_magic_properties
+from touchstone.django.properties import register_injection_plan
+from touchstone.injection import InjectionPlan
 
 
 def touchstone_task(task_cls: type) -> Type[celery.Task]:
@@ -16,3 +19,85 @@ def touchstone_task(task_cls: type) -> Type[celery.Task]:
     Task = inject_magic_properties(_Task)
     RegisteredTask: Type[celery.Task] = celery_app.register_task(Task())
     return RegisteredTask
+
+
+def touchstone_batch_task(
+    task_cls: Optional[type] = None, *, base: Optional[type] = None, **options: Any
+) -> Any:
+    """
+    Registers a task consuming its messages in batches, `celery_batches.Batches` style: `run` is
+    called with the list of requests buffered since the last flush. Its annotated parameters after
+    `requests` are resolved once per batch, within a `Container.scope()` closed when the batch is
+    done, so `SCOPED` dependencies are shared by the whole batch:
+
+        >>> @touchstone_batch_task(flush_every=100, flush_interval=10)
+        >>> class IndexDocuments:
+        >>>     def run(self, requests, index: SearchIndex):
+        >>>         index.add_many([request.kwargs["document"] for request in requests])
+
+    `options` (e.g. `flush_every` or `name`) are set on the task class. `base` defaults to
+    `celery_batches.Batches`.
+    """
+
+    def decorate(task_cls: type) -> Type[celery.Task]:
+        container = get_container()
+        celery_app = container.make(Celery)
+        run = task_cls.run  # type: ignore
+        plan = InjectionPlan(run)
+        container.bindings.count_compilation("inject")
+        register_injection_plan(plan, 2)
+
+        class _BatchTask(task_cls, base or _get_batches_base()):  # type: ignore
+            def run(self, requests: List[Any]) -> Any:
+                container = get_container()
+                kwargs: dict = {}
+                with container.scope():
+                    plan.fill(container, 2, kwargs)
+                    return run(self, requests, **kwargs)
+
+        _BatchTask.__module__ = task_cls.__module__
+        _BatchTask.__name__ = task_cls.__name__
+        _BatchTask.__qualname__ = task_cls.__qualname__
+        for name, value in options.items():
+            setattr(_BatchTask, name, value)
+        Task = inject_magic_properties(_BatchTask)
+        RegisteredTask: Type[celery.Task] = celery_app.register_task(Task())
+        return RegisteredTask
+
+    if task_cls is None:
+        return decorate
+    return decorate(task_cls)
+
+
+def touchstone_bulk_task(
+    abstract: TAbstract, method: str, *, base: Optional[type] = None, **options: Any
+) -> Type[celery.Task]:
+    """
+    Registers a batch task (see `touchstone_batch_task`) which hands each batch of requests to the
+    `method` of `abstract`, resolved once per batch:
+
+        >>> index_documents = touchstone_bulk_task(SearchIndex, "add_requests", flush_every=100)
+
+    The task is named after `abstract` and `method` unless `options` give a `name`.
+    """
+    name = getattr(abstract, "__qualname__", str(abstract))
+    options.setdefault("name", f"{getattr(abstract, '__module__', __name__)}.{name}.{method}")
+
+    def run(self: Any, requests: List[Any], target: abstract) -> Any:  # type: ignore
+        bulk: Callable[[List[Any]], Any] = getattr(target, method)
+        return bulk(requests)
+
+    task_cls = type(f"{name.rsplit('.', 1)[-1]}BulkTask", (), {"run": run})
+    RegisteredTask: Type[celery.Task] = touchstone_batch_task(task_cls, base=base, **options)
+    return RegisteredTask
+
+
+def _get_batches_base() -> type:
+    try:
+        from celery_batches import Batches
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Batch tasks need celery-batches (pip install celery-batches), or another `base`"
+        ) from e
+    base: type = Batches
+    return base
@@ -1,26 +1,207 @@
-from typing import Any, Callable, Mapping, Sequence
+import inspect
+from typing import Any, Awaitable, Callable, MutableMapping, Optional, Sequence, Union
 
 from django.http import HttpRequest, HttpResponse
-from touchstone.django.properties import inject_magic_properties
+from touchstone.django.properties import get_container, inject_magic_properties
+from touchstone.django.views import get_view_plan
+from touchstone.scopes import ExcInfo
+
+try:
+    from asgiref.sync import async_to_sync, sync_to_async
+except ImportError:  # Django < 3.0, which only runs middleware synchronously
+    async_to_sync = sync_to_async = None  # type: ignore
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:  # asgiref < 3.6, or no asgiref
+    import asyncio
+
+    iscoroutinefunction = asyncio.iscoroutinefunction  # type: ignore
+
+    def markcoroutinefunction(func: Any) -> Any:
+        func._is_coroutine = asyncio.coroutines._is_coroutine  # type: ignore
+        return func
+
+
+# The request attribute holding the exception raised by the view, if any.
+EXCEPTION_ATTRIBUTE = "_touchstone_exception"
+
+
+class RequestScopeMiddleware:
+    """
+    Opens a container scope around each request: `SCOPED` bindings resolve to one instance per
+    request, shared by views, middleware, serializers and `MagicProperty`s, and the resources built
+    during the request are torn down once the response is ready (or, for streaming responses, when
+    the response is closed). If the view raised, the exception is passed on to their teardown.
+    Under ASGI, it runs in the event loop and tears down asynchronous resources too.
+
+    Put it before `InjectViewsMiddleware` and any middleware using request-scoped dependencies.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if self.is_async:
+            return self.__acall__(request)
+        scope = get_container().scope()
+        scope.__enter__()
+        try:
+            response = self.get_response(request)
+        except BaseException as e:
+            scope.deactivate()
+            scope.close((type(e), e, e.__traceback__))
+            raise
+        scope.deactivate()
+
+        exc_info = _pop_exception(request)
+        if getattr(response, "streaming", False):
+            _close_with_response(response, lambda: scope.close(exc_info))
+        else:
+            scope.close(exc_info)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        `__call__` under ASGI, tearing down asynchronous resources too.
+        """
+        scope = get_container().scope()
+        scope.__enter__()
+        try:
+            response = await self.get_response(request)
+        except BaseException as e:
+            scope.deactivate()
+            await scope.aclose((type(e), e, e.__traceback__))
+            raise
+        scope.deactivate()
+
+        exc_info = _pop_exception(request)
+        if getattr(response, "streaming", False):
+            # Django closes responses from a worker thread, see `ASGIHandler.handle`.
+            _close_with_response(response, lambda: async_to_sync(scope.aclose)(exc_info))
+        else:
+            await scope.aclose(exc_info)
+        return response
+
+    def process_exception(self, request: HttpRequest, exception: Exception) -> None:
+        # Django turns the exception into a response before it reaches `__call__`.
+        setattr(request, EXCEPTION_ATTRIBUTE, exception)
+
+
+def _pop_exception(request: HttpRequest) -> ExcInfo:
+    exception = request.__dict__.pop(EXCEPTION_ATTRIBUTE, None)
+    if exception is None:
+        return (None, None, None)
+    return (type(exception), exception, exception.__traceback__)
+
+
+def _close_with_response(response: HttpResponse, close: Callable[[], None]) -> None:
+    # The content of a streaming response is generated after the middleware returns.
+    if hasattr(response, "_resource_closers"):  # Django 3.0+
+        response._resource_closers.append(close)
+    else:
+        response._closable_objects.append(_Closer(close))
+
+
+class _Closer:
+    def __init__(self, close: Callable[[], None]) -> None:
+        self.close = close
 
 
 class InjectViewsMiddleware:
+    """
+    Injects the dependencies of class-based views (as magic properties) and function-based views
+    (as keyword arguments). Under ASGI, dependencies of `async def` views are resolved with
+    `Container.amake`, without leaving the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable) -> None:
         self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+            # Django runs `process_view` in a worker thread in async mode unless it's a coroutine.
+            self.process_view = self.aprocess_view  # type: ignore
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if self.is_async:
+            return self.__acall__(request)
         return self.get_response(request)
 
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return await self.get_response(request)
+
     def process_view(
         self,
         request: HttpRequest,
         view_func: Any,
         view_args: Sequence[Any],
-        view_kwargs: Mapping[str, Any],
+        view_kwargs: MutableMapping[str, Any],
     ) -> None:
-        if hasattr(view_func, "view_class"):
-            # Vanilla Django ViewSet.as_view() puts the view's class in `view_class`
-            inject_magic_properties(view_func.view_class)
-        elif hasattr(view_func, "cls"):
-            # DRF overrides that behavior and puts the view's class in `cls`
-            inject_magic_properties(view_func.cls)
+        if inject_view_class(view_func):
+            return
+        # A function-based view. Django calls it with this very `view_kwargs` dict, so the
+        # dependencies are added to it. See `touchstone.django.views.inject_view`.
+        plan = get_view_plan(view_func)
+        if plan is not None:
+            _detach_url_kwargs(request, view_kwargs)
+            plan.fill(get_container(), 1 + len(view_args), view_kwargs)
+
+    async def aprocess_view(
+        self,
+        request: HttpRequest,
+        view_func: Any,
+        view_args: Sequence[Any],
+        view_kwargs: MutableMapping[str, Any],
+    ) -> Optional[HttpResponse]:
+        """
+        `process_view` under ASGI.
+        """
+        if inject_view_class(view_func):
+            return None
+        plan = get_view_plan(view_func)
+        if plan is None:
+            return None
+        _detach_url_kwargs(request, view_kwargs)
+        if inspect.iscoroutinefunction(view_func):
+            await plan.afill(get_container(), 1 + len(view_args), view_kwargs)
+        else:
+            # Sync views run in Django's sync thread: resolve there too, so thread-local and
+            # synchronous resources are built in the thread which uses them.
+            await sync_to_async(plan.fill, thread_sensitive=True)(
+                get_container(), 1 + len(view_args), view_kwargs
+            )
+        return None
+
+
+def _detach_url_kwargs(request: HttpRequest, view_kwargs: MutableMapping[str, Any]) -> None:
+    # `view_kwargs` is the dict of `request.resolver_match.kwargs`: give the match a copy of it,
+    # so that the dependencies added for the view don't show up in the URL's kwargs.
+    match = getattr(request, "resolver_match", None)
+    if match is not None and match.kwargs is view_kwargs:
+        match.kwargs = dict(view_kwargs)
+
+
+def inject_view_class(view_func: Any) -> bool:
+    """
+    Injects magic properties into the class of a class-based view, from the view function its
+    `as_view()` returned. Returns False if `view_func` isn't class-based.
+    """
+    if hasattr(view_func, "view_class"):
+        # Vanilla Django ViewSet.as_view() puts the view's class in `view_class`
+        inject_magic_properties(view_func.view_class)
+        return True
+    if hasattr(view_func, "cls"):
+        # DRF overrides that behavior and puts the view's class in `cls`
+        inject_magic_properties(view_func.cls)
+        return True
+    return False
@@ -1,13 +1,31 @@
-from typing import Any, Optional, TypeVar
+import functools
+import types
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, cast
 
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.utils import module_loading
 from touchstone import Container
-from touchstone.bindings import AutoBinding, TAbstract
+from touchstone.bindings import (
+    AnnotationHint,
+    AutoBinding,
+    TAbstract,
+    TBinding,
+    is_typing_classvar,
+)
+from touchstone.container import refresh_containers
+from touchstone.injection import InjectionPlan
 
 
 def get_container() -> Container:
-    container: Container = module_loading.import_string(settings.TOUCHSTONE_CONTAINER_GETTER)()
+    getter = getattr(settings, "TOUCHSTONE_CONTAINER_GETTER", None)
+    if getter is None:
+        raise ImproperlyConfigured(
+            "Set TOUCHSTONE_CONTAINER_GETTER to the dotted path of a function returning the "
+            "touchstone Container"
+        )
+    container: Container = module_loading.import_string(getter)()
     return container
 
 
@@ -20,6 +38,9 @@ class MagicProperty:
         >>> class Parent:
         >>>     obj = MagicProperty(abstract=Child, default_value=AnnotationHint.NO_DEFAULT_VALUE)
         >>> assert isinstance(Parent().obj, Child)
+
+    The result is cached in the instance's `__dict__`, so later accesses don't reach the descriptor
+    at all. See `SlottedMagicProperty` for classes with `__slots__`.
     """
 
     def __init__(self, abstract: TAbstract, default_value: Any) -> None:
@@ -27,6 +48,8 @@ class MagicProperty:
         self.default_value = default_value
         self.name: Optional[str] = None
         self.parent: Optional[type] = None
+        # (weakref to the container, its bindings' version, binding, whether to cache results)
+        self._plan: Optional[Tuple[Any, int, TBinding, bool]] = None
 
     def __set_name__(self, owner: type, name: str) -> None:
         if self.name is None and self.parent is None:
@@ -46,27 +69,128 @@ class MagicProperty:
         if self.name in instance.__dict__:
             return instance.__dict__[self.name]
 
-        result = self._make()
-        instance.__dict__[self.name] = result
+        result, cache = self._make()
+        if cache:
+            instance.__dict__[self.name] = result
         return result
 
-    def _make(self) -> Any:
+    def compile(self, container: Container) -> None:
+        """
+        Resolves the binding of this property in `container` ahead of the first access. The binding
+        is reused for every instance until the bindings of `container` change.
+        """
         if not self.parent:
             raise TypeError("This MagicProperty has not been assigned a parent.")
-        container = get_container()
-        return container._make(  # FIXME!!
-            abstract=self.abstract,
-            init_kwargs={},
-            parent=self.parent,
-            parent_name=self.name,
-            default_value=self.default_value,
+        binding = container.bindings.resolve_binding(
+            self.abstract, self.parent, self.name, self.default_value
         )
+        # Instances of e.g. `SCOPED` bindings belong to the current request: resolve them again
+        # on the next access, which may be during another request for long-lived objects.
+        cache = not container.get_lifetime(binding.lifetime_strategy).bound_to_scope
+        container.bindings.count_compilation("magic_property")
+        self._plan = (weakref.ref(container), container.bindings.version, binding, cache)
+
+    def _make(self) -> Tuple[Any, bool]:
+        if not self.parent:
+            raise TypeError("This MagicProperty has not been assigned a parent.")
+        if self.abstract is None:
+            return None, False
+        container = get_container()
+        plan = self._plan
+        if plan is None or plan[0]() is not container or plan[1] != container.bindings.version:
+            self.compile(container)
+            plan = cast(Tuple[Any, int, TBinding, bool], self._plan)
+        return container.make_binding(plan[2]), plan[3]
+
+
+class SlottedMagicProperty(MagicProperty):
+    """
+    A `MagicProperty` for classes whose instances have no `__dict__`. The result is cached in
+    `slot`, the member descriptor of a slot of the class (typically the slot of the same name,
+    which this property replaces), or else in a table on the property, keyed by weak references
+    to the instances. For example:
+
+        >>> @inject_magic_properties
+        >>> class Event:
+        >>>     __slots__ = ("payload", "clock")
+        >>>     clock: Clock
+        >>> # `Event.clock` is a `SlottedMagicProperty` storing its result in the "clock" slot.
+
+    Unlike `MagicProperty`, it is a data descriptor: assigning or deleting the attribute replaces
+    or forgets the cached result.
+    """
+
+    def __init__(self, abstract: TAbstract, default_value: Any, slot: Any = None) -> None:
+        super().__init__(abstract, default_value)
+        self.slot = slot
+        self._instances: Dict[int, Tuple["weakref.ref[Any]", Any]] = {}
+
+    def __get__(self, instance: Optional[object], cls: Optional[type] = None) -> Any:
+        if not self.name:
+            raise TypeError("This MagicProperty has not been assigned a name.")
+        if instance is None:
+            return self
+        if self.slot is not None:
+            try:
+                return self.slot.__get__(instance, cls)
+            except AttributeError:  # Unset slot
+                pass
+        else:
+            entry = self._instances.get(id(instance))
+            if entry is not None:
+                return entry[1]
+
+        result, cache = self._make()
+        if cache:
+            self.__set__(instance, result)
+        return result
+
+    def __set__(self, instance: object, value: Any) -> None:
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            key = id(instance)
+            forget = functools.partial(self._forget, key)
+            self._instances[key] = (weakref.ref(instance, forget), value)
+
+    def __delete__(self, instance: object) -> None:
+        if self.slot is not None:
+            self.slot.__delete__(instance)
+        elif self._instances.pop(id(instance), None) is None:
+            raise AttributeError(self.name)
+
+    def _forget(self, key: int, ref: "weakref.ref[Any]") -> None:
+        # Called when an instance is garbage collected, before its id can be reused.
+        self._instances.pop(key, None)
 
 
 TInjectedClass = TypeVar("TInjectedClass", bound=type)
 
+# The classes given magic properties, and the injection plans of functions called by other means
+# than the container (e.g. batch tasks), for `TouchstoneConfig` to validate and compile at startup.
+_injected_classes: "weakref.WeakSet[type]" = weakref.WeakSet()
+_injection_plans: List[Tuple[InjectionPlan, int]] = []
+
+
+def get_injected_classes() -> List[type]:
+    return list(_injected_classes)
+
+
+def register_injection_plan(plan: InjectionPlan, args_count: int) -> None:
+    """
+    Registers `plan` for validation at startup. `args_count` positional arguments are passed by the
+    caller, so the parameters at those positions aren't injected.
+    """
+    _injection_plans.append((plan, args_count))
+
+
+def get_injection_plans() -> List[Tuple[InjectionPlan, int]]:
+    return list(_injection_plans)
 
-def inject_magic_properties(concrete: TInjectedClass) -> TInjectedClass:
+
+def inject_magic_properties(
+    concrete: TInjectedClass, container: Optional[Container] = None
+) -> TInjectedClass:
     """
     This decorator will take in a class (`concrete`), look at its class annotations
     for non-ClassVar annotations, and which do not have a value already assigned,
@@ -77,10 +201,52 @@ def inject_magic_properties(concrete: TInjectedClass) -> TInjectedClass:
         >>> class Parent:
         >>>     obj: Child
         >>> assert isinstance(Parent().obj, Child)
+
+    Annotated slots of classes with `__slots__` are injected too, see `SlottedMagicProperty`. If
+    `container` is given, the bindings of the properties are resolved right away (see
+    `MagicProperty.compile`) rather than on first access.
     """
     needed_attrs = AutoBinding(concrete).get_concrete_attrs(concrete)
+    needed_attrs.update(_get_annotated_slots(concrete))
+    if not needed_attrs:
+        return concrete
+
+    has_dict = "__dict__" in dir(concrete)
+    props: List[MagicProperty] = []
     for name, hint in needed_attrs.items():
-        prop = MagicProperty(abstract=hint.annotation, default_value=hint.default_value)
+        slot = vars(concrete).get(name)
+        prop: MagicProperty
+        if isinstance(slot, types.MemberDescriptorType):
+            prop = SlottedMagicProperty(hint.annotation, hint.default_value, slot)
+        elif has_dict:
+            prop = MagicProperty(abstract=hint.annotation, default_value=hint.default_value)
+        elif "__weakref__" in dir(concrete):
+            prop = SlottedMagicProperty(hint.annotation, hint.default_value)
+        else:
+            raise TypeError(
+                f"Cannot inject {name} into {concrete}: its instances have neither a __dict__ nor "
+                f"weak references. Add {name!r} or '__weakref__' to its __slots__."
+            )
         prop.__set_name__(concrete, name)
         setattr(concrete, name, prop)
+        props.append(prop)
+    # Containers mustn't inject the attributes which are now magic properties.
+    refresh_containers(concrete)
+    if container is not None:
+        for prop in props:
+            prop.compile(container)
+    _injected_classes.add(concrete)
     return concrete
+
+
+def _get_annotated_slots(concrete: type) -> Dict[str, AnnotationHint]:
+    # Annotated slots are attributes of the class (member descriptors), so `get_concrete_attrs`
+    # leaves them out.
+    annotations = vars(concrete).get("__annotations__", {})
+    return {
+        name: AnnotationHint(annotations[name], AnnotationHint.NO_DEFAULT_VALUE)
+        for name, attr in vars(concrete).items()
+        if name in annotations
+        and isinstance(attr, types.MemberDescriptorType)
+        and not is_typing_classvar(annotations[name])
+    }
@@ -0,0 +1,179 @@
+"""
+Per-request resolution traces, to find out what a slow request spends its time resolving.
+
+Add `ResolutionTraceMiddleware` to `MIDDLEWARE` and route `resolution_traces_view` to a URL:
+
+    >>> urlpatterns = [path("_touchstone/traces/", resolution_traces_view)]
+
+While the middleware is installed, every binding the container resolves during a request (the
+dependencies of views, of `MagicProperty`s and their nested dependencies) is recorded in the
+request's `ResolutionTrace`. The last `TOUCHSTONE_TRACE_SIZE` traces (100 by default) are kept in
+a ring buffer, which the view dumps as JSON to staff users.
+
+Tracing relies on a `ResolutionObserver`, which the middleware adds to the container when Django
+instantiates it: without the middleware, resolution doesn't pay for tracing at all.
+"""
+import collections
+import contextvars
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from touchstone.bindings import TBinding
+from touchstone.container import ResolutionObserver
+from touchstone.django.middleware import iscoroutinefunction, markcoroutinefunction
+from touchstone.django.properties import get_container
+from touchstone.utils import describe
+
+DEFAULT_TRACE_SIZE = 100
+
+
+@dataclass
+class TraceEntry:
+    abstract: str
+    kind: str
+    lifetime: str
+    cache_hit: bool
+    # Seconds spent resolving the binding, including its dependencies.
+    duration: float
+    # 0 for the bindings resolved by the request itself, 1 for their dependencies, and so on.
+    depth: int
+    error: Optional[str] = None
+
+
+@dataclass
+class ResolutionTrace:
+    method: str
+    path: str
+    # Wall-clock time at which the request started.
+    started_at: float
+    duration: float = 0.0
+    status_code: Optional[int] = None
+    entries: List[TraceEntry] = field(default_factory=list)
+    # (entry, start) of the resolutions in progress.
+    _stack: List[Tuple[TraceEntry, float]] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data["_stack"]
+        return data
+
+
+_current_trace: contextvars.ContextVar[Optional[ResolutionTrace]] = contextvars.ContextVar(
+    "touchstone_current_trace", default=None
+)
+
+
+class ResolutionTracer(ResolutionObserver):
+    """
+    Records the resolutions of the current request into its trace, and keeps the last `size`
+    traces.
+    """
+
+    def __init__(self, size: int = DEFAULT_TRACE_SIZE) -> None:
+        self.traces: Deque[ResolutionTrace] = collections.deque(maxlen=size)
+
+    def resize(self, size: int) -> None:
+        if size != self.traces.maxlen:
+            self.traces = collections.deque(self.traces, maxlen=size)
+
+    def resolution_started(self, binding: TBinding, cache_hit: bool) -> None:
+        trace = _current_trace.get()
+        if trace is None:
+            return
+        entry = TraceEntry(
+            abstract=describe(binding.abstract),
+            kind=binding.kind,
+            lifetime=binding.lifetime_strategy,
+            cache_hit=cache_hit,
+            duration=0.0,
+            depth=len(trace._stack),
+        )
+        trace.entries.append(entry)
+        trace._stack.append((entry, time.perf_counter()))
+
+    def resolution_finished(self, binding: TBinding, instance: Any) -> None:
+        self._finish(None)
+
+    def resolution_failed(self, binding: TBinding, error: BaseException) -> None:
+        self._finish(error)
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        trace = _current_trace.get()
+        if trace is None or not trace._stack:
+            return
+        entry, start = trace._stack.pop()
+        entry.duration = time.perf_counter() - start
+        if error is not None:
+            entry.error = repr(error)
+
+    def start(self, request: HttpRequest) -> contextvars.Token:
+        trace = ResolutionTrace(request.method or "", request.path, time.time())
+        return _current_trace.set(trace)
+
+    def finish(self, token: contextvars.Token, response: Optional[HttpResponse]) -> None:
+        trace = _current_trace.get()
+        _current_trace.reset(token)
+        if trace is None:
+            return
+        trace.duration = time.time() - trace.started_at
+        trace.status_code = getattr(response, "status_code", None)
+        trace._stack.clear()
+        self.traces.append(trace)
+
+
+tracer = ResolutionTracer()
+
+
+class ResolutionTraceMiddleware:
+    """
+    Records a `ResolutionTrace` of each request, see the module docstring. Put it first in
+    `MIDDLEWARE` to trace the resolutions made by the other middleware too.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        tracer.resize(getattr(settings, "TOUCHSTONE_TRACE_SIZE", DEFAULT_TRACE_SIZE))
+        container = get_container()
+        container.remove_observer(tracer)
+        container.add_observer(tracer)
+
+    def __call__(self, request: HttpRequest) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if self.is_async:
+            return self.__acall__(request)
+        token = tracer.start(request)
+        response = None
+        try:
+            response = self.get_response(request)
+        finally:
+            tracer.finish(token, response)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = tracer.start(request)
+        response = None
+        try:
+            response = await self.get_response(request)
+        finally:
+            tracer.finish(token, response)
+        return response
+
+
+def resolution_traces_view(request: HttpRequest) -> JsonResponse:
+    """
+    Dumps the recorded traces, most recent first. Only for active staff users.
+    """
+    user = getattr(request, "user", None)
+    if not (user is not None and user.is_active and user.is_staff):
+        raise PermissionDenied
+    traces = [trace.to_dict() for trace in reversed(tracer.traces)]
+    return JsonResponse({"traces": traces})
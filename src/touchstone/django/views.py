@@ -0,0 +1,92 @@
+import functools
+import inspect
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
+
+from django.http import HttpRequest, HttpResponse
+from touchstone.django.properties import get_container
+from touchstone.injection import InjectionPlan
+
+# The attribute caching the `InjectionPlan` of a function-based view on the function itself.
+PLAN_ATTRIBUTE = "__touchstone_plan__"
+
+# Function of a bound method -> the plan of the methods it's bound as. Attributes can't be set on
+# bound methods, and those read from them are the function's.
+_method_plans: "WeakKeyDictionary[Callable, Optional[InjectionPlan]]" = WeakKeyDictionary()
+
+
+def get_view_plan(view_func: Callable) -> Optional[InjectionPlan]:
+    """
+    Returns the injection plan of a function-based view: every annotated parameter after `request`
+    which the URL doesn't provide is resolved by the container. It is worked out on first use and
+    cached on the function. Returns None if the view has nothing to inject.
+
+    Views which are bound methods are resolved in the context of their function (e.g.
+    `bind_contextual(when=OrderViews.detail, ...)`), whatever instance they're bound to.
+    """
+    func = getattr(view_func, "__func__", None)
+    if func is not None:
+        try:
+            return _method_plans[func]
+        except KeyError:
+            plan = _make_view_plan(view_func)
+            if plan is not None:
+                plan.func = func
+            _method_plans[func] = plan
+            return plan
+    try:
+        cached: Optional[InjectionPlan] = getattr(view_func, PLAN_ATTRIBUTE)
+        return cached
+    except AttributeError:
+        pass
+    plan = _make_view_plan(view_func)
+    try:
+        setattr(view_func, PLAN_ATTRIBUTE, plan)
+    except AttributeError:
+        pass
+    return plan
+
+
+def _make_view_plan(view_func: Callable) -> Optional[InjectionPlan]:
+    try:
+        plan = InjectionPlan(view_func)
+    except (TypeError, ValueError):  # No signature available
+        return None
+    return plan if plan.injected else None
+
+
+def inject_view(view_func: Callable) -> Callable:
+    """
+    Decorates a function-based view so that its annotated parameters after `request` are resolved
+    by the container on each request, unless the URL provides them. For example:
+
+        >>> @inject_view
+        >>> def order_detail(request: HttpRequest, pk: int, orders: OrderRepository) -> HttpResponse:
+        >>>     ...
+
+    `InjectViewsMiddleware` does the same for undecorated views.
+    """
+    if inspect.iscoroutinefunction(view_func):
+
+        @functools.wraps(view_func)
+        async def async_wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if plan is not None:
+                await plan.afill(get_container(), 1 + len(args), kwargs)
+            return await view_func(request, *args, **kwargs)
+
+        wrapper: Callable = async_wrapper
+    else:
+
+        @functools.wraps(view_func)
+        def sync_wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if plan is not None:
+                plan.fill(get_container(), 1 + len(args), kwargs)
+            return view_func(request, *args, **kwargs)
+
+        wrapper = sync_wrapper
+
+    # Contextual bindings refer to the decorated view (`when=order_detail`): plan for the wrapper.
+    plan = InjectionPlan(wrapper) if get_view_plan(view_func) else None
+    # Leaves nothing for the middleware to inject.
+    setattr(wrapper, PLAN_ATTRIBUTE, None)
+    return wrapper
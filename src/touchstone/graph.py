@@ -0,0 +1,364 @@
+"""
+Dependency graphs of `Container.make`.
+
+`build_graph(container, Root)` walks the resolution of `Root` without instantiating anything and
+returns a `DependencyGraph`, with one node per binding and one edge per injected parameter or
+attribute. Each edge records which kind of binding resolved it ("simple", "auto", "contextual" or
+"default") and each node the lifetime of its binding.
+
+With `instantiate=True`, `Root` is then made once and every node is annotated with how many times
+it was built and how long that took, which makes it easy to spot expensive `NEW_EVERY_TIME`
+subtrees that should become singletons:
+
+    >>> graph = build_graph(container, Root, instantiate=True)
+    >>> with open("root.dot", "w") as fp:
+    >>>     fp.write(graph.to_dot())
+
+Attribute defaults assigned in `__init__` can't be known without instantiating, so the static walk
+reports such attributes as injected.
+"""
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from touchstone.bindings import (
+    SINGLETON,
+    AnnotationHint,
+    AutoBinding,
+    DefaultValueBinding,
+    InstanceFactory,
+    TAbstract,
+    TBinding,
+)
+from touchstone.container import Container, ResolutionObserver
+from touchstone.exceptions import ResolutionError
+from touchstone.utils import describe, escape_label
+
+
+@dataclass
+class GraphNode:
+    id: str
+    label: str
+    kind: str
+    lifetime: Optional[str]
+    fork_policy: Optional[str] = None
+    # How many times the node is built by one `make` of the root: estimated by the static walk,
+    # then replaced by the measured figure when instantiating.
+    builds: int = 0
+    cache_hits: int = 0
+    # Seconds spent building the node itself (excluding its dependencies), and including them.
+    self_time: Optional[float] = None
+    total_time: Optional[float] = None
+    error: Optional[str] = None
+    dependents: int = 0
+
+
+@dataclass
+class GraphEdge:
+    parent: str
+    child: str
+    name: str
+    via: str  # "param" or "attr"
+    kind: str
+    cycle: bool = False
+
+
+@dataclass
+class DependencyGraph:
+    root: str = ""
+    timed: bool = False
+    nodes: Dict[str, GraphNode] = field(default_factory=dict)
+    edges: List[GraphEdge] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[str]:
+        return [node.error for node in self.nodes.values() if node.error]
+
+    def children(self) -> Dict[str, List[GraphEdge]]:
+        """
+        Returns the outgoing edges of every node, leaving out the edges which close a cycle.
+        """
+        children: Dict[str, List[GraphEdge]] = {node_id: [] for node_id in self.nodes}
+        for edge in self.edges:
+            if not edge.cycle:
+                children[edge.parent].append(edge)
+        return children
+
+    def reachable(self, root: str) -> List[str]:
+        """
+        Returns the ids of the nodes reachable from `root`, `root` included.
+        """
+        children = self.children()
+        seen = {root}
+        stack = [root]
+        while stack:
+            for edge in children[stack.pop()]:
+                if edge.child not in seen:
+                    seen.add(edge.child)
+                    stack.append(edge.child)
+        return [node_id for node_id in self.nodes if node_id in seen]
+
+    def estimate_builds(self, root: str) -> Dict[str, int]:
+        """
+        Estimates how many times one make of `root` builds each node reachable from it: a singleton
+        is built once, anything else once per injection into each build of its dependents.
+        """
+        reachable = set(self.reachable(root))
+        incoming: Dict[str, List[str]] = {node_id: [] for node_id in reachable}
+        for edge in self.edges:
+            if not edge.cycle and edge.parent in reachable:
+                incoming[edge.child].append(edge.parent)
+        builds: Dict[str, int] = {root: 1}
+
+        def estimate(node_id: str) -> int:
+            if node_id not in builds:
+                if self.nodes[node_id].lifetime == SINGLETON:
+                    builds[node_id] = 1
+                else:
+                    builds[node_id] = sum(estimate(parent) for parent in incoming[node_id])
+            return builds[node_id]
+
+        return {node_id: estimate(node_id) for node_id in reachable}
+
+    def critical_path(self, root: Optional[str] = None) -> List[str]:
+        """
+        Returns the ids of the nodes on the most expensive path from `root` (the graph's root by
+        default): the path with the largest total build time when the graph is timed, the longest
+        one otherwise.
+        """
+        root = root or self.root
+        children = self.children()
+        best: Dict[str, Tuple[float, List[str]]] = {}
+
+        def visit(node_id: str) -> Tuple[float, List[str]]:
+            if node_id not in best:
+                node = self.nodes[node_id]
+                weight = (node.self_time or 0.0) if self.timed else 1.0
+                tails = [visit(edge.child) for edge in children[node_id]]
+                cost, tail = max(tails, key=lambda t: t[0], default=(0.0, []))
+                best[node_id] = (weight + cost, [node_id, *tail])
+            return best[node_id]
+
+        return visit(root)[1] if root else []
+
+    def most_shared(self, limit: int = 5) -> List[str]:
+        """
+        Returns the ids of up to `limit` nodes which the most other nodes depend on.
+        """
+        shared = [node for node in self.nodes.values() if node.dependents > 1]
+        shared.sort(key=lambda node: node.dependents, reverse=True)
+        return [node.id for node in shared[:limit]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "root": self.root,
+            "timed": self.timed,
+            "nodes": [vars(node) for node in self.nodes.values()],
+            "edges": [vars(edge) for edge in self.edges],
+            "critical_path": self.critical_path(),
+            "most_shared": self.most_shared(),
+            "errors": self.errors,
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        kwargs.setdefault("indent", 2)
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_dot(self) -> str:
+        """
+        Renders the graph in the Graphviz DOT language. The critical path is drawn in red, the most
+        shared nodes are filled, unresolvable dependencies are dashed.
+        """
+        critical = self.critical_path()
+        critical_edges = set(zip(critical, critical[1:]))
+        shared = set(self.most_shared())
+
+        lines = [
+            "digraph dependencies {",
+            "  rankdir=LR;",
+            '  node [shape=box, fontname="Helvetica"];',
+        ]
+        for node in self.nodes.values():
+            label = [node.label, f"{node.kind}, {node.lifetime}" if node.lifetime else node.kind]
+            if node.builds != 1:
+                label.append(f"built {node.builds}x")
+            if node.self_time is not None:
+                label.append(f"{node.self_time * 1000:.3f} ms")
+            attrs = [f'label="{escape_label(chr(10).join(label))}"']
+            if node.id in critical:
+                attrs.append("color=red, penwidth=2")
+            if node.id in shared:
+                attrs.append("style=filled, fillcolor=lightyellow")
+            if node.error:
+                attrs.append("style=dashed, color=orange")
+            lines.append(f'  "{node.id}" [{", ".join(attrs)}];')
+        for edge in self.edges:
+            attrs = [f'label="{escape_label(edge.name)}"']
+            if (edge.parent, edge.child) in critical_edges:
+                attrs.append("color=red, penwidth=2")
+            if edge.cycle:
+                attrs.append("style=dashed")
+            lines.append(f'  "{edge.parent}" -> "{edge.child}" [{", ".join(attrs)}];')
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def build_graph(
+    container: Container, root: TAbstract, instantiate: bool = False
+) -> DependencyGraph:
+    """
+    Returns the dependency graph of `container.make(root)`. See the module documentation.
+    """
+    walker = GraphWalker(container)
+    graph = walker.graph
+    graph.root = walker.visit(container.bindings.resolve_binding(root)).id
+    for node_id, builds in graph.estimate_builds(graph.root).items():
+        graph.nodes[node_id].builds = builds
+    if instantiate:
+        observer = _TimingObserver()
+        container.add_observer(observer)
+        try:
+            container.make(root)
+        finally:
+            container.remove_observer(observer)
+        graph.timed = True
+        for key, node in walker.nodes_by_key.items():
+            builds, cache_hits, self_time, total_time = observer.stats.get(key, (0, 0, 0.0, 0.0))
+            node.builds = builds
+            node.cache_hits = cache_hits
+            node.self_time = self_time
+            node.total_time = total_time
+    return graph
+
+
+def node_key(binding: TBinding) -> Hashable:
+    """
+    Identifies the graph node of `binding`. Auto-bindings and default value bindings are created
+    on every resolution, so they are identified by what they resolve to instead.
+    """
+    if isinstance(binding, AutoBinding):
+        return ("auto", binding.concrete)
+    if isinstance(binding, DefaultValueBinding):
+        return ("default", binding.parent, binding.parent_name)
+    return binding
+
+
+class GraphWalker:
+    """
+    Adds bindings, and everything they depend on, to `self.graph`. Nodes are shared between all the
+    bindings visited by the same walker, so each dependency is only walked once.
+    """
+
+    def __init__(self, container: Container) -> None:
+        self.resolver = container.bindings
+        self.graph = DependencyGraph()
+        self.nodes_by_key: Dict[Hashable, GraphNode] = {}
+        self.expanding: Set[Hashable] = set()
+
+    def visit(self, binding: TBinding) -> GraphNode:
+        """
+        Returns the node of `binding`, walking its dependencies if it wasn't visited before.
+        """
+        key = node_key(binding)
+        if key in self.nodes_by_key:
+            return self.nodes_by_key[key]
+        node = self._add_node(binding.kind, binding.lifetime_strategy, _describe(binding))
+        node.fork_policy = binding.fork_policy
+        self.nodes_by_key[key] = node
+        self.expanding.add(key)
+        for via, name, hint in self._dependencies(binding):
+            if hint.annotation is None:
+                continue  # The container injects None without resolving anything
+            try:
+                child = self.resolver.resolve_binding(
+                    hint.annotation, binding.concrete, name, hint.default_value
+                )
+            except ResolutionError as e:
+                error_node = self._add_node("unresolved", None, describe(hint.annotation))
+                error_node.error = str(e)
+                self._add_edge(node, error_node, name, via, "unresolved")
+                continue
+            child_key = node_key(child)
+            if child_key in self.nodes_by_key:
+                cycle = child_key in self.expanding
+                self._add_edge(node, self.nodes_by_key[child_key], name, via, child.kind, cycle)
+            else:
+                self._add_edge(node, self.visit(child), name, via, child.kind)
+        self.expanding.discard(key)
+        return node
+
+    def _dependencies(self, binding: TBinding) -> List[Tuple[str, str, AnnotationHint]]:
+        try:
+            params = self.resolver.get_params(binding)
+        except (TypeError, ValueError):  # No signature available
+            params = ()
+        dependencies = [("param", name, hint) for name, hint in params]
+        if isinstance(binding.concrete, type):
+            param_names = {name for name, _ in params}
+            for name, annotation in self.resolver.get_attrs(binding):
+                if name not in param_names:
+                    hint = AnnotationHint(annotation, AnnotationHint.NO_DEFAULT_VALUE)
+                    dependencies.append(("attr", name, hint))
+        return dependencies
+
+    def _add_node(self, kind: str, lifetime: Optional[str], label: str) -> GraphNode:
+        node = GraphNode(id=f"n{len(self.graph.nodes)}", label=label, kind=kind, lifetime=lifetime)
+        self.graph.nodes[node.id] = node
+        return node
+
+    def _add_edge(
+        self,
+        parent: GraphNode,
+        child: GraphNode,
+        name: str,
+        via: str,
+        kind: str,
+        cycle: bool = False,
+    ) -> None:
+        self.graph.edges.append(GraphEdge(parent.id, child.id, name, via, kind, cycle))
+        child.dependents += 1
+
+
+class _TimingObserver(ResolutionObserver):
+    def __init__(self) -> None:
+        self.local = threading.local()
+        # node key -> (builds, cache hits, self time, total time)
+        self.stats: Dict[Hashable, Tuple[int, int, float, float]] = {}
+
+    def resolution_started(self, binding: TBinding, cache_hit: bool) -> None:
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        self.local.stack.append([binding, cache_hit, time.perf_counter(), 0.0])
+
+    def resolution_finished(self, binding: TBinding, instance: Any) -> None:
+        self._finish()
+
+    def resolution_failed(self, binding: TBinding, error: BaseException) -> None:
+        self._finish()
+
+    def _finish(self) -> None:
+        stack = self.local.stack
+        binding, cache_hit, start, children_time = stack.pop()
+        total_time = time.perf_counter() - start
+        if stack:
+            stack[-1][3] += total_time
+        key = node_key(binding)
+        builds, cache_hits, self_time, total = self.stats.get(key, (0, 0, 0.0, 0.0))
+        if cache_hit:
+            self.stats[key] = (builds, cache_hits + 1, self_time, total)
+        else:
+            self.stats[key] = (
+                builds + 1,
+                cache_hits,
+                self_time + total_time - children_time,
+                total + total_time,
+            )
+
+
+def _describe(binding: TBinding) -> str:
+    if isinstance(binding.concrete, InstanceFactory):
+        prefix = "default" if isinstance(binding, DefaultValueBinding) else "instance"
+        return f"{prefix} {binding.concrete.instance!r}"[:80]
+    return describe(binding.concrete)
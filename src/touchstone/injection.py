@@ -0,0 +1,63 @@
+import inspect
+import sys
+from typing import TYPE_CHECKING, Any, Callable, MutableMapping, Tuple
+
+from touchstone.bindings import AnnotationHint
+
+if TYPE_CHECKING:  # pragma: no cover
+    from touchstone.container import Container
+
+# (name, position, hint) of each injectable parameter. `position` is the index of the parameter
+# among positional arguments, or `sys.maxsize` for keyword-only parameters.
+TInjected = Tuple[Tuple[str, int, AnnotationHint], ...]
+
+
+class InjectionPlan:
+    """
+    The parameters of `func` which `Container.inject` fills in, worked out once from its signature:
+    every annotated parameter which can be passed by keyword. On each call, the parameters the caller
+    didn't pass, by position or by keyword, are resolved and passed by keyword.
+    """
+
+    __slots__ = ("func", "injected")
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        injected = []
+        for position, param in enumerate(inspect.signature(func).parameters.values()):
+            if param.annotation is inspect.Parameter.empty:
+                continue
+            if param.kind == inspect.Parameter.KEYWORD_ONLY:
+                position = sys.maxsize
+            elif param.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                continue
+            injected.append((param.name, position, AnnotationHint(param.annotation, param.default)))
+        self.injected: TInjected = tuple(injected)
+
+    def fill(
+        self, container: "Container", args_count: int, kwargs: MutableMapping[str, Any]
+    ) -> None:
+        """
+        Adds the injected parameters missing from a call with `args_count` positional arguments and
+        `kwargs` to `kwargs`, resolved by `container` in the context of `func`.
+        """
+        for name, position, hint in self.injected:
+            if position >= args_count and name not in kwargs:
+                kwargs[name] = container._make(
+                    hint.annotation, {}, self.func, name, hint.default_value
+                )
+
+    async def afill(
+        self, container: "Container", args_count: int, kwargs: MutableMapping[str, Any]
+    ) -> None:
+        """
+        `fill`, resolving with `Container.amake`.
+        """
+        for name, position, hint in self.injected:
+            if position >= args_count and name not in kwargs:
+                kwargs[name] = await container._amake(
+                    hint.annotation, {}, self.func, name, hint.default_value
+                )
+
+    def __repr__(self) -> str:
+        return f"InjectionPlan({self.func!r}, {[name for name, _, _ in self.injected]})"
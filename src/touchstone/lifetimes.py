@@ -0,0 +1,312 @@
+"""
+Lifetime strategies: how long the instances of a binding live, and where they are kept.
+
+The `lifetime_strategy` of a binding (e.g. `SINGLETON`) names a `LifetimeStrategy` class. Each
+container instantiates a strategy once, when a binding first uses it, and keeps it in a table:
+resolving a binding is one lookup in that table, then `lookup` to reuse an instance and `store`
+after building a new one. Strategies keep their instances themselves.
+
+Third parties can add lifetimes:
+
+    >>> class PerTenant(LifetimeStrategy):
+    >>>     def __init__(self, container):
+    >>>         super().__init__(container)
+    >>>         self.instances = {}
+    >>>
+    >>>     def lookup(self, binding):
+    >>>         return self.instances.get((current_tenant(), binding), MISSING)
+    >>>
+    >>>     def store(self, binding, instance):
+    >>>         self.instances[(current_tenant(), binding)] = instance
+    >>>
+    >>> register_lifetime_strategy("per_tenant", PerTenant)
+    >>> container.bind(Settings, load_settings, "per_tenant")
+"""
+import abc
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from touchstone.bindings import (
+    NEW_EVERY_TIME,
+    POOLED,
+    REBUILD_IN_CHILD,
+    SCOPED,
+    SINGLETON,
+    THREAD_LOCAL,
+    TBinding,
+)
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.pools import EMPTY, Checkout, InstancePool
+from touchstone.scopes import Scope, get_current_scope
+
+if TYPE_CHECKING:  # pragma: no cover
+    from touchstone.container import Container
+
+# Returned by `LifetimeStrategy.lookup` when a new instance must be built.
+MISSING = object()
+
+
+class LifetimeStrategy(abc.ABC):
+    # Whether instances outlive the scope they are built in. If so, their resources (see
+    # `Container.scope`) belong to the container rather than to the scope.
+    outlives_scope = True
+    # Whether instances must not be used once the scope they were resolved in closes, so mustn't be
+    # cached elsewhere (e.g. by `MagicProperty`).
+    bound_to_scope = False
+
+    def __init__(self, container: "Container") -> None:
+        self.container = container
+
+    @abc.abstractmethod
+    def lookup(self, binding: TBinding) -> Any:
+        """
+        Returns the instance to reuse for `binding`, or `MISSING` to build a new one.
+        """
+
+    @abc.abstractmethod
+    def store(self, binding: TBinding, instance: Any) -> None:
+        """
+        Called with the instance built after `lookup` returned `MISSING`.
+        """
+
+    async def alookup(self, binding: TBinding) -> Any:
+        """
+        `lookup` for `Container.amake`. Override it if `lookup` may block.
+        """
+        return self.lookup(binding)
+
+    def abandon(self, binding: TBinding) -> None:
+        """
+        Called instead of `store` if building the instance failed.
+        """
+
+    def contains(self, binding: TBinding) -> bool:
+        """
+        Whether `lookup` would reuse an instance, without side effects. Only used for diagnostics.
+        """
+        return False
+
+    def clear(self) -> None:
+        """
+        Forgets every instance. Called when the container closes.
+        """
+
+    def after_fork_in_child(self) -> None:
+        """
+        Forgets the instances of bindings with the `REBUILD_IN_CHILD` fork policy.
+        """
+
+
+class NewEveryTimeLifetime(LifetimeStrategy):
+    outlives_scope = False
+
+    def lookup(self, binding: TBinding) -> Any:
+        return MISSING
+
+    def store(self, binding: TBinding, instance: Any) -> None:
+        pass
+
+
+class SingletonLifetime(LifetimeStrategy):
+    """
+    One instance per container. Looking up a built instance takes no lock. Building one is
+    serialized per binding, by a re-entrant lock of its own held from `lookup` to `store` or
+    `abandon`, so that threads resolving a singleton at the same time build it once, and threads
+    building different singletons don't contend. `alookup` takes no lock: it mustn't block the
+    event loop.
+    """
+
+    def __init__(self, container: "Container") -> None:
+        super().__init__(container)
+        self.instances: Dict[TBinding, Any] = {}
+        self._locks: Dict[TBinding, threading.RLock] = {}
+        # The bindings whose lock the current thread holds, between `lookup` and `store`.
+        self._local = threading.local()
+
+    def lookup(self, binding: TBinding) -> Any:
+        instance = self.instances.get(binding, MISSING)
+        if instance is MISSING:
+            return self.lock_and_lookup(binding)
+        return instance
+
+    def lock_and_lookup(self, binding: TBinding) -> Any:
+        """
+        Waits for the lock of `binding` and looks it up again. If it's still missing, the lock is
+        held until the instance is stored or abandoned.
+        """
+        lock = self._locks.get(binding)
+        if lock is None:
+            lock = self._locks.setdefault(binding, threading.RLock())
+        lock.acquire()
+        instance = self.instances.get(binding, MISSING)
+        if instance is not MISSING:  # Built by another thread meanwhile
+            lock.release()
+            return instance
+        try:
+            self._local.held.append(binding)
+        except AttributeError:
+            self._local.held = [binding]
+        return MISSING
+
+    async def alookup(self, binding: TBinding) -> Any:
+        return self.instances.get(binding, MISSING)
+
+    def store(self, binding: TBinding, instance: Any) -> None:
+        self.instances[binding] = instance
+        self._unlock(binding)
+
+    def abandon(self, binding: TBinding) -> None:
+        self._unlock(binding)
+
+    def _unlock(self, binding: TBinding) -> None:
+        held = getattr(self._local, "held", None)
+        if held and binding in held:
+            held.remove(binding)
+            self._locks[binding].release()
+
+    def contains(self, binding: TBinding) -> bool:
+        return binding in self.instances
+
+    def clear(self) -> None:
+        self.instances.clear()
+
+    def after_fork_in_child(self) -> None:
+        _forget_rebuilt_in_child(self.instances)
+        # Locks held by threads which didn't survive the fork would never be released.
+        self._locks = {}
+        self._local = threading.local()
+
+
+class ScopedLifetime(LifetimeStrategy):
+    outlives_scope = False
+    bound_to_scope = True
+
+    def lookup(self, binding: TBinding) -> Any:
+        return _require_scope(self.container, binding).instances.get(binding, MISSING)
+
+    def store(self, binding: TBinding, instance: Any) -> None:
+        _require_scope(self.container, binding).instances[binding] = instance
+
+    def contains(self, binding: TBinding) -> bool:
+        scope = get_current_scope(self.container)
+        return scope is not None and binding in scope.instances
+
+
+class ThreadLocalLifetime(LifetimeStrategy):
+    def __init__(self, container: "Container") -> None:
+        super().__init__(container)
+        # Holds a binding -> instance dict per thread, released when the thread dies.
+        self._local = threading.local()
+
+    def get_instances(self) -> Dict[TBinding, Any]:
+        """
+        Returns the instances of the current thread.
+        """
+        try:
+            instances: Dict[TBinding, Any] = self._local.instances
+            return instances
+        except AttributeError:
+            instances = self._local.instances = {}
+            return instances
+
+    def lookup(self, binding: TBinding) -> Any:
+        return self.get_instances().get(binding, MISSING)
+
+    def store(self, binding: TBinding, instance: Any) -> None:
+        self.get_instances()[binding] = instance
+
+    def contains(self, binding: TBinding) -> bool:
+        return binding in self.get_instances()
+
+    def clear(self) -> None:
+        self._local = threading.local()
+
+    def after_fork_in_child(self) -> None:
+        # Only the forking thread survives in the child.
+        _forget_rebuilt_in_child(self.get_instances())
+
+
+class PooledLifetime(LifetimeStrategy):
+    bound_to_scope = True
+
+    def __init__(self, container: "Container") -> None:
+        super().__init__(container)
+        self.pools: Dict[TBinding, InstancePool] = {}
+
+    def get_pool(self, binding: TBinding) -> InstancePool:
+        try:
+            return self.pools[binding]
+        except KeyError:
+            return self.pools.setdefault(binding, InstancePool())
+
+    def lookup(self, binding: TBinding) -> Any:
+        scope = _require_scope(self.container, binding)
+        instance = self.get_pool(binding).acquire()
+        return self._checked_out(scope, binding, instance)
+
+    async def alookup(self, binding: TBinding) -> Any:
+        scope = _require_scope(self.container, binding)
+        instance = await self.get_pool(binding).aacquire()
+        return self._checked_out(scope, binding, instance)
+
+    def _checked_out(self, scope: Scope, binding: TBinding, instance: Any) -> Any:
+        if instance is EMPTY:
+            return MISSING
+        scope.push(binding, Checkout(self.pools[binding], instance), is_async=False)
+        return instance
+
+    def store(self, binding: TBinding, instance: Any) -> None:
+        self._checked_out(_require_scope(self.container, binding), binding, instance)
+
+    def abandon(self, binding: TBinding) -> None:
+        self.get_pool(binding).cancel()
+
+    def clear(self) -> None:
+        for pool in self.pools.values():
+            pool.clear()
+
+    def after_fork_in_child(self) -> None:
+        for binding, pool in self.pools.items():
+            if binding.fork_policy == REBUILD_IN_CHILD:
+                pool.clear()
+
+
+def _require_scope(container: "Container", binding: TBinding) -> Scope:
+    scope = get_current_scope(container)
+    if scope is None:
+        raise ResolutionError(
+            f"{binding.concrete} is {binding.lifetime_strategy}: resolve it inside a container scope"
+        )
+    return scope
+
+
+def _forget_rebuilt_in_child(instances: Dict[TBinding, Any]) -> None:
+    for binding in list(instances):
+        if binding.fork_policy == REBUILD_IN_CHILD:
+            del instances[binding]
+
+
+TLifetimeFactory = Callable[["Container"], LifetimeStrategy]
+
+_registry: Dict[str, TLifetimeFactory] = {
+    NEW_EVERY_TIME: NewEveryTimeLifetime,
+    SINGLETON: SingletonLifetime,
+    SCOPED: ScopedLifetime,
+    THREAD_LOCAL: ThreadLocalLifetime,
+    POOLED: PooledLifetime,
+}
+
+
+def register_lifetime_strategy(name: str, factory: TLifetimeFactory) -> None:
+    """
+    Makes `name` usable as the `lifetime_strategy` of bindings. `factory` (usually a
+    `LifetimeStrategy` subclass) is called once per container with the container.
+    """
+    _registry[name] = factory
+
+
+def get_lifetime_strategy_factory(name: str) -> TLifetimeFactory:
+    try:
+        return _registry[name]
+    except KeyError:
+        raise BindingError(f"Unknown lifetime strategy: {name}") from None
@@ -0,0 +1,185 @@
+"""
+Memory retained by the singletons of a `Container`, to decide which ones to build before forking
+(see `Container.prepare_for_fork`), to make lazy, or to stop caching.
+
+    >>> accounting = SingletonMemory(container)
+    >>> with accounting:
+    >>>     container.make(App)
+    >>> print(accounting.format_table())
+
+While it is started, `SingletonMemory` measures every `SINGLETON` binding the container builds:
+
+    * with `tracemalloc` (started for the occasion if it isn't tracing already), as the memory
+      allocated while building the instance and still allocated once it's built. Singletons built
+      for it are accounted separately, not included.
+    * otherwise, or for instances bound with `bind_instance`, as an approximate deep size: the
+      `sys.getsizeof` of the objects reachable from the instance, except classes, functions,
+      modules and other singletons.
+
+Both are approximations: memory allocated by other threads while a singleton is built is counted
+against it, as are the signatures worked out when its class is first resolved. Only singletons
+built while accounting is started are measured, so start it before resolving anything.
+
+Accounting relies on a `ResolutionObserver`: it costs nothing once stopped.
+"""
+import gc
+import sys
+import threading
+import tracemalloc
+import types
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Set
+
+from touchstone.bindings import SINGLETON, InstanceFactory, TBinding
+from touchstone.container import ResolutionObserver
+from touchstone.lifetimes import SingletonLifetime
+from touchstone.utils import describe
+
+if TYPE_CHECKING:  # pragma: no cover
+    from touchstone.container import Container
+
+# What a deep size doesn't count: shared by everything rather than retained by one instance.
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+)
+
+
+@dataclass
+class SingletonSize:
+    abstract: str
+    concrete: str
+    size: int
+    # "tracemalloc" or "deep_size"
+    method: str
+
+
+class SingletonMemory(ResolutionObserver):
+    """
+    Measures the memory retained by the singletons `container` builds, see the module docstring.
+    With `use_tracemalloc=False`, sizes are always approximated by walking the instances.
+    """
+
+    def __init__(self, container: "Container", use_tracemalloc: bool = True) -> None:
+        self.container = container
+        self.use_tracemalloc = use_tracemalloc
+        self.sizes: Dict[TBinding, SingletonSize] = {}
+        self._local = threading.local()
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.container.remove_observer(self)
+        self.container.add_observer(self)
+
+    def stop(self) -> None:
+        self.container.remove_observer(self)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> "SingletonMemory":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def resolution_started(self, binding: TBinding, cache_hit: bool) -> None:
+        try:
+            stack = self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+        if cache_hit or binding.lifetime_strategy != SINGLETON:
+            stack.append(None)
+        else:
+            # [traced memory at the start, memory retained by the singletons built meanwhile]
+            stack.append([tracemalloc.get_traced_memory()[0], 0])
+
+    def resolution_finished(self, binding: TBinding, instance: Any) -> None:
+        frame = self._local.stack.pop()
+        if frame is None:
+            return
+        start, nested = frame
+        if (
+            self.use_tracemalloc
+            and tracemalloc.is_tracing()
+            and not isinstance(binding.concrete, InstanceFactory)
+        ):
+            total = tracemalloc.get_traced_memory()[0] - start
+            size, method = max(total - nested, 0), "tracemalloc"
+        else:
+            size, method = self._instance_size(binding, instance), "deep_size"
+            total = size
+        self.sizes[binding] = SingletonSize(
+            _describe(binding.abstract), _describe(binding.concrete), size, method
+        )
+        for parent in reversed(self._local.stack):
+            if parent is not None:
+                parent[1] += total
+                break
+
+    def resolution_failed(self, binding: TBinding, error: BaseException) -> None:
+        self._local.stack.pop()
+
+    def table(self) -> List[SingletonSize]:
+        """
+        Returns the measured singletons, largest first.
+        """
+        return sorted(self.sizes.values(), key=lambda entry: entry.size, reverse=True)
+
+    def format_table(self) -> str:
+        entries = self.table()
+        lines = [f"{'SIZE':>10}  {'METHOD':<11}  ABSTRACT -> CONCRETE"]
+        for entry in entries:
+            lines.append(
+                f"{_format_size(entry.size):>10}  {entry.method:<11}"
+                f"  {entry.abstract} -> {entry.concrete}"
+            )
+        total = sum(entry.size for entry in entries)
+        lines.append(f"{_format_size(total):>10}  total of {len(entries)} singletons")
+        return "\n".join(lines) + "\n"
+
+    def _instance_size(self, binding: TBinding, instance: Any) -> int:
+        lifetime = self.container.get_lifetime(SINGLETON)
+        singletons = lifetime.instances if isinstance(lifetime, SingletonLifetime) else {}
+        # Other singletons are accounted on their own.
+        seen: Set[int] = {id(other) for key, other in singletons.items() if key != binding}
+        seen.add(id(self.container))
+        return _deep_size(instance, seen)
+
+
+def _deep_size(obj: Any, seen: Set[int]) -> int:
+    size = 0
+    pending = [obj]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _describe(obj: Any) -> str:
+    if isinstance(obj, InstanceFactory):
+        return f"instance of {describe(type(obj.instance))}"
+    return describe(obj)
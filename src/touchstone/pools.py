@@ -0,0 +1,226 @@
+"""
+Bounded pools of instances, backing the `POOLED` lifetime strategy.
+
+A `POOLED` binding checks an instance out of its pool each time it is resolved, and returns it
+when the surrounding `Container.scope()` closes. Idle instances are reused as they are: their
+dependencies were resolved when they were first built.
+
+    >>> parsers = InstancePool(max_size=4, when_empty=BLOCK, timeout=5)
+    >>> container.bind(Parser, Parser, POOLED, pool=parsers)
+    >>> with container.scope():
+    >>>     parser = container.make(Parser)
+    >>> parsers.stats()
+    PoolStats(max_size=4, size=1, idle=1, in_use=0, checkouts=1, ...)
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from touchstone.exceptions import BindingError, ResolutionError
+
+# What `InstancePool.acquire` does when the pool is full and every instance is checked out.
+BLOCK = "block"  # Wait for an instance to be returned, for up to `timeout` seconds.
+OVERFLOW = "overflow"  # Build one more instance, which is discarded instead of being returned.
+
+# Returned by `InstancePool.acquire` when the caller should build a new instance.
+EMPTY = object()
+# Returned by `InstancePool.acquire(wait=False)` instead of waiting.
+WOULD_BLOCK = object()
+
+
+@dataclass
+class PoolStats:
+    max_size: int
+    # Live instances, idle or checked out.
+    size: int
+    idle: int
+    in_use: int
+    checkouts: int
+    overflows: int
+    waits: int
+    timeouts: int
+    # Seconds spent waiting for an instance to be returned, in total and at most.
+    wait_time: float
+    max_wait_time: float
+
+
+class InstancePool:
+    def __init__(
+        self, max_size: int = 10, when_empty: str = BLOCK, timeout: Optional[float] = None
+    ) -> None:
+        if max_size < 1:
+            raise BindingError(f"Pool size must be at least 1, not {max_size}")
+        if when_empty not in (BLOCK, OVERFLOW):
+            raise BindingError(f"Unknown pool policy: {when_empty}")
+        self.max_size = max_size
+        self.when_empty = when_empty
+        self.timeout = timeout
+        self._idle: List[Any] = []
+        self._size = 0
+        self._condition = threading.Condition(threading.Lock())
+        # The futures `aacquire` awaits, and their event loops.
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self._checkouts = 0
+        self._overflows = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def acquire(self, wait: bool = True) -> Any:
+        """
+        Checks out an idle instance, or returns `EMPTY` after making room for a new one, which the
+        caller must then build and eventually `release` (or `cancel`, if building it failed).
+
+        When the pool is full and the policy is `BLOCK`, waits for an instance to be returned and
+        raises `ResolutionError` after `timeout` seconds. Returns `WOULD_BLOCK` instead if `wait`
+        is false.
+        """
+        with self._condition:
+            if not self._idle and self._size >= self.max_size:
+                if self.when_empty == OVERFLOW:
+                    self._overflows += 1
+                elif not wait:
+                    return WOULD_BLOCK
+                else:
+                    self._wait()
+            self._checkouts += 1
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+            return EMPTY
+
+    async def aacquire(self) -> Any:
+        """
+        `acquire` for coroutines, waiting in the event loop rather than in a thread. The instance
+        is checked out without yielding to the loop, so cancelling the caller while it waits leaves
+        the pool as it was.
+        """
+        loop = asyncio.get_event_loop()
+        start = time.perf_counter()
+        deadline = None if self.timeout is None else start + self.timeout
+        waiter: Optional["asyncio.Future[None]"] = None
+        try:
+            while True:
+                instance = self.acquire(wait=False)
+                if instance is not WOULD_BLOCK:
+                    return instance
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                with self._condition:
+                    if self._idle or self._size < self.max_size:
+                        continue
+                    if remaining is not None and remaining <= 0:
+                        raise self._timed_out()
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+                try:
+                    await asyncio.wait_for(waiter, remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if waiter is not None:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                    self._record_wait(start)
+
+    def _wait(self) -> None:
+        start = time.perf_counter()
+        deadline = None if self.timeout is None else start + self.timeout
+        try:
+            while not self._idle and self._size >= self.max_size:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    raise self._timed_out()
+                self._condition.wait(remaining)
+        finally:
+            self._record_wait(start)
+
+    def _timed_out(self) -> ResolutionError:
+        self._timeouts += 1
+        return ResolutionError(
+            f"No pooled instance was returned within {self.timeout}s (pool size {self.max_size})"
+        )
+
+    def _record_wait(self, start: float) -> None:
+        waited = time.perf_counter() - start
+        self._waits += 1
+        self._wait_time += waited
+        self._max_wait_time = max(self._max_wait_time, waited)
+
+    def _notify(self) -> None:
+        # Wakes a waiting thread and every waiting coroutine: those which lose the race for the
+        # instance wait again.
+        self._condition.notify()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:  # The loop is closed
+                pass
+
+    def release(self, instance: Any) -> None:
+        """
+        Returns a checked out instance to the pool. Overflow instances are discarded.
+        """
+        with self._condition:
+            if self._size > self.max_size:
+                self._size -= 1
+            else:
+                self._idle.append(instance)
+            self._notify()
+
+    def cancel(self) -> None:
+        """
+        Gives back the room made by an `acquire` which returned `EMPTY`.
+        """
+        with self._condition:
+            self._size -= 1
+            self._notify()
+
+    def clear(self) -> None:
+        """
+        Discards the idle instances. Checked out instances are still returned to the pool.
+        """
+        with self._condition:
+            self._size -= len(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+            self._notify()
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                max_size=self.max_size,
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._size - len(self._idle),
+                checkouts=self._checkouts,
+                overflows=self._overflows,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                wait_time=self._wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Checkout:
+    """
+    Returns `instance` to `pool` on exit. Pushed on the scope an instance was checked out in.
+    """
+
+    __slots__ = ("pool", "instance")
+
+    def __init__(self, pool: InstancePool, instance: Any) -> None:
+        self.pool = pool
+        self.instance = instance
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.pool.release(self.instance)
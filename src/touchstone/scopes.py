@@ -0,0 +1,126 @@
+import contextvars
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from touchstone.bindings import TBinding
+from touchstone.exceptions import ResolutionError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from touchstone.container import Container
+
+ExcInfo = Tuple[Optional[Type[BaseException]], Optional[BaseException], Any]
+
+_current_scope: "contextvars.ContextVar[Optional[Scope]]" = contextvars.ContextVar(
+    "touchstone_scope", default=None
+)
+
+
+def get_current_scope(container: "Container") -> "Optional[Scope]":
+    """
+    Returns the innermost open scope of `container` in the current thread or asyncio task, if any.
+    """
+    scope = _current_scope.get()
+    while scope is not None and scope.container is not container:
+        scope = scope.parent
+    return scope
+
+
+class Scope:
+    """
+    Owns the resources (generator, async generator and context manager concretes) built while it
+    is the current scope of its container, and tears them down in reverse order of construction
+    when it closes. Use it as a (sync or async) context manager:
+
+        >>> with container.scope():
+        >>>     handler = container.make(Handler)
+        >>> # Every resource built for `handler` has been torn down.
+
+    Resources of `SINGLETON` bindings are owned by the container itself and torn down by
+    `Container.close()`. Other resources can only be resolved inside a scope.
+
+    If the scope is exited because of an exception, the exception is passed on to the teardown of
+    each resource, so e.g. a generator can roll back a transaction. Resources can't suppress it.
+    """
+
+    def __init__(self, container: "Container") -> None:
+        self.container = container
+        self.closed = False
+        self.parent: Optional[Scope] = None
+        # The instances of `SCOPED` bindings.
+        self.instances: Dict[TBinding, Any] = {}
+        self._resources: List[Tuple[TBinding, Any, bool]] = []
+        self._tokens: List[Any] = []
+
+    def push(self, binding: TBinding, context_manager: Any, is_async: bool) -> None:
+        """
+        Registers an entered `context_manager` for teardown when the scope closes.
+        """
+        self._resources.append((binding, context_manager, is_async))
+
+    def forget(self, predicate: Callable[[TBinding], bool]) -> None:
+        """
+        Stops tracking the resources of the bindings matching `predicate`, without tearing them
+        down. Used after a fork for the resources which belong to the parent process.
+        """
+        self._resources = [r for r in self._resources if not predicate(r[0])]
+
+    def close(self, exc_info: ExcInfo = (None, None, None)) -> None:
+        """
+        Tears down the resources of the scope. Raises if any of them is asynchronous: use `aclose`.
+        """
+        if any(is_async for _, _, is_async in self._resources):
+            raise ResolutionError("This scope holds asynchronous resources, close it with aclose()")
+        self.closed = True
+        self.instances.clear()
+        errors = []
+        while self._resources:
+            _, context_manager, _ = self._resources.pop()
+            try:
+                context_manager.__exit__(*exc_info)
+            except BaseException as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    async def aclose(self, exc_info: ExcInfo = (None, None, None)) -> None:
+        """
+        Tears down the resources of the scope, synchronous or not.
+        """
+        self.closed = True
+        self.instances.clear()
+        errors = []
+        while self._resources:
+            _, context_manager, is_async = self._resources.pop()
+            try:
+                if is_async:
+                    await context_manager.__aexit__(*exc_info)
+                else:
+                    context_manager.__exit__(*exc_info)
+            except BaseException as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def __enter__(self) -> "Scope":
+        if self.closed:
+            raise ResolutionError("Cannot reopen a closed scope")
+        self.parent = _current_scope.get()
+        self._tokens.append(_current_scope.set(self))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.deactivate()
+        self.close(exc_info)
+
+    def deactivate(self) -> None:
+        """
+        Stops being the current scope, without closing: for when resources must outlive the block
+        which used the scope, e.g. a streaming response. `close` it afterwards.
+        """
+        _current_scope.reset(self._tokens.pop())
+
+    async def __aenter__(self) -> "Scope":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.deactivate()
+        await self.aclose(exc_info)
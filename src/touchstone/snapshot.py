@@ -0,0 +1,82 @@
+"""
+Snapshots of a configured `Container`.
+
+A snapshot holds the binding tables of a container and the signature metadata of the concretes
+it resolves, so a process can restore a fully configured container in one bulk load instead of
+re-running its configuration code and re-introspecting signatures:
+
+    >>> with open("container.snapshot", "wb") as fp:
+    >>>     save_snapshot(build_container(), fp, roots=[App])
+    >>> # ...then, in every worker:
+    >>> with open("container.snapshot", "rb") as fp:
+    >>>     container = load_snapshot(fp)
+
+Concretes are stored by reference (their import path), so they must be importable module-level
+classes or functions. Lambdas, local functions and instances bound with `bind_instance` cannot be
+snapshotted.
+"""
+import pickle
+from typing import IO, Any, Dict, Iterable, Optional
+
+from touchstone.bindings import InstanceFactory, TAbstract, TBinding
+from touchstone.container import Container
+from touchstone.exceptions import BindingError
+from touchstone.utils import is_bound_container, is_picklable
+
+SNAPSHOT_VERSION = 1
+
+
+def save_snapshot(container: Container, fp: IO[bytes], roots: Iterable[TAbstract] = ()) -> None:
+    """
+    Writes a snapshot of `container` to `fp`. The signature of every bound concrete, of each
+    abstract in `roots` and of everything they depend on is introspected before writing.
+    """
+    container.bindings.compile(roots)
+    state = container.bindings.dump_state()
+
+    # Every container binds itself; the container being restored into takes that binding's place.
+    bindings = {
+        abstract: binding
+        for abstract, binding in state["bindings"].items()
+        if not is_bound_container(binding, container)
+    }
+    for binding in [*bindings.values(), *state["contextual_bindings"].values()]:
+        _check_snapshottable(binding)
+
+    state["bindings"] = bindings
+    # Signature metadata is only an optimization: entries which can't be stored by reference
+    # (local classes, unpicklable default values...) are introspected again after restoring.
+    state["signatures"] = {
+        concrete: params
+        for concrete, params in state["signatures"].items()
+        if is_picklable((concrete, params))
+    }
+    state["version"] = SNAPSHOT_VERSION
+    pickle.dump(state, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(fp: IO[bytes], container: Optional[Container] = None) -> Container:
+    """
+    Restores a snapshot written by `save_snapshot` into `container` (a new `Container` by default)
+    and returns it. Only load snapshots from trusted sources: they are pickles.
+    """
+    state: Dict[str, Any] = pickle.load(fp)
+    if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+        raise BindingError("Snapshot was written by an incompatible version of touchstone")
+
+    if container is None:
+        container = Container()
+    container.bindings.load_state(state)
+    return container
+
+
+def _check_snapshottable(binding: TBinding) -> None:
+    if isinstance(binding.concrete, InstanceFactory):
+        raise BindingError(
+            f"Cannot snapshot instance bound to {binding.abstract}: bind an importable factory instead"
+        )
+    if not is_picklable(binding):
+        raise BindingError(
+            f"Cannot snapshot binding of {binding.abstract} to {binding.concrete}: "
+            f"abstracts and concretes must be importable by path"
+        )
@@ -0,0 +1,128 @@
+"""
+Picklable specs of a configured `Container`, to hand it to worker processes started with the
+`spawn` (or `forkserver`) start method, which don't inherit the parent's memory:
+
+    >>> spec = ContainerSpec.from_container(
+    >>>     build_container(), roots=[App], per_process={Database: "myapp.db.connect"}
+    >>> )
+    >>> executor = ProcessPoolExecutor(
+    >>>     mp_context=multiprocessing.get_context("spawn"), initializer=init_worker, initargs=(spec,)
+    >>> )
+    >>> # ...then, in the functions running in the workers:
+    >>> app = get_worker_container().make(App)
+
+A spec holds, like a snapshot (see `touchstone.snapshot`), the binding tables and the signature
+metadata of the container, pickled once when the spec is made. Abstracts and concretes are
+referenced by import path. Instances bound with `bind_instance` are either shipped by value,
+pickled with the spec, or marked `per_process`: each worker builds its own, as a singleton, with
+the given factory (or the dotted path to one). Singletons the parent has built are not shipped.
+
+Pools of `POOLED` bindings are not part of a spec: workers use default-sized pools.
+"""
+import pickle
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from touchstone.bindings import SINGLETON, InstanceFactory, SimpleBinding, TAbstract, TConcrete
+from touchstone.container import Container
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.snapshot import SNAPSHOT_VERSION
+from touchstone.utils import import_string, is_bound_container, is_picklable
+
+# The container of this worker process, set up by `init_worker`.
+_worker_container: Optional[Container] = None
+
+
+class ContainerSpec:
+    """
+    The pickled bindings of a container. Pickling a spec only copies those bytes, so sending it
+    to each worker costs the same however large the container is.
+    """
+
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+
+    @classmethod
+    def from_container(
+        cls,
+        container: Container,
+        roots: Iterable[TAbstract] = (),
+        per_process: Optional[Mapping[TAbstract, Union[TConcrete, str]]] = None,
+    ) -> "ContainerSpec":
+        """
+        Makes the spec of `container`. The signature of every bound concrete, of each abstract in
+        `roots` and of everything they depend on is introspected first, so workers don't.
+        `per_process` maps abstracts to the factory each worker builds its singleton with, in place
+        of the instance bound in `container`.
+        """
+        if per_process is None:
+            per_process = {}
+        container.bindings.compile(roots)
+        state = container.bindings.dump_state()
+
+        bindings = {
+            abstract: binding
+            for abstract, binding in state["bindings"].items()
+            if not is_bound_container(binding, container)
+        }
+        # The per_process factories aren't bound in `container`: their signatures are introspected
+        # here, leaving its caches alone.
+        signatures = state["signatures"]
+        for abstract, factory in per_process.items():
+            if isinstance(factory, str):
+                factory = import_string(factory)
+            binding = SimpleBinding(abstract, factory, SINGLETON)
+            bindings[abstract] = binding
+            signatures.setdefault(factory, tuple(binding.get_concrete_params().items()))
+        for binding in [*bindings.values(), *state["contextual_bindings"].values()]:
+            if is_picklable(binding):
+                continue
+            if isinstance(binding.concrete, InstanceFactory):
+                raise BindingError(
+                    f"Cannot ship instance bound to {binding.abstract} by value: mark it "
+                    f"per_process with a factory building it in each worker"
+                )
+            raise BindingError(
+                f"Cannot spec binding of {binding.abstract} to {binding.concrete}: "
+                f"abstracts and concretes must be importable by path"
+            )
+
+        state["bindings"] = bindings
+        state["signatures"] = {
+            concrete: params
+            for concrete, params in signatures.items()
+            if is_picklable((concrete, params))
+        }
+        state["resolve_implementations"] = container.bindings.implementations is not None
+        state["version"] = SNAPSHOT_VERSION
+        return cls(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def build(self) -> Container:
+        """
+        Returns a new container configured from this spec. Only build specs from trusted sources:
+        they are pickles.
+        """
+        state: Dict[str, Any] = pickle.loads(self.payload)
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            raise BindingError("Spec was made by an incompatible version of touchstone")
+
+        container = Container(resolve_implementations=state["resolve_implementations"])
+        container.bindings.load_state(state)
+        return container
+
+
+def init_worker(spec: ContainerSpec) -> None:
+    """
+    Builds the container of a worker process from `spec`. Meant as the `initializer` of a
+    `ProcessPoolExecutor` or `multiprocessing.Pool`, with `initargs=(spec,)`.
+    """
+    global _worker_container
+    _worker_container = spec.build()
+
+
+def get_worker_container() -> Container:
+    """
+    Returns the container `init_worker` built for this process.
+    """
+    if _worker_container is None:
+        raise ResolutionError("This process has no container: start it with init_worker")
+    return _worker_container
@@ -0,0 +1,63 @@
+"""
+Helpers shared by the reporting, serialization and command line modules.
+"""
+import importlib
+import pickle
+from typing import TYPE_CHECKING, Any
+
+from touchstone.bindings import InstanceFactory, TBinding
+
+if TYPE_CHECKING:
+    from touchstone.container import Container
+
+
+def describe(obj: Any) -> str:
+    """
+    Returns the qualified name of a class or function (`module.QualName`, or just `QualName` for
+    builtins), or else a truncated repr, e.g. to label an abstract in reports.
+    """
+    qualname = getattr(obj, "__qualname__", None)
+    if qualname is None:
+        return repr(obj)[:80]
+    module = getattr(obj, "__module__", None)
+    return f"{module}.{qualname}" if module and module != "builtins" else qualname
+
+
+def escape_label(text: str) -> str:
+    """
+    Escapes `text` for a double-quoted label value, as in Graphviz DOT or Prometheus.
+    """
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def import_string(dotted_path: str) -> Any:
+    """
+    Imports `module.attribute` and returns the attribute.
+    """
+    module_path, _, name = dotted_path.rpartition(".")
+    if not module_path:
+        raise ImportError(f"{dotted_path} is not a dotted path to a module attribute")
+    module = importlib.import_module(module_path)
+    try:
+        return getattr(module, name)
+    except AttributeError as e:
+        raise ImportError(f"Module {module_path} has no attribute {name}") from e
+
+
+def is_picklable(obj: Any) -> bool:
+    """
+    Returns whether `obj` can be pickled, e.g. whether the classes and functions it refers to are
+    importable by path.
+    """
+    try:
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def is_bound_container(binding: TBinding, container: "Container") -> bool:
+    """
+    Returns whether `binding` is the binding of `container` to itself, which every container has.
+    """
+    return isinstance(binding.concrete, InstanceFactory) and binding.concrete.instance is container
@@ -0,0 +1,156 @@
+from typing import Callable
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import request_started
+from django.test import override_settings
+from django.http import HttpRequest
+from django.urls import include, path
+from django.views import View
+import touchstone.django
+from touchstone import SINGLETON, Container
+from touchstone.django.apps import (
+    WARM_UP_UID,
+    TouchstoneConfig,
+    _warm_up_on_first_request,
+    check_dependencies,
+    warm_up,
+)
+from touchstone.django.properties import MagicProperty, get_container, inject_magic_properties
+from touchstone.django.views import PLAN_ATTRIBUTE
+from touchstone.injection import InjectionPlan
+
+
+class Clock:
+    pass
+
+
+class Repository:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+class Broken:
+    def __init__(self, factory: Callable[[], int]) -> None:
+        pass
+
+
+class OrderView(View):
+    repository: Repository
+
+
+def order_detail(request: HttpRequest, pk: int, repository: Repository):
+    pass
+
+
+def broken_view(request: HttpRequest, broken: Broken):
+    pass
+
+
+class urls:
+    urlpatterns = [
+        path("orders/", OrderView.as_view()),
+        path("orders/<int:pk>/", include([path("", order_detail)])),
+    ]
+
+
+class broken_urls:
+    urlpatterns = [path("broken/", broken_view)]
+
+
+def make_container():
+    container = Container()
+    container.bind(Clock, Clock, SINGLETON)
+    return container
+
+
+@pytest.fixture(autouse=True)
+def registries():
+    with patch("touchstone.django.apps.get_injected_classes", return_value=[]) as classes, patch(
+        "touchstone.django.apps.get_injection_plans", return_value=[]
+    ) as plans:
+        yield classes, plans
+
+
+class TestWarmUp:
+    def test_compiles_views(self, registries):
+        classes, _ = registries
+        container = make_container()
+        classes.side_effect = lambda: [OrderView]
+
+        assert warm_up(container, urls) == []
+        assert isinstance(OrderView.repository, MagicProperty)
+        assert OrderView.repository._plan is not None
+        assert getattr(order_detail, PLAN_ATTRIBUTE).injected[-1][0] == "repository"
+        compilations = dict(container.bindings.compilations)
+        assert compilations["magic_property"] == 1
+        assert compilations["signature"] >= 2
+
+        # The first request doesn't compile anything more.
+        with patch("touchstone.django.properties.get_container", return_value=container):
+            OrderView().repository
+        assert container.bindings.compilations == compilations
+
+    def test_reports_unresolvable_dependencies(self, registries):
+        classes, plans = registries
+
+        class Task:
+            broken: Callable[[], int]
+
+        def run(self, requests, repository: Repository, broken: Broken):
+            pass
+
+        inject_magic_properties(Task)
+        classes.return_value = [Task]
+        plans.return_value = [(InjectionPlan(run), 2)]
+
+        errors = warm_up(make_container(), broken_urls)
+        # `Broken` is walked once, for the view and the plan.
+        assert len(errors) == 2
+        assert errors[0].startswith("unresolvable: Can't resolve broken: typing.Callable")
+        assert errors[1].startswith("unresolvable: Can't resolve factory: typing.Callable")
+
+
+class TestTouchstoneConfig:
+    def test_ready_does_not_import_the_urlconf(self):
+        config = TouchstoneConfig("touchstone.django", touchstone.django)
+        with patch("touchstone.django.apps.warm_up") as warm_up, patch(
+            "touchstone.django.apps.checks.register"
+        ) as register:
+            config.ready()
+        warm_up.assert_not_called()
+        register.assert_called_once_with(check_dependencies, "urls")
+        request_started.disconnect(dispatch_uid=WARM_UP_UID)
+
+    def test_check_reports_unresolvable_dependencies(self):
+        with patch("touchstone.django.apps.get_container"), patch(
+            "touchstone.django.apps.warm_up", return_value=["unresolvable: boom"]
+        ):
+            errors = check_dependencies()
+        assert [error.id for error in errors] == ["touchstone.E002"]
+        assert errors[0].msg.endswith("unresolvable: boom")
+
+    @override_settings()
+    def test_check_reports_a_missing_container_getter(self):
+        del settings.TOUCHSTONE_CONTAINER_GETTER
+        errors = check_dependencies()
+        assert [error.id for error in errors] == ["touchstone.E001"]
+        assert "TOUCHSTONE_CONTAINER_GETTER" in errors[0].msg
+
+    def test_first_request_warms_up_once(self):
+        request_started.connect(_warm_up_on_first_request, dispatch_uid=WARM_UP_UID)
+        with patch("touchstone.django.apps.check_dependencies") as check, patch(
+            "touchstone.django.apps._warmed_up", False
+        ):
+            request_started.send(sender=None)
+            request_started.send(sender=None)
+        check.assert_called_once_with()
+
+
+@override_settings()
+def test_get_container_requires_a_getter():
+    del settings.TOUCHSTONE_CONTAINER_GETTER
+    with pytest.raises(ImproperlyConfigured, match="TOUCHSTONE_CONTAINER_GETTER"):
+        get_container()
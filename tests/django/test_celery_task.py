@@ -1,7 +1,12 @@
 from unittest.mock import patch
 
-from touchstone import Container
-from touchstone.django.celery_task import touchstone_task
+import celery
+from touchstone import SCOPED, SINGLETON, Container
+from touchstone.django.celery_task import (
+    touchstone_batch_task,
+    touchstone_bulk_task,
+    touchstone_task,
+)
 
 
 class SampleOne:
@@ -27,3 +32,72 @@ class TestTouchstoneTask:
         task = touchstone_task(TaskFoo)
         assert type(task.sample_one) is SampleOne
         assert type(task.sample_two) is SampleTwo
+
+
+class Connection:
+    pass
+
+
+class Batches:
+    def __init__(self) -> None:
+        self.items = []
+
+
+class Index:
+    def __init__(self, connection: Connection, batches: Batches) -> None:
+        self.connection = connection
+        self.batches = batches
+
+    def add_many(self, requests):
+        self.batches.items.append(requests)
+        return len(requests)
+
+
+def make_container(events):
+    def connect():
+        events.append("open")
+        yield Connection()
+        events.append("close")
+
+    container = Container()
+    container.bind(Connection, connect, SCOPED)
+    container.bind(Batches, Batches, SINGLETON)
+    return container
+
+
+@patch("touchstone.django.properties.get_container")
+@patch("touchstone.django.celery_task.get_container")
+class TestTouchstoneBatchTask:
+    def test_dependencies_are_resolved_once_per_batch(self, mock_container, mock_container_props):
+        events = []
+        container = make_container(events)
+        mock_container.return_value = container
+        mock_container_props.return_value = container
+
+        @touchstone_batch_task(base=celery.Task, flush_every=50)
+        class IndexDocuments:
+            sample_one: SampleOne
+
+            def run(self, requests, index: Index, connection: Connection):
+                assert index.connection is connection
+                assert events[-1] == "open"
+                return index.add_many(requests)
+
+        assert IndexDocuments.flush_every == 50
+        assert IndexDocuments.name == f"{__name__}.IndexDocuments"
+        assert type(IndexDocuments.sample_one) is SampleOne
+        assert IndexDocuments.run(["a", "b"]) == 2
+        assert events == ["open", "close"]
+        IndexDocuments.run(["c"])
+        assert container.make(Batches).items == [["a", "b"], ["c"]]
+        assert events == ["open", "close", "open", "close"]
+
+    def test_bulk_task(self, mock_container, mock_container_props):
+        container = make_container([])
+        mock_container.return_value = container
+        mock_container_props.return_value = container
+
+        task = touchstone_bulk_task(Index, "add_many", base=celery.Task)
+        assert task.name == f"{__name__}.Index.add_many"
+        assert task.run(["a", "b", "c"]) == 3
+        assert container.make(Batches).items == [["a", "b", "c"]]
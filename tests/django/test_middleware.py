@@ -1,9 +1,21 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import AsyncClient, Client, override_settings
+from django.urls import path
 from django.views import View
 from rest_framework.viewsets import ViewSet
-from touchstone.django import InjectViewsMiddleware
+from touchstone import SCOPED, Container
+from touchstone.django import InjectViewsMiddleware, RequestScopeMiddleware
+from touchstone.exceptions import ResolutionError
 
 
 class MyAbc:
@@ -28,6 +40,20 @@ class DRFViewSet(ViewSet):
         return self.obj
 
 
+async def aget_response(request):
+    return HttpResponse()
+
+
+def order_detail(request: HttpRequest, pk: int, obj: MyAbc):
+    return JsonResponse(
+        {"obj": type(obj).__name__, "url_kwargs": sorted(request.resolver_match.kwargs)}
+    )
+
+
+class urls:
+    urlpatterns = [path("orders/<int:pk>/", order_detail)]
+
+
 class TestInjectViewsMiddleware:
     def test_process_view_django_style(self):
         view_func = DjangoView.as_view()
@@ -51,3 +77,237 @@ class TestInjectViewsMiddleware:
             middleware.process_view(request, view_func, [], {})
 
         mock_inject_magic_properties.assert_called_once_with(DRFViewSet)
+
+    def test_process_view_function_based(self):
+        def view_func(request: HttpRequest, pk: int, obj: MyAbc, extra: MyAbc = None):
+            pass
+
+        container = Container()
+        container.bind(MyAbc, MyCls)
+        view_kwargs = {"extra": "from the url"}
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            middleware = InjectViewsMiddleware(MagicMock())
+            middleware.process_view(HttpRequest(), view_func, [1], view_kwargs)
+
+        assert isinstance(view_kwargs.pop("obj"), MyCls)
+        assert view_kwargs == {"extra": "from the url"}
+
+    def test_url_kwargs_are_left_alone(self):
+        container = Container()
+        container.bind(MyAbc, MyCls)
+        with override_settings(
+            ROOT_URLCONF=urls,
+            ALLOWED_HOSTS=["testserver"],
+            MIDDLEWARE=["touchstone.django.InjectViewsMiddleware"],
+        ), mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            response = Client().get("/orders/1/")
+            async_response = asyncio.run(AsyncClient().get("/orders/1/"))
+
+        assert response.json() == {"obj": "MyCls", "url_kwargs": ["pk"]}
+        assert async_response.json() == {"obj": "MyCls", "url_kwargs": ["pk"]}
+
+    def test_process_view_function_based_without_dependencies(self):
+        def view_func(request, pk):
+            pass
+
+        with mock.patch("touchstone.django.middleware.get_container") as mock_get_container:
+            middleware = InjectViewsMiddleware(MagicMock())
+            view_kwargs = {"pk": 1}
+            middleware.process_view(HttpRequest(), view_func, [], view_kwargs)
+
+        assert view_kwargs == {"pk": 1}
+        mock_get_container.assert_not_called()
+
+    def test_async_mode(self):
+        middleware = InjectViewsMiddleware(aget_response)
+        assert InjectViewsMiddleware.async_capable
+        assert iscoroutinefunction(middleware)
+        assert iscoroutinefunction(middleware.process_view)
+        assert asyncio.run(middleware(HttpRequest())).status_code == 200
+
+    def test_process_view_async_view(self):
+        async def connect():
+            return MyCls()
+
+        async def view_func(request: HttpRequest, obj: MyAbc):
+            pass
+
+        container = Container()
+        container.bind(MyAbc, connect)
+        view_kwargs = {}
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            middleware = InjectViewsMiddleware(aget_response)
+            asyncio.run(middleware.process_view(HttpRequest(), view_func, [], view_kwargs))
+
+        assert isinstance(view_kwargs["obj"], MyCls)
+
+    def test_process_view_sync_view_in_async_mode(self):
+        threads = []
+
+        def connect():
+            threads.append(threading.current_thread())
+            return MyCls()
+
+        def view_func(request: HttpRequest, obj: MyAbc):
+            pass
+
+        container = Container()
+        container.bind(MyAbc, connect)
+        view_kwargs = {}
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            middleware = InjectViewsMiddleware(aget_response)
+            asyncio.run(middleware.process_view(HttpRequest(), view_func, [], view_kwargs))
+
+        assert isinstance(view_kwargs["obj"], MyCls)
+        # Resolved in Django's sync thread, where the view runs.
+        assert threads != [threading.main_thread()]
+
+
+def test_asgiref_is_optional():
+    # Django < 3.0 doesn't install asgiref, and only runs middleware synchronously.
+    code = (
+        "import sys, django.http; sys.modules['asgiref.sync'] = None; "
+        "from touchstone.django import RequestScopeMiddleware, InjectViewsMiddleware; "
+        "assert not InjectViewsMiddleware(lambda request: None).is_async"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+class RequestService:
+    pass
+
+
+def make_scoped_container(events):
+    def connect():
+        events.append("open")
+        yield MyCls()
+        events.append("close")
+
+    container = Container()
+    container.bind(RequestService, RequestService, SCOPED)
+    container.bind(MyAbc, connect)
+    return container
+
+
+class TestRequestScopeMiddleware:
+    def test_one_instance_per_request(self):
+        events = []
+        container = make_scoped_container(events)
+        seen = []
+
+        def get_response(request):
+            seen.append((container.make(RequestService), container.make(RequestService)))
+            container.make(MyAbc)
+            assert events[-1] == "open"
+            return HttpResponse()
+
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            middleware = RequestScopeMiddleware(get_response)
+            middleware(HttpRequest())
+            middleware(HttpRequest())
+
+        (first, same), (second, _) = seen
+        assert first is same
+        assert first is not second
+        assert events == ["open", "close", "open", "close"]
+        with pytest.raises(ResolutionError):
+            container.make(RequestService)
+
+    def test_view_exceptions_are_passed_to_teardown(self):
+        seen = []
+
+        def connect():
+            try:
+                yield MyCls()
+            except ValueError as e:
+                seen.append(e)
+                raise
+
+        container = Container()
+        container.bind(MyAbc, connect)
+        error = ValueError("boom")
+
+        def get_response(request):
+            container.make(MyAbc)
+            # What Django does when the view raises.
+            middleware.process_exception(request, error)
+            return HttpResponse(status=500)
+
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            middleware = RequestScopeMiddleware(get_response)
+            assert middleware(HttpRequest()).status_code == 500
+        assert seen == [error]
+
+    def test_streaming_responses_close_the_scope(self):
+        events = []
+        container = make_scoped_container(events)
+
+        def get_response(request):
+            obj = container.make(MyAbc)
+            return StreamingHttpResponse(str(obj is not None) for _ in range(2))
+
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            response = RequestScopeMiddleware(get_response)(HttpRequest())
+        assert events == ["open"]
+        assert b"".join(response) == b"TrueTrue"
+        response.close()
+        assert events == ["open", "close"]
+
+    def test_async_mode(self):
+        events = []
+
+        async def connect():
+            events.append("open")
+            yield MyCls()
+            events.append("close")
+
+        container = Container()
+        container.bind(RequestService, RequestService, SCOPED)
+        container.bind(MyAbc, connect)
+        seen = []
+
+        async def get_response(request):
+            service = await container.amake(RequestService)
+            seen.append(service)
+            await container.amake(MyAbc)
+            await asyncio.sleep(0)
+            assert await container.amake(RequestService) is service
+            return HttpResponse()
+
+        async def main():
+            middleware = RequestScopeMiddleware(get_response)
+            assert iscoroutinefunction(middleware)
+            await asyncio.gather(middleware(HttpRequest()), middleware(HttpRequest()))
+
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            asyncio.run(main())
+
+        first, second = seen
+        assert first is not second
+        assert events == ["open", "open", "close", "close"]
+
+    def test_async_mode_streaming_responses_close_the_scope(self):
+        events = []
+
+        async def connect():
+            events.append("open")
+            yield MyCls()
+            events.append("close")
+
+        container = Container()
+        container.bind(MyAbc, connect)
+
+        async def get_response(request):
+            await container.amake(MyAbc)
+            return StreamingHttpResponse(["a", "b"])
+
+        async def main():
+            response = await RequestScopeMiddleware(get_response)(HttpRequest())
+            assert events == ["open"]
+            # What `ASGIHandler` does once the response is sent.
+            await sync_to_async(response.close)()
+
+        with mock.patch("touchstone.django.middleware.get_container", return_value=container):
+            asyncio.run(main())
+        assert events == ["open", "close"]
@@ -1,9 +1,14 @@
+import gc
 from unittest.mock import patch
 
 import pytest
-from touchstone import Container
+from touchstone import SCOPED, SINGLETON, Container
 from touchstone.bindings import AnnotationHint
-from touchstone.django.properties import MagicProperty, inject_magic_properties
+from touchstone.django.properties import (
+    MagicProperty,
+    SlottedMagicProperty,
+    inject_magic_properties,
+)
 
 
 class MyAbc:
@@ -82,6 +87,111 @@ class TestInjectMagicProperties:
 
             assert thing.obj is late_bound_obj
 
+    def test_inject_magic_properties_compiles_with_container(self):
+        class Thing:
+            obj: MyAbc
+
+        container = Container()
+        container.bind(MyAbc, MyCls)
+        inject_magic_properties(Thing, container)
+        assert Thing.obj._plan[2] is container.bindings.resolve_binding(MyAbc)
+
+        with patch("touchstone.django.properties.get_container", return_value=container):
+            assert isinstance(Thing().obj, MyCls)
+            # Rebinding invalidates the compiled binding.
+            container.bind(MyAbc, MyAbc)
+            assert type(Thing().obj) is MyAbc
+
+    def test_containers_stop_injecting_magic_properties(self):
+        class Thing:
+            obj: MyAbc
+
+        container = Container()
+        container.bind(MyAbc, MyCls)
+        assert isinstance(container.make(Thing).__dict__["obj"], MyCls)
+
+        inject_magic_properties(Thing, container)
+        # The magic property resolves it on access instead.
+        assert "obj" not in vars(container.make(Thing))
+
+    def test_inject_magic_properties_slots(self):
+        class Thing:
+            __slots__ = ("obj", "other")
+            obj: MyAbc
+
+        container = Container()
+        container.bind(MyAbc, MyCls)
+        with patch("touchstone.django.properties.get_container", return_value=container):
+            inject_magic_properties(Thing)
+            assert isinstance(Thing.obj, SlottedMagicProperty)
+            assert not isinstance(vars(Thing)["other"], MagicProperty)
+
+            thing = Thing()
+            first = thing.obj
+            assert isinstance(first, MyCls)
+            assert thing.obj is first
+            assert Thing().obj is not first
+
+            replacement = MyCls()
+            thing.obj = replacement
+            assert thing.obj is replacement
+            del thing.obj
+            assert thing.obj is not replacement
+
+    def test_inject_magic_properties_slots_weak_side_table(self):
+        class Thing:
+            __slots__ = ("__weakref__",)
+            obj: MyAbc
+
+        container = Container()
+        container.bind(MyAbc, MyCls)
+        with patch("touchstone.django.properties.get_container", return_value=container):
+            inject_magic_properties(Thing)
+            thing = Thing()
+            first = thing.obj
+            assert isinstance(first, MyCls)
+            assert thing.obj is first
+            assert Thing().obj is not first
+
+        assert len(Thing.obj._instances) == 1
+        del thing
+        gc.collect()
+        assert Thing.obj._instances == {}
+
+    def test_inject_magic_properties_slots_without_storage(self):
+        class Thing:
+            __slots__ = ()
+            obj: MyAbc
+
+        with pytest.raises(TypeError, match="Add 'obj' or '__weakref__' to its __slots__"):
+            inject_magic_properties(Thing)
+
+    def test_inject_magic_properties_slots_scoped_results_are_not_cached(self):
+        class Thing:
+            __slots__ = ("obj",)
+            obj: MyAbc
+
+        container = Container()
+        container.bind(MyAbc, MyCls, SCOPED)
+        with patch("touchstone.django.properties.get_container", return_value=container):
+            inject_magic_properties(Thing, container)
+            thing = Thing()
+            with container.scope():
+                first = thing.obj
+            with container.scope():
+                assert thing.obj is not first
+
+    def test_inject_magic_properties_slots_singleton(self):
+        class Thing:
+            __slots__ = ("obj",)
+            obj: MyAbc
+
+        container = Container()
+        container.bind(MyAbc, MyCls, SINGLETON)
+        with patch("touchstone.django.properties.get_container", return_value=container):
+            inject_magic_properties(Thing)
+            assert Thing().obj is Thing().obj
+
 
 class TestMagicProperty:
     @patch("touchstone.django.properties.get_container")
@@ -151,6 +261,27 @@ class TestMagicProperty:
         owner_2_prop = Owner().prop
         assert owner_1_prop is not owner_2_prop
 
+    @patch("touchstone.django.properties.get_container")
+    def test__get__scoped_results_are_not_cached(self, mock_get_container):
+        class Owner:
+            pass
+
+        prop = MagicProperty(abstract=MyCls, default_value=AnnotationHint.NO_DEFAULT_VALUE)
+        prop.__set_name__(Owner, "prop")
+        Owner.prop = prop
+
+        container = Container()
+        container.bind(MyCls, MyCls, SCOPED)
+        mock_get_container.return_value = container
+
+        owner = Owner()
+        with container.scope():
+            first = owner.prop
+            assert owner.prop is first
+            assert Owner().prop is first
+        with container.scope():
+            assert owner.prop is not first
+
     def test__set_name__sets_name(self):
         class Owner:
             pass
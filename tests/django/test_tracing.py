@@ -0,0 +1,181 @@
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest, HttpResponse
+from django.test import override_settings
+from touchstone import SINGLETON, Container
+from touchstone.django.properties import inject_magic_properties
+from touchstone.django.tracing import (
+    ResolutionTraceMiddleware,
+    resolution_traces_view,
+    tracer,
+)
+
+
+class Settings:
+    pass
+
+
+class Service:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Broken:
+    def __init__(self) -> None:
+        raise ValueError("broken")
+
+
+class Page:
+    service: Service
+
+
+@pytest.fixture(autouse=True)
+def clear_traces():
+    tracer.traces.clear()
+    yield
+    tracer.traces.clear()
+
+
+def make_container():
+    container = Container()
+    container.bind(Settings, Settings, SINGLETON)
+    return container
+
+
+def make_request(path="/"):
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = path
+    return request
+
+
+def staff_request():
+    request = make_request("/traces/")
+    request.user = MagicMock(is_active=True, is_staff=True)
+    return request
+
+
+class TestResolutionTraceMiddleware:
+    def test_records_resolutions(self):
+        container = make_container()
+        container.make(Settings)
+
+        def get_response(request):
+            container.make(Service)
+            return HttpResponse(status=201)
+
+        with patch("touchstone.django.tracing.get_container", return_value=container):
+            middleware = ResolutionTraceMiddleware(get_response)
+        middleware(make_request("/first/"))
+
+        (trace,) = tracer.traces
+        assert (trace.method, trace.path, trace.status_code) == ("GET", "/first/", 201)
+        assert trace.duration > 0
+        service, settings = trace.entries
+        assert (service.abstract, service.kind, service.lifetime) == (
+            f"{__name__}.Service",
+            "auto",
+            "new_every_time",
+        )
+        assert (service.depth, service.cache_hit) == (0, False)
+        assert (settings.abstract, settings.kind, settings.lifetime) == (
+            f"{__name__}.Settings",
+            "simple",
+            "singleton",
+        )
+        assert (settings.depth, settings.cache_hit) == (1, True)
+        assert service.duration >= settings.duration > 0
+
+    def test_magic_properties_and_failures_are_recorded(self):
+        container = make_container()
+
+        def get_response(request):
+            with patch("touchstone.django.properties.get_container", return_value=container):
+                inject_magic_properties(Page)
+                Page().service
+            with pytest.raises(ValueError):
+                container.make(Broken)
+            return HttpResponse()
+
+        with patch("touchstone.django.tracing.get_container", return_value=container):
+            middleware = ResolutionTraceMiddleware(get_response)
+        middleware(make_request())
+
+        (trace,) = tracer.traces
+        assert [entry.abstract for entry in trace.entries] == [
+            f"{__name__}.Service",
+            f"{__name__}.Settings",
+            f"{__name__}.Broken",
+        ]
+        assert trace.entries[-1].error == "ValueError('broken')"
+
+    def test_nothing_is_recorded_outside_requests(self):
+        container = make_container()
+        with patch("touchstone.django.tracing.get_container", return_value=container):
+            ResolutionTraceMiddleware(MagicMock())
+            ResolutionTraceMiddleware(MagicMock())
+        # The tracer is added once, however many times the middleware is instantiated.
+        assert container._observers == (tracer,)
+        container.make(Service)
+        assert list(tracer.traces) == []
+
+    def test_ring_buffer(self):
+        container = make_container()
+        with override_settings(TOUCHSTONE_TRACE_SIZE=2), patch(
+            "touchstone.django.tracing.get_container", return_value=container
+        ):
+            middleware = ResolutionTraceMiddleware(lambda request: HttpResponse())
+        for path in ("/1/", "/2/", "/3/"):
+            middleware(make_request(path))
+        assert [trace.path for trace in tracer.traces] == ["/2/", "/3/"]
+
+    def test_async_mode(self):
+        container = make_container()
+
+        async def get_response(request):
+            await container.amake(Service)
+            return HttpResponse()
+
+        with patch("touchstone.django.tracing.get_container", return_value=container):
+            middleware = ResolutionTraceMiddleware(get_response)
+        asyncio.run(middleware(make_request()))
+
+        (trace,) = tracer.traces
+        assert [entry.depth for entry in trace.entries] == [0, 1]
+
+
+class TestResolutionTracesView:
+    def test_staff_only(self):
+        request = make_request()
+        with pytest.raises(PermissionDenied):
+            resolution_traces_view(request)
+        request.user = MagicMock(is_active=True, is_staff=False)
+        with pytest.raises(PermissionDenied):
+            resolution_traces_view(request)
+
+    def test_dumps_traces_most_recent_first(self):
+        container = make_container()
+        with patch("touchstone.django.tracing.get_container", return_value=container):
+            middleware = ResolutionTraceMiddleware(
+                lambda request: HttpResponse(container.make(Settings))
+            )
+        middleware(make_request("/1/"))
+        middleware(make_request("/2/"))
+
+        data = json.loads(resolution_traces_view(staff_request()).content)
+        assert [trace["path"] for trace in data["traces"]] == ["/2/", "/1/"]
+        assert data["traces"][0]["entries"] == [
+            {
+                "abstract": f"{__name__}.Settings",
+                "kind": "simple",
+                "lifetime": "singleton",
+                "cache_hit": True,
+                "duration": data["traces"][0]["entries"][0]["duration"],
+                "depth": 0,
+                "error": None,
+            }
+        ]
@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import patch
+
+from django.http import HttpRequest
+from touchstone import Container
+from touchstone.django.views import PLAN_ATTRIBUTE, get_view_plan, inject_view
+from touchstone.injection import InjectionPlan
+
+
+class MyAbc:
+    pass
+
+
+class MyCls(MyAbc):
+    pass
+
+
+def make_container():
+    container = Container()
+    container.bind(MyAbc, MyCls)
+    return container
+
+
+class TestGetViewPlan:
+    def test_plan_is_cached_on_the_function(self):
+        def view(request: HttpRequest, pk: int, obj: MyAbc):
+            pass
+
+        plan = get_view_plan(view)
+        assert [name for name, _, _ in plan.injected] == ["request", "pk", "obj"]
+        assert getattr(view, PLAN_ATTRIBUTE) is plan
+        assert get_view_plan(view) is plan
+
+    def test_plans_of_bound_methods_are_cached(self):
+        class OrderViews:
+            def detail(self, request: HttpRequest, obj: MyAbc):
+                pass
+
+        first, second = OrderViews(), OrderViews()
+        with patch("touchstone.django.views.InjectionPlan", wraps=InjectionPlan) as mock_plan:
+            plan = get_view_plan(first.detail)
+            assert get_view_plan(first.detail) is plan
+            assert get_view_plan(second.detail) is plan
+        mock_plan.assert_called_once()
+        assert [(name, position) for name, position, _ in plan.injected] == [
+            ("request", 0),
+            ("obj", 1),
+        ]
+        # Resolved in the context of the function, as for `bind_contextual(when=...)`.
+        assert plan.func is OrderViews.detail
+        # The function, called unbound, has a plan of its own.
+        assert [name for name, _, _ in get_view_plan(OrderViews.detail).injected] == [
+            "request",
+            "obj",
+        ]
+        assert get_view_plan(OrderViews.detail).injected[0][1] == 1
+
+    def test_views_without_annotations_have_no_plan(self):
+        def view(request, pk):
+            pass
+
+        assert get_view_plan(view) is None
+        assert get_view_plan(print) is None
+
+
+class TestInjectView:
+    def test_inject_view(self):
+        @inject_view
+        def view(request: HttpRequest, pk: int, obj: MyAbc):
+            return request, pk, obj
+
+        request = HttpRequest()
+        with patch("touchstone.django.views.get_container", return_value=make_container()):
+            assert view(request, 1)[:2] == (request, 1)
+            assert isinstance(view(request, pk=1)[2], MyCls)
+        # Nothing left for the middleware to do.
+        assert get_view_plan(view) is None
+
+    def test_contextual_bindings_refer_to_the_decorated_view(self):
+        @inject_view
+        def view(request: HttpRequest, obj: MyAbc):
+            return obj
+
+        container = make_container()
+        other = MyCls()
+        container.bind_contextual(when=view, wants=MyAbc, give=lambda: other)
+        with patch("touchstone.django.views.get_container", return_value=container):
+            assert view(HttpRequest()) is other
+
+    def test_inject_async_view(self):
+        @inject_view
+        async def view(request: HttpRequest, obj: MyAbc):
+            return obj
+
+        with patch("touchstone.django.views.get_container", return_value=make_container()):
+            assert isinstance(asyncio.run(view(HttpRequest())), MyCls)
@@ -1,14 +1,27 @@
+import abc
+import asyncio
+import copy
+import gc
 import inspect
+import sys
+import weakref
+from typing import ClassVar
+from unittest.mock import patch
 
+import pytest
 from touchstone.bindings import (
     NEW_EVERY_TIME,
+    SHARE,
     SINGLETON,
     AbstractBinding,
     AnnotationHint,
     AutoBinding,
     BindingResolver,
+    ConcreteCache,
     ContextualBinding,
+    ImplementationIndex,
     SimpleBinding,
+    _backport_asynccontextmanager,
 )
 
 
@@ -251,3 +264,353 @@ class TestBindingResolver:
         assert binding.parent is Thing
         assert binding.parent_name == "obj"
         assert binding.lifetime_strategy == NEW_EVERY_TIME
+
+    def test_get_params_introspects_each_concrete_once(self):
+        class Thing:
+            def __init__(self, obj: dict = None):
+                self.obj = obj
+
+        bindings = BindingResolver()
+        binding = bindings.resolve_binding(Thing)
+        with patch("touchstone.bindings.inspect.signature", wraps=inspect.signature) as signature:
+            params = bindings.get_params(binding)
+            assert bindings.get_params(bindings.resolve_binding(Thing)) is params
+
+        signature.assert_called_once_with(Thing)
+        assert params == (("obj", AnnotationHint(dict, None)),)
+
+    def test_compile_introspects_dependencies(self):
+        class Child:
+            pass
+
+        class Parent:
+            def __init__(self, child: Child):
+                self.child = child
+
+        bindings = BindingResolver()
+        bindings.compile([Parent])
+
+        with patch("touchstone.bindings.inspect.signature") as signature:
+            assert bindings.get_params(bindings.resolve_binding(Parent))[0][0] == "child"
+            assert bindings.get_params(bindings.resolve_binding(Child)) == ()
+        signature.assert_not_called()
+
+    def test_get_attrs_merges_annotations_along_the_mro(self):
+        class Child:
+            pass
+
+        class Mixin:
+            child: Child
+            overridden: Child
+            shadowed: Child
+
+        class Base:
+            base: Child
+
+        class Thing(Mixin, Base):
+            overridden: ClassVar[Child]
+            shadowed = None
+
+        bindings = BindingResolver()
+        attrs = bindings.get_attrs(bindings.resolve_binding(Thing))
+        assert attrs == (("base", Child), ("child", Child))
+
+    def test_get_attrs_is_cached_until_refreshed(self):
+        class Child:
+            pass
+
+        class Mixin:
+            child: Child
+
+        class Thing(Mixin):
+            pass
+
+        bindings = BindingResolver()
+        binding = bindings.resolve_binding(Thing)
+        attrs = bindings.get_attrs(binding)
+        assert attrs == (("child", Child),)
+        assert bindings.get_attrs(binding) is attrs
+
+        Mixin.child = Child()
+        assert bindings.get_attrs(binding) is attrs
+        bindings.refresh(Thing)
+        assert bindings.get_attrs(binding) == ()
+
+        del Mixin.child
+        bindings.refresh()
+        assert bindings.get_attrs(binding) == (("child", Child),)
+
+        Thing.__annotations__ = {"other": Child}
+        bindings.bind(Thing, Thing)
+        assert bindings.get_attrs(binding) == (("child", Child), ("other", Child))
+
+    def test_plans_do_not_keep_concretes_alive(self):
+        bindings = BindingResolver()
+
+        def resolve():
+            class Local:
+                def __init__(self, foo: dict = None):
+                    pass
+
+            binding = bindings.resolve_binding(Local)
+            bindings.get_params(binding)
+            bindings.get_attrs(binding)
+            bindings.get_factory(binding)
+            return weakref.ref(Local)
+
+        local = resolve()
+        gc.collect()
+        assert local() is None
+        assert len(bindings._signatures) == len(bindings._attrs) == len(bindings._factories) == 0
+
+    def test_default_values_are_not_cached(self):
+        bindings = BindingResolver()
+        for _ in range(3):
+            binding = bindings.resolve_binding(dict, ClassWithDefaults, "foo", {})
+            assert bindings.get_attrs(binding) == ()
+            assert bindings.get_factory(binding) == ("plain", binding.concrete)
+        assert len(bindings._attrs) == len(bindings._factories) == 0
+
+    def test_get_dependents(self):
+        class Clock:
+            pass
+
+        class Cache:
+            clock: Clock
+
+        class Store:
+            def __init__(self, cache: Cache, fallback: Clock = None) -> None:
+                pass
+
+        class Report:
+            def __init__(self, clock: Clock) -> None:
+                pass
+
+        class Unrelated:
+            pass
+
+        bindings = BindingResolver()
+        bindings.bind(Store, Store, SINGLETON)
+        bindings.bind_contextual(when=Report, wants=Clock, give=Clock)
+        candidates = [bindings.resolve_binding(cls) for cls in (Cache, Store, Report, Unrelated)]
+        cache, store, _, _ = candidates
+        # The default value and the contextual binding don't look `Clock` up.
+        assert bindings.get_dependents(Clock, candidates) == {cache, store}
+        assert bindings.get_dependents(Cache, candidates) == {store}
+        assert bindings.get_dependencies(store) == frozenset({Cache, Clock})
+
+    def test_override_restores_the_binding_and_the_index(self):
+        class Clock:
+            pass
+
+        class FakeClock(Clock):
+            pass
+
+        class Cache:
+            clock: Clock
+
+        bindings = BindingResolver()
+        bindings.bind(Clock, Clock, SINGLETON)
+        binding = bindings.resolve_binding(Clock)
+        cache = bindings.resolve_binding(Cache)
+        dependencies = bindings.get_dependencies(cache)
+
+        with bindings.override(Cache, Cache):
+            pass
+        assert bindings.get_dependencies(cache) is dependencies
+
+        with bindings.override(Clock, FakeClock) as fake:
+            assert bindings.resolve_binding(Clock) is fake
+            assert fake.concrete is FakeClock
+        assert bindings.resolve_binding(Clock) is binding
+
+        with bindings.override(FakeClock, Clock):
+            pass
+        assert bindings.resolve_binding(FakeClock).kind == "auto"
+
+
+def test_type_tables_are_module_sets():
+    from touchstone import bindings
+
+    assert type(bindings.BUILTIN_TYPES) is set and int in bindings.BUILTIN_TYPES
+    assert type(bindings.TYPING_TYPES) is set
+    assert bindings.BUILTIN_TYPES is bindings.BUILTIN_TYPES
+    with pytest.raises(AttributeError):
+        bindings.MISSING_TYPES
+
+
+class TestBackportAsyncContextManager:
+    def test_teardown(self):
+        events = []
+
+        @_backport_asynccontextmanager
+        async def resource():
+            events.append("open")
+            try:
+                yield "value"
+            except ValueError as e:
+                events.append(f"error {e}")
+                raise
+            finally:
+                events.append("close")
+
+        async def main():
+            async with resource() as value:
+                events.append(value)
+            with pytest.raises(ValueError, match="boom"):
+                async with resource():
+                    raise ValueError("boom")
+
+        asyncio.run(main())
+        assert events == ["open", "value", "close", "open", "error boom", "close"]
+
+    def test_generator_must_yield_once(self):
+        @_backport_asynccontextmanager
+        async def empty():
+            return
+            yield
+
+        @_backport_asynccontextmanager
+        async def twice():
+            yield 1
+            yield 2
+
+        async def enter(factory):
+            async with factory():
+                pass
+
+        with pytest.raises(RuntimeError, match="didn't yield"):
+            asyncio.run(enter(empty))
+        with pytest.raises(RuntimeError, match="didn't stop"):
+            asyncio.run(enter(twice))
+
+
+class TestConcreteCache:
+    def test_concretes_without_weak_references_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(ConcreteCache, "MAX_STRONG", 2)
+        cache = ConcreteCache()
+        assert cache.publish(1, "one") == "one"
+        assert cache.publish(1, "uno") == "one"
+        cache.publish(2, "two")
+        assert cache.plans() == {1: "one", 2: "two"}
+
+        cache.publish(3, "three")
+        assert cache.plans() == {3: "three"}
+        with pytest.raises(KeyError):
+            cache.lookup(1)
+
+    def test_discard(self):
+        cache = ConcreteCache()
+        cache.publish(dict, "dict")
+        cache.publish(1, "one")
+        assert cache.lookup(dict) == "dict"
+        cache.discard(dict)
+        cache.discard(1)
+        assert cache.plans() == {}
+
+
+class TestImplementationIndex:
+    def test_get_implementations(self):
+        class Interface(abc.ABC):
+            @abc.abstractmethod
+            def run(self):
+                pass
+
+        class Partial(Interface):
+            pass
+
+        class Left(Partial):
+            def run(self):
+                pass
+
+        class Right(Interface):
+            def run(self):
+                pass
+
+        class Both(Left, Right):
+            pass
+
+        index = ImplementationIndex()
+        assert index.get_implementations(Partial) == (Left, Both)
+        assert index.get_implementations(Interface) == (Left, Both, Right)
+        assert index.get_implementations(Right) == (Right, Both)
+
+    def test_lookups_are_cached(self):
+        class Interface(abc.ABC):
+            @abc.abstractmethod
+            def run(self):
+                pass
+
+        class Implementation(Interface):
+            def run(self):
+                pass
+
+        index = ImplementationIndex()
+        implementations = index.get_implementations(Interface)
+        assert implementations == (Implementation,)
+        with patch.object(Interface, "__subclasses__") as subclasses:
+            assert index.get_implementations(Interface) is implementations
+        subclasses.assert_not_called()
+
+    def test_subclasses_defined_after_a_lookup_are_found(self, monkeypatch):
+        class Interface(abc.ABC):
+            @abc.abstractmethod
+            def run(self):
+                pass
+
+        index = ImplementationIndex()
+        assert index.get_implementations(Interface) == ()
+
+        class Imported(Interface):
+            def run(self):
+                pass
+
+        # As if `Imported` was defined by a module imported since.
+        monkeypatch.setitem(sys.modules, "imported_implementation", None)
+        assert index.get_implementations(Interface) == (Imported,)
+
+        class Local(Interface):
+            def run(self):
+                pass
+
+        assert index.get_implementations(Interface) == (Imported,)
+        index.clear()
+        assert index.get_implementations(Interface) == (Imported, Local)
+
+
+class TestBindingLayout:
+    def test_bindings_have_no_instance_dict(self):
+        bindings = [
+            SimpleBinding(ClassWithDefaults, ClassWithDefaults, SINGLETON),
+            AutoBinding(ClassWithDefaults),
+            ContextualBinding(dict, dict, NEW_EVERY_TIME, ClassWithDefaults, "foo"),
+            AnnotationHint(dict, AnnotationHint.NO_DEFAULT_VALUE),
+        ]
+        for binding in bindings:
+            assert not hasattr(binding, "__dict__")
+
+    def test_bindings_are_immutable(self):
+        binding = SimpleBinding(ClassWithDefaults, ClassWithDefaults, SINGLETON)
+        with pytest.raises(AttributeError, match="immutable"):
+            binding.concrete = ClassWithoutDefaults
+        with pytest.raises(AttributeError, match="immutable"):
+            del binding.concrete
+        assert binding.concrete is ClassWithDefaults
+
+    def test_annotation_hint_is_immutable(self):
+        hint = AnnotationHint(dict, AnnotationHint.NO_DEFAULT_VALUE)
+        with pytest.raises(AttributeError):
+            hint.annotation = str
+
+    def test_hash_is_stable(self):
+        binding = ContextualBinding(dict, dict, NEW_EVERY_TIME, ClassWithDefaults, "foo")
+        assert hash(binding) == hash((dict, dict, NEW_EVERY_TIME, ClassWithDefaults, "foo", SHARE))
+        assert hash(binding) == hash(binding)
+
+    def test_bindings_can_be_copied(self):
+        binding = ContextualBinding(dict, dict, NEW_EVERY_TIME, ClassWithDefaults, "foo")
+        copied = copy.copy(binding)
+        assert copied is not binding
+        assert copied.parent is ClassWithDefaults
+        assert copied.parent_name == "foo"
+        assert hash(copied) == hash(binding)
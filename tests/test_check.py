@@ -0,0 +1,133 @@
+from touchstone.__main__ import main
+from touchstone.check import check_container
+from touchstone.container import REBUILD_IN_CHILD, SINGLETON, Container
+
+
+class Config:
+    pass
+
+
+class Connection:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config, connection: Connection):
+        self.config = config
+        self.connection = connection
+
+
+class Service:
+    def __init__(self, db: Database):
+        self.db = db
+
+
+class NeedsName:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Chicken:
+    def __init__(self, egg: "Egg"):  # noqa: F821
+        self.egg = egg
+
+
+class Egg:
+    def __init__(self, chicken: Chicken):
+        self.chicken = chicken
+
+
+def get_valid_container():
+    container = Container()
+    container.bind(Config, Config, SINGLETON)
+    container.bind(Database, Database, SINGLETON)
+    container.bind(Connection, Connection, SINGLETON)
+    return container
+
+
+def get_invalid_container():
+    container = Container()
+    container.bind("Egg", Egg)
+    container.bind_contextual(when=NeedsName, wants=int, wants_name="other", give=lambda: 1)
+    return container
+
+
+class TestCheckContainer:
+    def test_valid_container(self):
+        report = check_container(get_valid_container(), [Service])
+        assert report.errors == []
+        assert report.warnings == []
+        assert report.bindings == 4  # Including the container itself
+        (cost,) = report.roots
+        assert cost.root.endswith("Service")
+        assert cost.nodes == 4
+        assert cost.builds == 4
+        assert cost.depth == 3
+
+    def test_unresolvable_parameters(self):
+        report = check_container(get_invalid_container())
+        assert any("unresolvable" in error and "name" in error for error in report.errors)
+
+    def test_unresolvable_root(self):
+        report = check_container(Container(), [int])
+        assert report.errors == [f"unresolvable root: Can't resolve None: {int}"]
+
+    def test_cycles(self):
+        report = check_container(get_invalid_container(), [Chicken])
+        assert any(error.startswith("cycle:") for error in report.errors)
+
+    def test_singleton_depending_on_new_every_time(self):
+        container = Container()
+        container.bind(Database, Database, SINGLETON)
+        container.bind(Config, Config)
+        report = check_container(container)
+        (warning,) = report.warnings
+        assert "Database -> " in warning
+        assert "Config (config)" in warning
+
+    def test_shared_singleton_depending_on_rebuilt_singleton(self):
+        container = Container()
+        container.bind(Database, Database, SINGLETON)
+        container.bind(Connection, Connection, SINGLETON, fork_policy=REBUILD_IN_CHILD)
+        report = check_container(container)
+        (warning,) = report.warnings
+        assert "rebuilt in each child" in warning
+
+    def test_does_not_instantiate(self):
+        built = []
+
+        class Root:
+            def __init__(self, config: Config):
+                built.append(self)
+
+        container = Container()
+        container.bind(Root, Root, SINGLETON)
+        check_container(container, [Root])
+        assert built == []
+
+
+class TestCheckCommand:
+    def test_valid(self, capsys):
+        status = main(["check", f"{__name__}.get_valid_container", "--root", f"{__name__}.Service"])
+        out = capsys.readouterr().out
+        assert status == 0
+        assert "ROOT tests.test_check.Service: builds 4 objects from 4 bindings, depth 3" in out
+        assert "0 errors, 0 warnings" in out
+
+    def test_invalid(self, capsys):
+        status = main(["check", f"{__name__}.get_invalid_container"])
+        out = capsys.readouterr().out
+        assert status == 1
+        assert "ERROR unresolvable" in out
+
+    def test_strict(self, capsys):
+        status = main(["check", f"{__name__}.get_mismatched_container", "--strict"])
+        assert status == 1
+        assert "WARNING lifetime mismatch" in capsys.readouterr().out
+
+
+def get_mismatched_container():
+    container = Container()
+    container.bind(Database, Database, SINGLETON)
+    container.bind(Config, Config)
+    return container
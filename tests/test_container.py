@@ -1,11 +1,21 @@
 import abc
+import gc
+import os
 import re
+import threading
+import weakref
 from collections import namedtuple
 from dataclasses import dataclass
 from typing import IO, Callable, ClassVar, List, NamedTuple, Type, TypeVar
 
 import pytest
-from touchstone.container import SINGLETON, Container
+from touchstone.container import (
+    REBUILD_IN_CHILD,
+    SINGLETON,
+    THREAD_LOCAL,
+    Container,
+    ResolutionObserver,
+)
 from touchstone.exceptions import BindingError, ResolutionError
 
 
@@ -455,6 +465,25 @@ class TestContainer:
         y = container.make(Y)
         assert isinstance(y.foo, X)
 
+    def test_make_injects_class_annotations_of_base_classes(self):
+        class X:
+            pass
+
+        class X2(X):
+            pass
+
+        class Mixin:
+            foo: X
+            bar: X
+
+        class Y(Mixin):
+            bar: X2
+
+        container = Container()
+        y = container.make(Y)
+        assert type(y.foo) is X
+        assert type(y.bar) is X2
+
     def test_make_does_not_inject_class_annotations_if_hinted_in_init(self):
         class X1:
             pass
@@ -647,3 +676,394 @@ class TestContainer:
         obj = container.make(MyCls)
         assert isinstance(obj, MyCls)
         assert obj.name == "rho"
+
+
+class Repository(abc.ABC):
+    @abc.abstractmethod
+    def get(self):
+        pass
+
+
+class SqlRepository(Repository):
+    def get(self):
+        pass
+
+
+class Notifier(abc.ABC):
+    @abc.abstractmethod
+    def notify(self):
+        pass
+
+
+class EmailNotifier(Notifier):
+    def notify(self):
+        pass
+
+
+class SmsNotifier(Notifier):
+    def notify(self):
+        pass
+
+
+class Service:
+    def __init__(self, repository: Repository, notifier: Notifier):
+        self.repository = repository
+        self.notifier = notifier
+
+
+class TestContainerResolveImplementations:
+    def test_abstracts_resolve_to_their_sole_implementation(self):
+        container = Container(resolve_implementations=True)
+        container.bind(Notifier, EmailNotifier)
+        service = container.make(Service)
+        assert type(service.repository) is SqlRepository
+        assert type(service.notifier) is EmailNotifier
+
+    def test_disabled_by_default(self):
+        container = Container()
+        with pytest.raises(ResolutionError):
+            container.make(Repository)
+
+    def test_several_implementations(self):
+        container = Container(resolve_implementations=True)
+        with pytest.raises(
+            ResolutionError,
+            match=(
+                "It has several concrete subclasses "
+                r"\(EmailNotifier, SmsNotifier\): bind one of them"
+            ),
+        ):
+            container.make(Service)
+
+    def test_implementations_defined_after_resolution(self):
+        class Interface(abc.ABC):
+            @abc.abstractmethod
+            def run(self):
+                pass
+
+        container = Container(resolve_implementations=True)
+        with pytest.raises(ResolutionError, match="has no concrete subclass"):
+            container.make(Interface)
+
+        class First(Interface):
+            def run(self):
+                pass
+
+        # Classes defined at runtime, rather than by modules imported since, need a refresh.
+        container.refresh()
+        assert type(container.make(Interface)) is First
+
+        class Second(Interface):
+            def run(self):
+                pass
+
+        container.refresh()
+        with pytest.raises(ResolutionError, match="several concrete subclasses") as excinfo:
+            container.make(Interface)
+        assert "First, " in str(excinfo.value) and "Second)" in str(excinfo.value)
+
+    def test_bound_implementation_keeps_its_lifetime(self):
+        class Interface(abc.ABC):
+            @abc.abstractmethod
+            def run(self):
+                pass
+
+        class Implementation(Interface):
+            def run(self):
+                pass
+
+        container = Container(resolve_implementations=True)
+        container.bind(Implementation, Implementation, lifetime_strategy=SINGLETON)
+        assert container.make(Interface) is container.make(Implementation)
+        assert container.make(Interface) is container.make(Interface)
+
+    def test_no_implementation(self):
+        class Interface(abc.ABC):
+            @abc.abstractmethod
+            def run(self):
+                pass
+
+        container = Container(resolve_implementations=True)
+        with pytest.raises(ResolutionError, match="It is abstract and has no concrete subclass"):
+            container.make(Interface)
+
+
+class TestContainerForkPolicies:
+    def test_prepare_for_fork_builds_shared_singletons(self):
+        built = []
+
+        class Shared:
+            def __init__(self):
+                built.append(Shared)
+
+        class Unsafe:
+            def __init__(self):
+                built.append(Unsafe)
+
+        class Transient:
+            def __init__(self):
+                built.append(Transient)
+
+        container = Container()
+        container.bind(Shared, Shared, SINGLETON)
+        container.bind(Unsafe, Unsafe, SINGLETON, fork_policy=REBUILD_IN_CHILD)
+        container.bind(Transient, Transient)
+        container.prepare_for_fork(freeze_gc=False)
+
+        assert built == [Shared]
+        assert container.make(Shared) is container.make(Shared)
+        assert built == [Shared]
+
+    def test_prepare_for_fork_builds_contextual_singletons(self):
+        class X:
+            pass
+
+        class Y:
+            def __init__(self, x: X):
+                self.x = x
+
+        container = Container()
+        container.bind_contextual(when=Y, wants=X, give=X, lifetime_strategy=SINGLETON)
+        container.prepare_for_fork(freeze_gc=False)
+
+        # The container itself and the contextual X
+        assert len(container.get_lifetime(SINGLETON).instances) == 2
+        assert container.make(Y).x is container.make(Y).x
+
+    def test_after_fork_in_child_discards_unsafe_singletons(self):
+        class Shared:
+            pass
+
+        class Unsafe:
+            pass
+
+        container = Container()
+        container.bind(Shared, Shared, SINGLETON)
+        container.bind(Unsafe, Unsafe, SINGLETON, fork_policy=REBUILD_IN_CHILD)
+        shared = container.make(Shared)
+        unsafe = container.make(Unsafe)
+
+        container.after_fork_in_child()
+
+        assert container.make(Shared) is shared
+        assert container.make(Unsafe) is not unsafe
+        assert container.make(Container) is container
+
+    @pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires os.register_at_fork")
+    def test_fork_rebuilds_unsafe_singletons_in_child(self):
+        class Shared:
+            pass
+
+        class Unsafe:
+            pass
+
+        container = Container()
+        container.bind(Shared, Shared, SINGLETON)
+        container.bind(Unsafe, Unsafe, SINGLETON, fork_policy=REBUILD_IN_CHILD)
+        shared = container.make(Shared)
+        unsafe = container.make(Unsafe)
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            try:
+                result = container.make(Shared) is shared and container.make(Unsafe) is not unsafe
+                os.write(write_fd, b"1" if result else b"0")
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        assert os.read(read_fd, 1) == b"1"
+        os.close(read_fd)
+        assert container.make(Unsafe) is unsafe
+
+
+class TestContainerThreadLocal:
+    def test_one_instance_per_thread(self):
+        class Tokenizer:
+            pass
+
+        container = Container()
+        container.bind(Tokenizer, Tokenizer, THREAD_LOCAL)
+        results = []
+
+        def worker():
+            results.append((container.make(Tokenizer), container.make(Tokenizer)))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        (a1, a2), (b1, b2) = results
+        assert a1 is a2
+        assert b1 is b2
+        assert a1 is not b1
+        assert container.make(Tokenizer) not in (a1, b1)
+
+    def test_instances_are_released_when_their_thread_dies(self):
+        class Tokenizer:
+            pass
+
+        container = Container()
+        container.bind(Tokenizer, Tokenizer, THREAD_LOCAL)
+        refs = []
+        thread = threading.Thread(
+            target=lambda: refs.append(weakref.ref(container.make(Tokenizer)))
+        )
+        thread.start()
+        thread.join()
+        gc.collect()
+        assert refs[0]() is None
+
+    def test_close_releases_instances(self):
+        class Tokenizer:
+            pass
+
+        container = Container()
+        container.bind(Tokenizer, Tokenizer, THREAD_LOCAL)
+        first = container.make(Tokenizer)
+        container.close()
+        assert container.make(Tokenizer) is not first
+
+
+class RecordingObserver(ResolutionObserver):
+    def __init__(self):
+        self.events = []
+
+    def resolution_started(self, binding, cache_hit):
+        self.events.append(("started", binding.concrete, cache_hit))
+
+    def resolution_finished(self, binding, instance):
+        self.events.append(("finished", binding.concrete))
+
+    def resolution_failed(self, binding, error):
+        self.events.append(("failed", binding.concrete))
+
+
+class TestContainerObservers:
+    def test_observers_see_nested_resolutions_and_cache_hits(self):
+        class X:
+            pass
+
+        class Y:
+            def __init__(self, x: X):
+                self.x = x
+
+        container = Container()
+        container.bind(X, X, SINGLETON)
+        observer = RecordingObserver()
+        container.add_observer(observer)
+        container.make(Y)
+        container.make(X)
+
+        assert observer.events == [
+            ("started", Y, False),
+            ("started", X, False),
+            ("finished", X),
+            ("finished", Y),
+            ("started", X, True),
+            ("finished", X),
+        ]
+
+    def test_observers_see_failures(self):
+        class X:
+            def __init__(self):
+                raise ValueError()
+
+        container = Container()
+        observer = RecordingObserver()
+        container.add_observer(observer)
+        with pytest.raises(ValueError):
+            container.make(X)
+
+        assert observer.events == [("started", X, False), ("failed", X)]
+
+    def test_remove_observer(self):
+        class X:
+            pass
+
+        container = Container()
+        observer = RecordingObserver()
+        container.add_observer(observer)
+        container.remove_observer(observer)
+        container.make(X)
+
+        assert observer.events == []
+
+
+class Clock:
+    pass
+
+
+class FakeClock(Clock):
+    pass
+
+
+class Scheduler:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+class Dashboard:
+    scheduler: Scheduler
+
+
+class Mailer:
+    pass
+
+
+class TestContainerOverride:
+    def make_container(self):
+        container = Container()
+        for cls in (Clock, Scheduler, Dashboard, Mailer):
+            container.bind(cls, cls, SINGLETON)
+        return container
+
+    def test_evicts_and_restores_dependent_singletons(self):
+        container = self.make_container()
+        clock = container.make(Clock)
+        dashboard = container.make(Dashboard)
+        mailer = container.make(Mailer)
+
+        with container.override(Clock, FakeClock):
+            overridden = container.make(Dashboard)
+            assert overridden is not dashboard
+            assert isinstance(overridden.scheduler.clock, FakeClock)
+            assert container.make(Dashboard) is overridden
+            # Singletons which don't depend on the clock are kept.
+            assert container.make(Mailer) is mailer
+
+        assert container.make(Clock) is clock
+        assert container.make(Dashboard) is dashboard
+        assert dashboard.scheduler.clock is clock
+
+    def test_singletons_built_during_the_override_are_dropped(self):
+        container = self.make_container()
+        with container.override(Clock, FakeClock, SINGLETON):
+            fake = container.make(Clock)
+            scheduler = container.make(Scheduler)
+            assert scheduler.clock is fake
+
+        assert type(container.make(Scheduler).clock) is Clock
+        with container.override(Clock, FakeClock, SINGLETON):
+            assert container.make(Clock) is not fake
+
+    def test_unbound_abstract_and_exceptions(self):
+        container = self.make_container()
+        with pytest.raises(ValueError):
+            with container.override(FakeClock, lambda: FakeClock()):
+                assert container.make(FakeClock) is not container.make(FakeClock)
+                raise ValueError()
+        assert container.bindings.resolve_binding(FakeClock).kind == "auto"
+
+    def test_nested_overrides(self):
+        container = self.make_container()
+        dashboard = container.make(Dashboard)
+        with container.override(Clock, FakeClock):
+            with container.override(Scheduler, lambda: Scheduler(Clock())):
+                assert type(container.make(Dashboard).scheduler.clock) is Clock
+            assert type(container.make(Dashboard).scheduler.clock) is FakeClock
+        assert container.make(Dashboard) is dashboard
@@ -0,0 +1,142 @@
+import json
+
+from touchstone.container import SINGLETON, Container
+from touchstone.graph import build_graph
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Repository:
+    def __init__(self, db: Database, table: str = "things"):
+        self.db = db
+        self.table = table
+
+
+class Cache:
+    pass
+
+
+class Service:
+    cache: Cache
+
+    def __init__(self, users: Repository, groups: Repository):
+        self.users = users
+        self.groups = groups
+
+
+def node_by_label(graph, label):
+    (node,) = [node for node in graph.nodes.values() if node.label.endswith(label)]
+    return node
+
+
+def edge_names(graph, parent):
+    return sorted(edge.name for edge in graph.edges if edge.parent == parent.id)
+
+
+class TestBuildGraph:
+    def test_static_graph(self):
+        container = Container()
+        container.bind(Config, Config, SINGLETON)
+        graph = build_graph(container, Service)
+
+        service = graph.nodes[graph.root]
+        assert service.label.endswith("Service")
+        assert edge_names(graph, service) == ["cache", "groups", "users"]
+
+        repository = node_by_label(graph, "Repository")
+        assert repository.dependents == 2
+        assert repository.builds == 2
+        assert repository.lifetime == "new_every_time"
+        assert edge_names(graph, repository) == ["db", "table"]
+
+        config = node_by_label(graph, "Config")
+        assert config.kind == "simple"
+        assert config.lifetime == SINGLETON
+        assert config.builds == 1
+
+        assert node_by_label(graph, "Database").builds == 2
+        assert node_by_label(graph, "default 'things'").kind == "default"
+        assert all(node.self_time is None for node in graph.nodes.values())
+
+    def test_static_graph_does_not_instantiate(self):
+        built = []
+
+        class Root:
+            def __init__(self, config: Config):
+                built.append(self)
+
+        build_graph(Container(), Root)
+        assert built == []
+
+    def test_contextual_edges(self):
+        container = Container()
+        container.bind_contextual(when=Repository, wants=str, wants_name="table", give=lambda: "t")
+        graph = build_graph(container, Repository)
+
+        (edge,) = [edge for edge in graph.edges if edge.name == "table"]
+        assert edge.kind == "contextual"
+
+    def test_timed_graph(self):
+        container = Container()
+        graph = build_graph(container, Service, instantiate=True)
+
+        assert graph.timed
+        database = node_by_label(graph, "Database")
+        assert database.builds == 2
+        assert database.self_time > 0
+        assert database.total_time >= database.self_time
+        assert node_by_label(graph, "Service").total_time >= database.total_time
+
+    def test_critical_path_and_most_shared(self):
+        graph = build_graph(Container(), Service)
+        labels = [graph.nodes[node_id].label for node_id in graph.critical_path()]
+        assert [label.rsplit(".", 1)[-1] for label in labels] == [
+            "Service",
+            "Repository",
+            "Database",
+            "Config",
+        ]
+        assert graph.most_shared() == [node_by_label(graph, "Repository").id]
+
+    def test_unresolvable_dependencies_are_reported(self):
+        class Root:
+            def __init__(self, name: str):
+                self.name = name
+
+        graph = build_graph(Container(), Root)
+        assert len(graph.errors) == 1
+        assert "name" in graph.errors[0]
+
+    def test_cycles_are_reported(self):
+        class A:
+            def __init__(self, b: "B"):  # noqa: F821
+                pass
+
+        class B:
+            def __init__(self, a: A):
+                pass
+
+        container = Container()
+        container.bind("B", B)
+        graph = build_graph(container, A)
+        assert [edge.cycle for edge in graph.edges] == [True, False]
+
+    def test_exports(self):
+        graph = build_graph(Container(), Service, instantiate=True)
+
+        data = json.loads(graph.to_json())
+        assert data["root"] == graph.root
+        assert len(data["nodes"]) == len(graph.nodes)
+        assert data["critical_path"] == graph.critical_path()
+
+        dot = graph.to_dot()
+        assert dot.startswith("digraph dependencies {")
+        assert f'"{graph.root}" -> ' in dot
+        assert "color=red" in dot
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict
+
+# Upper bound for the time spent executing touchstone's own modules when importing the package and
+# touching `Container`, relative to the time spent executing the stdlib modules it brings in. The
+# ratio is about 0.08; comparing with the stdlib keeps the test independent of the machine's speed.
+IMPORT_BUDGET_RATIO = 0.2
+
+
+def import_times(code: str, pycache: str = "") -> Dict[str, int]:
+    """
+    Run `code` in a fresh interpreter with `-X importtime` and return the self time, in
+    microseconds, of every module it imported. Bytecode is written to and read from `pycache`, if
+    given.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    if pycache:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = pycache
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.partition(":")[2].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+class TestImport:
+    def test_import_does_not_load_the_container(self):
+        modules = import_times("import touchstone")
+        assert "touchstone" in modules
+        assert "touchstone.container" not in modules
+
+    def test_container_is_loaded_on_first_use(self):
+        modules = import_times("import touchstone; touchstone.Container")
+        assert "touchstone.container" in modules
+
+    def test_import_does_not_load_integrations(self):
+        modules = import_times("import touchstone; touchstone.Container")
+        for name in modules:
+            assert not name.startswith(("django", "celery", "rest_framework", "touchstone.django"))
+
+    def test_import_cost_is_bounded(self):
+        code = "import touchstone; touchstone.Container"
+        startup = import_times("pass")
+        with tempfile.TemporaryDirectory() as pycache:
+            # The first run compiles touchstone's modules, as an installed package would be.
+            import_times(code, pycache)
+            modules = import_times(code, pycache)
+        own_time = sum(t for name, t in modules.items() if name.split(".")[0] == "touchstone")
+        stdlib_time = sum(
+            t
+            for name, t in modules.items()
+            if name.split(".")[0] != "touchstone" and name not in startup
+        )
+        assert own_time < IMPORT_BUDGET_RATIO * stdlib_time
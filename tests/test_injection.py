@@ -0,0 +1,120 @@
+import asyncio
+import inspect
+import sys
+
+import pytest
+from touchstone.bindings import AnnotationHint
+from touchstone.container import SINGLETON, Container
+from touchstone.exceptions import ResolutionError
+from touchstone.injection import InjectionPlan
+
+
+class Repository:
+    pass
+
+
+class Mailer:
+    pass
+
+
+class TestInjectionPlan:
+    def test_plan(self):
+        def func(a, b: Mailer, *args: int, d: Repository, e: str = "e", **kw):
+            pass
+
+        plan = InjectionPlan(func)
+        assert plan.injected == (
+            ("b", 1, AnnotationHint(Mailer, inspect.Parameter.empty)),
+            ("d", sys.maxsize, AnnotationHint(Repository, inspect.Parameter.empty)),
+            ("e", sys.maxsize, AnnotationHint(str, "e")),
+        )
+
+
+class TestContainerInject:
+    def test_inject_resolves_missing_parameters(self):
+        container = Container()
+        container.bind(Repository, Repository, SINGLETON)
+
+        @container.inject
+        def handle(order_id: int, repository: Repository, mailer: Mailer):
+            return order_id, repository, mailer
+
+        order_id, repository, mailer = handle(1)
+        assert order_id == 1
+        assert repository is container.make(Repository)
+        assert isinstance(mailer, Mailer)
+
+    def test_explicit_arguments_are_passed_through(self):
+        container = Container()
+        mailer = Mailer()
+
+        @container.inject
+        def handle(order_id, repository: Repository, mailer: Mailer):
+            return order_id, repository, mailer
+
+        repository = Repository()
+        assert handle(1, repository, mailer) == (1, repository, mailer)
+        assert handle(1, mailer=mailer)[2] is mailer
+        assert handle(order_id=1, repository=repository)[1] is repository
+
+    def test_defaults_and_contextual_bindings(self):
+        container = Container()
+
+        def handle(repository: Repository, retries: int = 3, sender: str = "noreply"):
+            return repository, retries, sender
+
+        container.bind_contextual(
+            when=handle, wants=str, wants_name="sender", give=lambda: "orders"
+        )
+        handle = container.inject(handle)
+
+        assert handle()[1:] == (3, "orders")
+        assert handle(retries=5)[1] == 5
+
+    def test_unannotated_parameters_are_left_to_the_caller(self):
+        container = Container()
+
+        @container.inject
+        def handle(order_id, repository: Repository):
+            pass
+
+        with pytest.raises(TypeError):
+            handle()
+
+    def test_unresolvable_parameters(self):
+        container = Container()
+
+        @container.inject
+        def handle(count: int):
+            pass
+
+        with pytest.raises(ResolutionError):
+            handle()
+
+    def test_signature_is_preserved(self):
+        container = Container()
+
+        def handle(order_id: int, repository: Repository) -> None:
+            """Handles an order."""
+
+        wrapped = container.inject(handle)
+        assert wrapped.__doc__ == "Handles an order."
+        assert inspect.signature(wrapped) == inspect.signature(handle)
+
+    def test_inject_coroutine_function(self):
+        async def connect():
+            yield Repository()
+
+        container = Container()
+        container.bind(Repository, connect)
+
+        @container.inject
+        async def handle(order_id: int, repository: Repository):
+            return order_id, repository
+
+        async def main():
+            async with container.scope():
+                return await handle(1)
+
+        order_id, repository = asyncio.run(main())
+        assert isinstance(repository, Repository)
@@ -0,0 +1,182 @@
+import threading
+import time
+
+import pytest
+from touchstone.container import SCOPED, SINGLETON, Container
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.lifetimes import (
+    MISSING,
+    LifetimeStrategy,
+    SingletonLifetime,
+    _registry,
+    register_lifetime_strategy,
+)
+
+
+class Settings:
+    pass
+
+
+class Service:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class PerTenantLifetime(LifetimeStrategy):
+    tenant = "a"
+
+    def __init__(self, container):
+        super().__init__(container)
+        self.instances = {}
+        self.abandoned = 0
+
+    def lookup(self, binding):
+        return self.instances.get((self.tenant, binding), MISSING)
+
+    def store(self, binding, instance):
+        self.instances[(self.tenant, binding)] = instance
+
+    def abandon(self, binding):
+        self.abandoned += 1
+
+    def clear(self):
+        self.instances.clear()
+
+
+@pytest.fixture
+def per_tenant():
+    register_lifetime_strategy("per_tenant", PerTenantLifetime)
+    yield "per_tenant"
+    del _registry["per_tenant"]
+
+
+class TestLifetimeStrategies:
+    def test_custom_lifetime_strategy(self, per_tenant):
+        container = Container()
+        container.bind(Settings, Settings, per_tenant)
+        lifetime = container.get_lifetime(per_tenant)
+        assert isinstance(lifetime, PerTenantLifetime)
+        assert lifetime.container is container
+
+        first = container.make(Service).settings
+        assert container.make(Service).settings is first
+        lifetime.tenant = "b"
+        assert container.make(Settings) is not first
+
+        container.close()
+        assert lifetime.instances == {}
+
+    def test_abandon_is_called_when_building_fails(self, per_tenant):
+        def broken():
+            raise ValueError("broken")
+
+        container = Container()
+        container.bind(Settings, broken, per_tenant)
+        with pytest.raises(ValueError):
+            container.make(Settings)
+        assert container.get_lifetime(per_tenant).abandoned == 1
+
+    def test_unknown_lifetime_strategy(self):
+        container = Container()
+        with pytest.raises(BindingError, match="Unknown lifetime strategy: forever"):
+            container.bind(Settings, Settings, "forever")
+        with pytest.raises(BindingError, match="Unknown lifetime strategy: forever"):
+            container.bind_contextual(when=Service, give=Settings, lifetime_strategy="forever")
+
+    def test_strategies_are_instantiated_once_per_container(self):
+        first, second = Container(), Container()
+        assert isinstance(first.get_lifetime(SINGLETON), SingletonLifetime)
+        assert first.get_lifetime(SINGLETON) is first.get_lifetime(SINGLETON)
+        assert first.get_lifetime(SINGLETON) is not second.get_lifetime(SINGLETON)
+
+    def test_builtin_strategies_report_cached_instances(self):
+        container = Container()
+        container.bind(Settings, Settings, SINGLETON)
+        lifetime = container.get_lifetime(SINGLETON)
+        binding = container.bindings.resolve_binding(Settings)
+        assert not lifetime.contains(binding)
+        container.make(Settings)
+        assert lifetime.contains(binding)
+
+
+class TestSingletonLifetime:
+    def test_concurrent_first_resolutions_build_once(self):
+        built = []
+
+        def settings():
+            built.append(threading.get_ident())
+            time.sleep(0.01)
+            return Settings()
+
+        container = Container()
+        container.bind(Settings, settings, SINGLETON)
+        barrier = threading.Barrier(8)
+        instances = []
+
+        def resolve():
+            barrier.wait()
+            instances.append(container.make(Service).settings)
+
+        threads = [threading.Thread(target=resolve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(built) == 1
+        assert len(instances) == 8 and all(instance is instances[0] for instance in instances)
+
+    def test_lock_is_released_when_building_fails(self):
+        attempts = []
+
+        def settings():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("broken")
+            return Settings()
+
+        container = Container()
+        container.bind(Settings, settings, SINGLETON)
+        with pytest.raises(ValueError):
+            container.make(Settings)
+
+        # Another thread would wait forever for a lock left held.
+        result = []
+        thread = threading.Thread(target=lambda: result.append(container.make(Settings)))
+        thread.start()
+        thread.join(timeout=5)
+        assert isinstance(result[0], Settings)
+        assert container.make(Settings) is result[0]
+
+
+class TestScopedLifetime:
+    def test_one_instance_per_scope(self):
+        container = Container()
+        container.bind(Settings, Settings, SCOPED)
+
+        with container.scope():
+            first = container.make(Service).settings
+            assert container.make(Settings) is first
+            with container.scope():
+                assert container.make(Settings) is not first
+        with container.scope():
+            assert container.make(Settings) is not first
+
+    def test_scoped_requires_a_scope(self):
+        container = Container()
+        container.bind(Settings, Settings, SCOPED)
+        with pytest.raises(ResolutionError, match="is scoped: resolve it inside a container scope"):
+            container.make(Settings)
+
+    def test_scoped_resources_are_torn_down_with_the_scope(self):
+        events = []
+
+        def settings():
+            yield Settings()
+            events.append("close")
+
+        container = Container()
+        container.bind(Settings, settings, SCOPED)
+        with container.scope():
+            container.make(Settings)
+            container.make(Settings)
+        assert events == ["close"]
@@ -0,0 +1,78 @@
+import tracemalloc
+
+import pytest
+from touchstone import SINGLETON, Container
+from touchstone.memory import SingletonMemory
+
+MIB = 1024 * 1024
+
+
+class Cache:
+    def __init__(self) -> None:
+        self.buffer = bytearray(MIB)
+
+
+class Client:
+    def __init__(self, cache: Cache) -> None:
+        self.cache = cache
+        self.buffer = bytearray(MIB // 4)
+
+
+class Handler:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+def make_container():
+    container = Container()
+    container.bind(Cache, Cache, SINGLETON)
+    container.bind(Client, Client, SINGLETON)
+    return container
+
+
+@pytest.fixture(params=[True, False], ids=["tracemalloc", "deep_size"])
+def use_tracemalloc(request):
+    return request.param
+
+
+class TestSingletonMemory:
+    def test_sizes_sorted_by_bytes(self, use_tracemalloc):
+        container = make_container()
+        with SingletonMemory(container, use_tracemalloc) as accounting:
+            container.make(Handler)
+            container.make(Handler)
+
+        cache, client = accounting.table()
+        assert cache.abstract == f"{__name__}.Cache"
+        assert client.abstract == f"{__name__}.Client"
+        method = "tracemalloc" if use_tracemalloc else "deep_size"
+        assert cache.method == client.method == method
+        # The cache isn't counted again in the client holding it.
+        assert MIB <= cache.size < MIB * 1.1
+        assert MIB // 4 <= client.size < MIB // 2
+
+        table = accounting.format_table()
+        assert table.splitlines()[1].endswith(f"{__name__}.Cache -> {__name__}.Cache")
+        assert table.endswith("total of 2 singletons\n")
+
+    def test_bound_instances_use_deep_size(self):
+        container = Container()
+        with SingletonMemory(container) as accounting:
+            container.bind_instance(Cache, Cache())
+            container.make(Cache)
+
+        (cache,) = accounting.table()
+        assert (cache.concrete, cache.method) == (f"instance of {__name__}.Cache", "deep_size")
+        assert cache.size >= MIB
+
+    def test_stop(self):
+        container = make_container()
+        assert not tracemalloc.is_tracing()
+        accounting = SingletonMemory(container)
+        accounting.start()
+        assert tracemalloc.is_tracing()
+        accounting.stop()
+        assert not tracemalloc.is_tracing()
+        assert container._observers == ()
+        container.make(Cache)
+        assert accounting.table() == []
@@ -0,0 +1,142 @@
+import asyncio
+import gc
+import json
+import threading
+import weakref
+
+from touchstone import SINGLETON, Container
+from touchstone.lifetimes import SingletonLifetime
+from touchstone.metrics import CountingSingletonLifetime
+
+
+class Settings:
+    pass
+
+
+class Service:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class TestResolutionMetrics:
+    def test_counts(self):
+        container = Container()
+        container.bind(Settings, Settings, SINGLETON)
+        metrics = container.enable_metrics()
+        assert container.enable_metrics() is metrics
+
+        for _ in range(3):
+            container.make(Service)
+        container.make(Settings)
+
+        data = metrics.to_dict()
+        assert data["makes"] == {f"{__name__}.Service": 3, f"{__name__}.Settings": 1}
+        assert (data["singleton_hits"], data["singleton_misses"]) == (3, 1)
+        assert data["plan_compilations"]["signature"] == 2
+        assert data["live_singletons"] == 1
+        latency = data["latency"][f"{__name__}.Service"]
+        assert latency["count"] == 3
+        assert sum(latency["buckets"].values()) == 3
+        assert latency["sum"] > 0
+        assert json.loads(metrics.to_json()) == json.loads(json.dumps(data))
+
+    def test_counters_are_merged_across_threads(self):
+        container = Container()
+        metrics = container.enable_metrics()
+
+        def work():
+            for _ in range(100):
+                container.make(Settings)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        container.make(Settings)
+        assert metrics.to_dict()["makes"] == {f"{__name__}.Settings": 401}
+
+        metrics.reset()
+        assert metrics.to_dict()["makes"] == {}
+        container.make(Settings)
+        assert metrics.to_dict()["makes"] == {f"{__name__}.Settings": 1}
+
+    def test_amake_is_recorded(self):
+        async def connect() -> Settings:
+            return Settings()
+
+        container = Container()
+        container.bind(Settings, connect)
+        metrics = container.enable_metrics()
+        asyncio.run(container.amake(Settings))
+        assert metrics.to_dict()["makes"] == {f"{__name__}.Settings": 1}
+
+    def test_failed_resolutions_are_recorded(self):
+        def broken() -> Settings:
+            raise ValueError("broken")
+
+        container = Container()
+        container.bind(Settings, broken)
+        metrics = container.enable_metrics()
+        try:
+            container.make(Settings)
+        except ValueError:
+            pass
+        assert metrics.to_dict()["makes"] == {f"{__name__}.Settings": 1}
+
+    def test_abstracts_are_not_kept_alive(self):
+        container = Container()
+        metrics = container.enable_metrics()
+
+        def make_local():
+            class Local:
+                pass
+
+            container.make(Local)
+            return weakref.ref(Local)
+
+        locals_ = [make_local() for _ in range(3)]
+        gc.collect()
+        assert [local() for local in locals_] == [None] * 3
+        label = f"{__name__}.TestResolutionMetrics.test_abstracts_are_not_kept_alive.<locals>"
+        assert metrics.to_dict()["makes"] == {f"{label}.make_local.<locals>.Local": 3}
+
+    def test_abstracts_without_weak_references(self):
+        container = Container()
+        container.bind("settings", Settings)
+        metrics = container.enable_metrics()
+        container.make("settings")
+        container.make("settings")
+        assert metrics.to_dict()["makes"] == {"'settings'": 2}
+
+    def test_to_prometheus(self):
+        container = Container()
+        container.bind(Settings, Settings, SINGLETON)
+        metrics = container.enable_metrics()
+        container.make(Service)
+
+        text = metrics.to_prometheus()
+        assert "# TYPE touchstone_makes_total counter\n" in text
+        assert f'touchstone_makes_total{{abstract="{__name__}.Service"}} 1\n' in text
+        assert 'touchstone_singleton_cache_total{result="miss"} 1\n' in text
+        assert "# TYPE touchstone_make_duration_seconds histogram\n" in text
+        assert (
+            f'touchstone_make_duration_seconds_bucket{{abstract="{__name__}.Service",le="+Inf"}} 1\n'
+            in text
+        )
+        assert (
+            f'touchstone_make_duration_seconds_count{{abstract="{__name__}.Service"}} 1\n' in text
+        )
+        assert text.endswith("touchstone_live_singletons 1\n")
+
+    def test_disable_metrics_keeps_singletons(self):
+        container = Container()
+        container.bind(Settings, Settings, SINGLETON)
+        container.enable_metrics()
+        assert isinstance(container.get_lifetime(SINGLETON), CountingSingletonLifetime)
+        settings = container.make(Settings)
+
+        container.disable_metrics()
+        assert container.metrics is None
+        assert type(container.get_lifetime(SINGLETON)) is SingletonLifetime
+        assert container.make(Settings) is settings
@@ -0,0 +1,206 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from touchstone.container import POOLED, Container
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.pools import BLOCK, EMPTY, OVERFLOW, WOULD_BLOCK, InstancePool
+
+
+class Tokenizer:
+    pass
+
+
+class Parser:
+    def __init__(self, tokenizer: Tokenizer) -> None:
+        self.tokenizer = tokenizer
+
+
+class TestInstancePool:
+    def test_acquire_and_release(self):
+        pool = InstancePool(max_size=2)
+        assert pool.acquire() is EMPTY
+        pool.release("a")
+        assert pool.acquire() == "a"
+        stats = pool.stats()
+        assert (stats.size, stats.idle, stats.in_use, stats.checkouts) == (1, 0, 1, 2)
+
+    def test_blocking_acquire_times_out(self):
+        pool = InstancePool(max_size=1, when_empty=BLOCK, timeout=0.01)
+        assert pool.acquire() is EMPTY
+        assert pool.acquire(wait=False) is WOULD_BLOCK
+        with pytest.raises(ResolutionError, match="within 0.01s"):
+            pool.acquire()
+        stats = pool.stats()
+        assert (stats.waits, stats.timeouts) == (1, 1)
+        assert stats.wait_time >= 0.01
+
+    def test_blocking_acquire_waits_for_release(self):
+        pool = InstancePool(max_size=1)
+        assert pool.acquire() is EMPTY
+
+        def release():
+            time.sleep(0.01)
+            pool.release("a")
+
+        thread = threading.Thread(target=release)
+        thread.start()
+        assert pool.acquire() == "a"
+        thread.join()
+        assert pool.stats().max_wait_time > 0
+
+    def test_overflow_instances_are_discarded(self):
+        pool = InstancePool(max_size=1, when_empty=OVERFLOW)
+        assert pool.acquire() is EMPTY
+        assert pool.acquire() is EMPTY
+        assert pool.stats().size == 2
+        pool.release("a")
+        pool.release("b")
+        stats = pool.stats()
+        assert (stats.size, stats.idle, stats.overflows) == (1, 1, 1)
+
+    def test_cancel_gives_back_room(self):
+        pool = InstancePool(max_size=1)
+        assert pool.acquire() is EMPTY
+        pool.cancel()
+        assert pool.acquire(wait=False) is EMPTY
+
+    def test_invalid_configuration(self):
+        with pytest.raises(BindingError):
+            InstancePool(max_size=0)
+        with pytest.raises(BindingError):
+            InstancePool(when_empty="drop")
+
+
+class TestPooledLifetime:
+    def test_instances_are_returned_when_the_scope_closes(self):
+        container = Container()
+        container.bind(Parser, Parser, POOLED, pool=InstancePool(max_size=2))
+
+        with container.scope():
+            first = container.make(Parser)
+            second = container.make(Parser)
+            assert first is not second
+            assert container.get_pool(Parser).stats().in_use == 2
+        with container.scope():
+            # Reused as is: dependencies aren't resolved again.
+            reused = container.make(Parser)
+            assert reused in (first, second)
+            assert reused.tokenizer in (first.tokenizer, second.tokenizer)
+
+        stats = container.get_pool(Parser).stats()
+        assert (stats.size, stats.idle, stats.checkouts) == (2, 2, 3)
+
+    def test_default_pool(self):
+        container = Container()
+        container.bind(Parser, Parser, POOLED)
+        with container.scope():
+            container.make(Parser)
+        assert container.get_pool(Parser).stats().max_size == 10
+
+    def test_pooled_requires_a_scope(self):
+        container = Container()
+        container.bind(Parser, Parser, POOLED)
+        with pytest.raises(ResolutionError, match="scope"):
+            container.make(Parser)
+
+    def test_pool_requires_pooled_lifetime(self):
+        container = Container()
+        with pytest.raises(BindingError):
+            container.bind(Parser, Parser, pool=InstancePool())
+        container.bind(Parser, Parser)
+        with pytest.raises(ResolutionError):
+            container.get_pool(Parser)
+
+    def test_failed_build_gives_back_room(self):
+        def broken():
+            raise ValueError("broken")
+
+        container = Container()
+        container.bind(Parser, broken, POOLED, pool=InstancePool(max_size=1, timeout=0))
+        with container.scope():
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    container.make(Parser)
+
+    def test_pooled_resources_are_torn_down_by_the_container(self):
+        events = []
+
+        def tokenizer():
+            events.append("open")
+            yield Tokenizer()
+            events.append("close")
+
+        container = Container()
+        container.bind(Tokenizer, tokenizer, POOLED)
+        with container.scope():
+            container.make(Tokenizer)
+        with container.scope():
+            container.make(Tokenizer)
+        assert events == ["open"]
+
+        container.close()
+        assert events == ["open", "close"]
+        assert container.get_pool(Tokenizer).stats().size == 0
+
+    def test_amake_waits_without_blocking_the_loop(self):
+        pool = InstancePool(max_size=1)
+        container = Container()
+        container.bind(Parser, Parser, POOLED, pool=pool)
+
+        async def request(delay):
+            async with container.scope():
+                parser = await container.amake(Parser)
+                await asyncio.sleep(delay)
+                return parser
+
+        async def main():
+            return await asyncio.gather(request(0.01), request(0))
+
+        first, second = asyncio.run(main())
+        assert first is second
+        assert pool.stats().waits == 1
+
+    def test_cancelled_amake_leaves_the_pool_alone(self):
+        pool = InstancePool(max_size=1, timeout=1)
+        container = Container()
+        container.bind(Parser, Parser, POOLED, pool=pool)
+
+        async def request():
+            async with container.scope():
+                return await container.amake(Parser)
+
+        async def main():
+            async with container.scope():
+                parser = await container.amake(Parser)
+                waiting = asyncio.ensure_future(request())
+                await asyncio.sleep(0.01)
+                waiting.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await waiting
+            assert pool.stats().in_use == 0
+            assert await request() is parser
+
+        asyncio.run(main())
+        stats = pool.stats()
+        assert (stats.size, stats.in_use, stats.waits) == (1, 0, 1)
+
+    def test_aacquire_times_out(self):
+        pool = InstancePool(max_size=1, timeout=0.01)
+        assert pool.acquire() is EMPTY
+        with pytest.raises(ResolutionError, match="within 0.01s"):
+            asyncio.run(pool.aacquire())
+        stats = pool.stats()
+        assert (stats.waits, stats.timeouts) == (1, 1)
+
+    def test_aacquire_is_woken_by_other_threads(self):
+        pool = InstancePool(max_size=1, timeout=5)
+        assert pool.acquire() is EMPTY
+        timer = threading.Timer(0.01, pool.release, ("a",))
+
+        async def main():
+            timer.start()
+            return await pool.aacquire()
+
+        assert asyncio.run(main()) == "a"
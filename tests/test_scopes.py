@@ -0,0 +1,311 @@
+import asyncio
+import contextlib
+import threading
+
+import pytest
+from touchstone.bindings import Managed
+from touchstone.container import SINGLETON, Container
+from touchstone.exceptions import ResolutionError
+
+
+class Connection:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.closed = False
+
+
+class Repository:
+    def __init__(self, conn: Connection) -> None:
+        self.conn = conn
+
+
+class Service:
+    def __init__(self, repo: Repository, conn: Connection) -> None:
+        self.repo = repo
+        self.conn = conn
+
+
+def make_container(events):
+    def connect():
+        conn = Connection("db")
+        events.append("open")
+        try:
+            yield conn
+        finally:
+            conn.closed = True
+            events.append("close")
+
+    def repository(conn: Connection):
+        events.append("open repo")
+        yield Repository(conn)
+        events.append("close repo")
+
+    container = Container()
+    container.bind(Connection, connect)
+    container.bind(Repository, repository)
+    return container
+
+
+class TestResources:
+    def test_generator_concrete_is_torn_down_with_its_scope(self):
+        events = []
+        container = make_container(events)
+
+        with container.scope():
+            repo = container.make(Repository)
+            assert isinstance(repo, Repository)
+            assert isinstance(repo.conn, Connection)
+            assert events == ["open", "open repo"]
+
+        assert events == ["open", "open repo", "close repo", "close"]
+        assert repo.conn.closed
+
+    def test_teardown_runs_in_reverse_order_of_construction(self):
+        events = []
+        container = make_container(events)
+
+        with container.scope():
+            service = container.make(Service)
+
+        assert service.repo.conn is not service.conn
+        assert events == ["open", "open repo", "open", "close", "close repo", "close"]
+
+    def test_resources_require_a_scope(self):
+        events = []
+        container = make_container(events)
+
+        for _ in range(2):
+            with pytest.raises(ResolutionError, match="inside a container scope"):
+                container.make(Connection)
+        assert events == []
+
+        container.close()
+        assert events == []
+
+    def test_async_resources_require_a_scope(self):
+        async def connect():
+            yield Connection("db")
+
+        container = Container()
+        container.bind(Connection, connect)
+        with pytest.raises(ResolutionError, match="inside a container scope"):
+            asyncio.run(container.amake(Connection))
+
+    def test_singleton_resources_belong_to_the_container(self):
+        events = []
+
+        def connect():
+            events.append("open")
+            yield Connection("db")
+            events.append("close")
+
+        container = Container()
+        container.bind(Connection, connect, SINGLETON)
+
+        with container.scope():
+            first = container.make(Connection)
+        with container.scope():
+            assert container.make(Connection) is first
+        assert events == ["open"]
+
+        container.close()
+        assert events == ["open", "close"]
+        assert container.make(Connection) is not first
+
+    def test_nested_scopes(self):
+        events = []
+        container = make_container(events)
+
+        with container.scope():
+            container.make(Connection)
+            with container.scope():
+                container.make(Connection)
+            assert events == ["open", "open", "close"]
+        assert events == ["open", "open", "close", "close"]
+
+    def test_exception_is_passed_to_teardown(self):
+        seen = []
+
+        def connect():
+            try:
+                yield Connection("db")
+            except ValueError as e:
+                seen.append(e)
+                raise
+
+        container = Container()
+        container.bind(Connection, connect)
+
+        with pytest.raises(ValueError):
+            with container.scope():
+                container.make(Connection)
+                raise ValueError("boom")
+        assert len(seen) == 1
+
+    def test_context_manager_concretes(self):
+        events = []
+
+        @contextlib.contextmanager
+        def connect():
+            events.append("enter")
+            yield Connection("decorated")
+            events.append("exit")
+
+        class Pool:
+            def __init__(self, name: str = "managed") -> None:
+                self.name = name
+
+            def __enter__(self):
+                events.append("enter pool")
+                return Connection(self.name)
+
+            def __exit__(self, *exc_info):
+                events.append("exit pool")
+
+        container = Container()
+        container.bind(Connection, connect)
+        container.bind("pooled", Managed(Pool))
+
+        with container.scope():
+            assert container.make(Connection).name == "decorated"
+            assert container.make("pooled").name == "managed"
+        assert events == ["enter", "enter pool", "exit pool", "exit"]
+
+    def test_scope_is_per_thread(self):
+        events = []
+        container = make_container(events)
+        conns = {}
+
+        def worker():
+            try:
+                container.make(Connection)
+            except ResolutionError as e:
+                conns["thread"] = e
+
+        with container.scope():
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        # The thread had no scope open.
+        assert isinstance(conns["thread"], ResolutionError)
+        assert events == []
+
+    def test_teardown_errors_dont_stop_other_teardowns(self):
+        events = []
+
+        def failing():
+            yield Repository(Connection("x"))
+            raise RuntimeError("teardown failed")
+
+        container = make_container(events)
+        container.bind(Repository, failing)
+
+        with pytest.raises(RuntimeError, match="teardown failed"):
+            with container.scope():
+                container.make(Connection)
+                container.make(Repository)
+        assert events == ["open", "close"]
+
+    def test_closed_scope_cant_be_reopened(self):
+        container = Container()
+        scope = container.scope()
+        with scope:
+            pass
+        with pytest.raises(ResolutionError):
+            scope.__enter__()
+
+    def test_make_refuses_async_concretes(self):
+        async def connect():
+            yield Connection("db")
+
+        async def factory():
+            return Connection("db")
+
+        container = Container()
+        container.bind(Connection, connect)
+        container.bind("conn", factory)
+        with container.scope():
+            with pytest.raises(ResolutionError, match="amake"):
+                container.make(Connection)
+            with pytest.raises(ResolutionError, match="amake"):
+                container.make("conn")
+
+
+class TestAsyncResources:
+    def test_amake_enters_async_generators(self):
+        events = []
+
+        async def connect():
+            events.append("open")
+            yield Connection("db")
+            events.append("close")
+
+        async def repository(conn: Connection):
+            return Repository(conn)
+
+        container = Container()
+        container.bind(Connection, connect)
+        container.bind(Repository, repository)
+
+        async def main():
+            async with container.scope():
+                repo = await container.amake(Repository)
+                assert isinstance(repo.conn, Connection)
+                assert events == ["open"]
+            assert events == ["open", "close"]
+
+        asyncio.run(main())
+
+    def test_amake_mixes_sync_and_async_resources_in_order(self):
+        events = []
+
+        async def connect():
+            events.append("open")
+            yield Connection("db")
+            events.append("close")
+
+        def repository(conn: Connection):
+            events.append("open repo")
+            yield Repository(conn)
+            events.append("close repo")
+
+        container = Container()
+        container.bind(Connection, connect, SINGLETON)
+        container.bind(Repository, repository)
+
+        async def main():
+            async with container.scope():
+                await container.amake(Service)
+            assert events == ["open", "open repo", "close repo"]
+            with pytest.raises(ResolutionError, match="aclose"):
+                container.close()
+            await container.aclose()
+            assert events == ["open", "open repo", "close repo", "close"]
+
+        asyncio.run(main())
+
+    def test_scopes_follow_tasks(self):
+        closed = []
+
+        async def connect():
+            conn = Connection("db")
+            yield conn
+            closed.append(conn)
+
+        container = Container()
+        container.bind(Connection, connect)
+
+        async def request():
+            async with container.scope():
+                conn = await container.amake(Connection)
+                await asyncio.sleep(0)
+                assert conn not in closed
+            assert conn in closed
+            return conn
+
+        async def main():
+            return await asyncio.gather(request(), request())
+
+        first, second = asyncio.run(main())
+        assert first is not second
+        assert len(closed) == 2
@@ -0,0 +1,120 @@
+import io
+import pickle
+from unittest.mock import patch
+
+import pytest
+from touchstone.container import SINGLETON, Container
+from touchstone.exceptions import BindingError
+from touchstone.snapshot import load_snapshot, save_snapshot
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class PostgresDatabase(Database):
+    pass
+
+
+class Repository:
+    def __init__(self, db: Database, table: str = "things"):
+        self.db = db
+        self.table = table
+
+
+class Service:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+def make_config() -> Config:
+    config = Config()
+    config.debug = True
+    return config
+
+
+def table_name() -> str:
+    return "widgets"
+
+
+def snapshot(container, roots=()):
+    fp = io.BytesIO()
+    save_snapshot(container, fp, roots)
+    fp.seek(0)
+    return fp
+
+
+class TestSnapshot:
+    def test_round_trip(self):
+        container = Container()
+        container.bind(Database, PostgresDatabase, SINGLETON)
+        container.bind(Config, make_config)
+        container.bind_contextual(when=Repository, wants=str, wants_name="table", give=table_name)
+
+        restored = load_snapshot(snapshot(container))
+
+        service = restored.make(Service)
+        assert isinstance(service.repository.db, PostgresDatabase)
+        assert service.repository.db.config.debug is True
+        assert service.repository.table == "widgets"
+        assert restored.make(Database) is service.repository.db
+
+    def test_restored_container_binds_itself(self):
+        restored = load_snapshot(snapshot(Container()))
+        assert restored.make(Container) is restored
+
+    def test_restores_into_existing_container(self):
+        container = Container()
+        container.bind(Database, PostgresDatabase)
+
+        target = Container()
+        restored = load_snapshot(snapshot(container), target)
+        assert restored is target
+        assert isinstance(target.make(Database), PostgresDatabase)
+
+    def test_resolution_after_restore_does_not_introspect_signatures(self):
+        container = Container()
+        container.bind(Database, PostgresDatabase)
+        fp = snapshot(container, roots=[Service])
+
+        with patch("touchstone.bindings.inspect.signature") as mock_signature:
+            restored = load_snapshot(fp)
+            service = restored.make(Service)
+
+        assert isinstance(service.repository.db, PostgresDatabase)
+        mock_signature.assert_not_called()
+
+    def test_lambdas_cannot_be_snapshotted(self):
+        container = Container()
+        container.bind(Config, lambda: Config())
+
+        with pytest.raises(BindingError, match="importable by path"):
+            snapshot(container)
+
+    def test_instances_cannot_be_snapshotted(self):
+        container = Container()
+        container.bind_instance(Config, Config())
+
+        with pytest.raises(BindingError, match="Cannot snapshot instance"):
+            snapshot(container)
+
+    def test_local_classes_are_left_out_of_signatures(self):
+        class Local:
+            def __init__(self, config: Config):
+                self.config = config
+
+        container = Container()
+        container.make(Local)
+
+        restored = load_snapshot(snapshot(container))
+        assert isinstance(restored.make(Local).config, Config)
+
+    def test_incompatible_snapshot_raises(self):
+        fp = io.BytesIO(pickle.dumps({"version": -1}))
+        with pytest.raises(BindingError, match="incompatible"):
+            load_snapshot(fp)
@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from touchstone import spec as spec_module
+from touchstone.container import SINGLETON, Container
+from touchstone.exceptions import BindingError, ResolutionError
+from touchstone.spec import ContainerSpec, get_worker_container, init_worker
+
+
+class Config:
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+
+
+class Database:
+    def __init__(self, config: Config):
+        self.config = config
+        self.pid = os.getpid()
+
+
+class Service:
+    def __init__(self, db: Database):
+        self.db = db
+
+
+class Connection:
+    def __init__(self):
+        # Can't be pickled.
+        self.lock = threading.Lock()
+
+
+def connect() -> Connection:
+    return Connection()
+
+
+def make_container():
+    container = Container()
+    container.bind(Database, Database, SINGLETON)
+    container.bind_instance(Config, Config(debug=True))
+    container.bind_instance(Connection, connect())
+    return container
+
+
+def worker_task():
+    container = get_worker_container()
+    service = container.make(Service)
+    return service.db.pid, service.db.config.debug, type(container.make(Connection)).__name__
+
+
+@pytest.fixture
+def worker_container():
+    yield
+    spec_module._worker_container = None
+
+
+class TestContainerSpec:
+    def test_instances_are_shipped_by_value_or_built_per_process(self):
+        container = make_container()
+        spec = ContainerSpec.from_container(
+            container, roots=[Service], per_process={Connection: connect}
+        )
+
+        restored = pickle.loads(pickle.dumps(spec)).build()
+
+        assert restored.make(Config).debug is True
+        assert restored.make(Config) is restored.make(Config)
+        connection = restored.make(Connection)
+        assert connection is not container.make(Connection)
+        assert restored.make(Connection) is connection
+        assert restored.make(Container) is restored
+
+    def test_per_process_factories_can_be_dotted_paths(self):
+        spec = ContainerSpec.from_container(
+            make_container(), per_process={Connection: f"{__name__}.connect"}
+        )
+        assert isinstance(spec.build().make(Connection), Connection)
+
+    def test_per_process_factories_are_not_cached_in_the_container(self):
+        container = make_container()
+        ContainerSpec.from_container(container, per_process={Connection: connect})
+
+        assert connect not in container.bindings.dump_state()["signatures"]
+        assert isinstance(container.make(Connection), Connection)
+
+    def test_unpicklable_instances_must_be_marked_per_process(self):
+        with pytest.raises(BindingError, match="mark it per_process"):
+            ContainerSpec.from_container(make_container())
+
+    def test_lambdas_cannot_be_specced(self):
+        container = Container()
+        container.bind(Config, lambda: Config())
+        with pytest.raises(BindingError, match="importable by path"):
+            ContainerSpec.from_container(container)
+
+    def test_build_does_not_introspect_signatures(self):
+        spec = ContainerSpec.from_container(
+            make_container(), roots=[Service], per_process={Connection: connect}
+        )
+        with patch("touchstone.bindings.inspect.signature") as mock_signature:
+            container = spec.build()
+            container.make(Service)
+            container.make(Connection)
+        mock_signature.assert_not_called()
+
+    def test_resolve_implementations_is_kept(self):
+        spec = ContainerSpec.from_container(Container(resolve_implementations=True))
+        assert spec.build().bindings.implementations is not None
+
+    def test_incompatible_spec_raises(self):
+        with pytest.raises(BindingError, match="incompatible"):
+            ContainerSpec(pickle.dumps({"version": -1})).build()
+
+
+class TestWorkers:
+    def test_worker_container_requires_init_worker(self, worker_container):
+        with pytest.raises(ResolutionError, match="init_worker"):
+            get_worker_container()
+
+    def test_init_worker(self, worker_container):
+        spec = ContainerSpec.from_container(make_container(), per_process={Connection: connect})
+        init_worker(spec)
+        assert get_worker_container().make(Config).debug is True
+
+    def test_spawned_process_pool(self):
+        spec = ContainerSpec.from_container(
+            make_container(), roots=[Service], per_process={Connection: connect}
+        )
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(spec,),
+        ) as executor:
+            pid, debug, connection = executor.submit(worker_task).result(timeout=60)
+        assert pid != os.getpid()
+        assert debug is True
+        assert connection == "Connection"
@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+from touchstone.container import Container
+from touchstone.utils import describe, escape_label, import_string, is_bound_container, is_picklable
+
+
+class Service:
+    class Nested:
+        pass
+
+
+class TestDescribe:
+    def test_classes_and_functions(self):
+        assert describe(Service) == f"{__name__}.Service"
+        assert describe(Service.Nested) == f"{__name__}.Service.Nested"
+        assert describe(describe) == "touchstone.utils.describe"
+        assert describe(int) == "int"
+
+    def test_other_objects(self):
+        assert describe("name") == "'name'"
+        assert describe("x" * 100) == repr("x" * 100)[:80]
+
+
+def test_escape_label():
+    assert escape_label('a "b"\\c\nd') == 'a \\"b\\"\\\\c\\nd'
+
+
+def test_import_string():
+    assert import_string("touchstone.utils.describe") is describe
+    with pytest.raises(ImportError, match="not a dotted path"):
+        import_string("touchstone")
+    with pytest.raises(ImportError, match="has no attribute missing"):
+        import_string("touchstone.utils.missing")
+
+
+def test_is_picklable():
+    assert is_picklable((Service, {"debug": True}))
+    assert not is_picklable(lambda: None)
+    assert not is_picklable(threading.Lock())
+
+
+def test_is_bound_container():
+    container = Container()
+    assert is_bound_container(container.bindings.resolve_binding(Container), container)
+    assert not is_bound_container(container.bindings.resolve_binding(Container), Container())
+    assert not is_bound_container(container.bindings.resolve_binding(Service), container)